@@ -0,0 +1,274 @@
+# benchmarks/bench_large_guild.py
+"""큰 서버 확장성 벤치마크.
+
+1천~10만 명 규모의 합성 서버(한글/영문 닉네임, 일부 봇)를 만들고
+MentionShortcutCog.on_message의 메시지당 검색 지연, daily_study_reminder 계산 시간,
+멤버 색인 생성 시간과 tracemalloc 기준 최대 메모리를 잽니다.
+Discord 전송은 가짜 채널이 카운트만 합니다.
+
+    python -m benchmarks.bench_large_guild
+    python -m benchmarks.bench_large_guild --sizes 1000,10000 --save-baseline guild_baseline.json
+    python -m benchmarks.bench_large_guild --baseline guild_baseline.json
+"""
+import argparse
+import asyncio
+import gc
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from types import SimpleNamespace
+
+from benchmarks.fakes import FakeBot, FakeChannel, FakeGuild, FakeMember, FakeMessage
+from benchmarks.harness import Timer, add_report_arguments, finish_report, latency_summary
+
+from cogs import study_reminder
+from cogs.member_directory import MemberDirectoryCog
+from cogs.mention_shortcut import MentionShortcutCog
+from settings import build_settings
+from state_store import StateStore
+from time_utils import now_epoch
+
+GUILD_ID = 1
+VOICE_ID = 1000
+MENTION_ID = 4000
+CHAT_ID = 5000
+USER_ID_BASE = 300_000_000_000_000_000
+BOT_ID_BASE = 900_000_000_000_000_000
+DAY = 24 * 60 * 60
+
+SURNAMES = "김이박최정강조윤장임한오서신권황안송류홍"
+GIVEN_SYLLABLES = "민서지현수영준우진하은도연유재성예원윤아호혜경태주희나동석"
+KOREAN_NICKS = ("민둥", "이유", "뚱이", "코딩왕", "새벽공부", "감자", "고구마", "토끼", "공부중", "열공러", "햄찌", "짱구")
+ENGLISH_NAMES = (
+    "alex", "sam", "jamie", "chris", "taylor", "jordan", "morgan", "casey", "riley", "drew",
+    "kevin", "grace", "daniel", "sophia", "ethan", "olivia", "lucas", "emma", "ryan", "chloe",
+)
+BOT_NAMES = ("MEE6", "Dyno", "Carl-bot", "Rythm", "Notion Sync", "Study Timer")
+
+
+class _RecordingChannel(FakeChannel):
+    """마지막으로 보낸 메시지로 검색 결과(단일/여러 명/없음)를 구분합니다."""
+
+    def __init__(self, channel_id: int, name: str = "channel", guild=None):
+        super().__init__(channel_id, name, guild)
+        self.last_content = ""
+
+    async def send(self, content: str = "", **kwargs):
+        self.last_content = content or ""
+        await super().send(content, **kwargs)
+
+
+def korean_nickname(rng: random.Random) -> str:
+    given = rng.choice(GIVEN_SYLLABLES) + rng.choice(GIVEN_SYLLABLES)
+    style = rng.random()
+    if style < 0.4:
+        return rng.choice(SURNAMES) + given
+    if style < 0.55:
+        return f"{rng.choice(SURNAMES)} {given}"
+    if style < 0.75:
+        return given
+    return f"{rng.choice(KOREAN_NICKS)}{rng.randint(1, 99) if rng.random() < 0.6 else ''}"
+
+
+def english_nickname(rng: random.Random) -> str:
+    name = rng.choice(ENGLISH_NAMES)
+    style = rng.random()
+    if style < 0.35:
+        return name.capitalize()
+    if style < 0.6:
+        return f"{name.capitalize()} {rng.choice(('Kim', 'Lee', 'Park', 'Choi', 'Smith', 'Lim'))}"
+    if style < 0.85:
+        return f"{name}_{rng.choice(('dev', 'study', 'code', 'zz'))}{rng.randint(1, 999)}"
+    return name.upper()[: rng.randint(2, 4)]
+
+
+def build_guild(size: int, bot_ratio: float, korean_ratio: float, rng: random.Random):
+    bot = FakeBot()
+    guild = FakeGuild(GUILD_ID, "large-guild")
+    voice = guild.add_channel(FakeChannel(VOICE_ID, "study-voice"))
+    mention = guild.add_channel(_RecordingChannel(MENTION_ID, "mention"))
+    chat = guild.add_channel(FakeChannel(CHAT_ID, "chat"))
+    bot.add_guild(guild)
+
+    bots = max(1, int(size * bot_ratio))
+    for i in range(size - bots):
+        nick = korean_nickname(rng) if rng.random() < korean_ratio else english_nickname(rng)
+        username = f"{rng.choice(ENGLISH_NAMES)}{i}"
+        global_name = nick if rng.random() < 0.5 else None
+        # 서버 닉네임이 없으면 표시 이름은 글로벌 이름 또는 사용자 이름입니다.
+        display_name = nick if rng.random() < 0.7 else (global_name or username)
+        guild.add_member(FakeMember(USER_ID_BASE + i, username, display_name, global_name))
+    for i in range(bots):
+        name = f"{rng.choice(BOT_NAMES)}{i}"
+        guild.add_member(FakeMember(BOT_ID_BASE + i, name, bot=True))
+
+    humans = [m for m in guild.members if not m.bot]
+    # 공부 채널에는 1% 정도가 들어와 있습니다 (리마인더 제외 대상).
+    voice.members = rng.sample(humans, max(1, len(humans) // 100))
+    return bot, guild, voice, mention, chat, humans
+
+
+def build_queries(humans: list, count: int, rng: random.Random):
+    """(종류, 메시지 내용) 목록. 정확 일치 / 부분 일치 / 없는 이름을 섞습니다."""
+    queries = []
+    for i in range(count):
+        kind = ("exact", "partial", "miss")[i % 3]
+        name = rng.choice(humans).display_name.replace(" ", "")
+        if kind == "exact":
+            target = name
+        elif kind == "partial":
+            width = 2 if not name.isascii() else 3
+            start = rng.randrange(max(1, len(name) - width + 1))
+            target = name[start : start + width]
+        else:
+            target = f"없는사람{i}" if i % 2 else f"nobody{i}"
+        queries.append((kind, f"!{target} 디코 확인 부탁"))
+    return queries
+
+
+def build_store(path: str, humans: list, active_ratio: float, rng: random.Random) -> StateStore:
+    store = StateStore(path)
+    now = now_epoch()
+    store.study_tracking_started_at = now - 30 * DAY
+    for member in humans:
+        if rng.random() < active_ratio:
+            store.mark_studied(member.id, now - rng.randint(0, 7 * DAY))
+    return store
+
+
+async def bench_size(size: int, args) -> dict:
+    rng = random.Random(args.seed + size)
+
+    tracemalloc.start()
+    bot, guild, voice, mention, chat, humans = build_guild(size, args.bots, args.korean, rng)
+    guild_bytes, _ = tracemalloc.get_traced_memory()
+
+    bot.settings.current = build_settings(
+        {"report_channel_id_enter": MENTION_ID, "mention_channel_id": MENTION_ID}
+    )
+    directory_cog = bot.register_cog(MemberDirectoryCog(bot))
+    tracemalloc.reset_peak()
+    await directory_cog.on_ready()
+    index_bytes, index_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # 색인 생성 시간은 tracemalloc 없이 다시 잽니다.
+    index_timer = Timer()
+    for _ in range(args.index_runs):
+        with index_timer:
+            directory_cog.directory.build(guild)
+
+    # ------------------------------------------------------------------
+    # 멘션 단축: 메시지당 검색 지연
+    # ------------------------------------------------------------------
+    mention_cog = MentionShortcutCog(bot)
+    author = humans[0]
+    queries = build_queries(humans, args.messages, rng)
+    timers = {"exact": Timer(), "partial": Timer(), "miss": Timer()}
+    outcomes = {"single": 0, "multiple": 0, "not_found": 0}
+    for kind, content in queries:
+        message = FakeMessage(author, content, chat, guild)
+        with timers[kind]:
+            await mention_cog.on_message(message)
+        if mention.last_content.startswith("여러 명이"):
+            outcomes["multiple"] += 1
+        elif mention.last_content.startswith("해당 이름을"):
+            outcomes["not_found"] += 1
+        else:
+            outcomes["single"] += 1
+
+    tracemalloc.start()
+    base, _ = tracemalloc.get_traced_memory()
+    for kind, content in queries[: min(len(queries), 30)]:
+        await mention_cog.on_message(FakeMessage(author, content, chat, guild))
+    _, lookup_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lookup_peak -= base
+
+    # ------------------------------------------------------------------
+    # 공부 리마인더: 랜덤 멘션 + 미기록자 계산
+    # ------------------------------------------------------------------
+    with tempfile.TemporaryDirectory() as tmp:
+        store = build_store(os.path.join(tmp, "voice_time.json"), humans, args.active, rng)
+        # 음성 시간 cog의 메모리 상태를 그대로 쓰는 경로를 잽니다.
+        bot._cogs["VoiceTimeCog"] = SimpleNamespace(store=store)
+        reminder_cog = study_reminder.StudyReminderCog(bot)
+        sent_before = mention.sent_messages
+        bytes_before = mention.sent_bytes
+        reminder_timer = Timer()
+        for _ in range(args.reminders):
+            with reminder_timer:
+                await reminder_cog.daily_study_reminder()
+        reminder_messages = (mention.sent_messages - sent_before) // args.reminders
+        reminder_bytes = (mention.sent_bytes - bytes_before) // args.reminders
+
+        tracemalloc.start()
+        base, _ = tracemalloc.get_traced_memory()
+        await reminder_cog.daily_study_reminder()
+        _, reminder_peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        reminder_peak -= base
+
+    result = {
+        "members": size,
+        "humans": len(humans),
+        "bots": size - len(humans),
+        "name_keys": len(directory_cog.directory.index(guild).by_name),
+        "guild_kb": round(guild_bytes / 1024, 1),
+        "index_kb": round((index_bytes - guild_bytes) / 1024, 1),
+        "index_peak_kb": round((index_peak - guild_bytes) / 1024, 1),
+        "index_build_ms": latency_summary(index_timer.latencies)["p50_ms"],
+        "messages": len(queries),
+        **{f"{kind}_{key}": value for kind, timer in timers.items() for key, value in latency_summary(timer.latencies).items()},
+        "lookup_p99_ms": latency_summary([t for timer in timers.values() for t in timer.latencies])["p99_ms"],
+        "lookup_peak_kb": round(lookup_peak / 1024, 1),
+        **{f"lookup_{key}": value for key, value in outcomes.items()},
+        "reminder_p50_ms": latency_summary(reminder_timer.latencies)["p50_ms"],
+        "reminder_max_ms": latency_summary(reminder_timer.latencies)["max_ms"],
+        "reminder_peak_kb": round(reminder_peak / 1024, 1),
+        "reminder_messages": reminder_messages,
+        "reminder_bytes": reminder_bytes,
+    }
+    del bot, guild, voice, mention, chat, humans, directory_cog, mention_cog, reminder_cog, store
+    gc.collect()
+    return result
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="MentionShortcutCog / StudyReminderCog large guild benchmark")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="쉼표로 구분한 서버 멤버 수")
+    parser.add_argument("--bots", type=float, default=0.03, help="봇 계정 비율")
+    parser.add_argument("--korean", type=float, default=0.7, help="한글 닉네임 비율")
+    parser.add_argument("--active", type=float, default=0.6, help="최근 공부 기록이 있는 멤버 비율")
+    parser.add_argument("--messages", type=int, default=300, help="서버 크기별 멘션 단축 메시지 수")
+    parser.add_argument("--reminders", type=int, default=5, help="서버 크기별 공부 리마인더 실행 횟수")
+    parser.add_argument("--index-runs", type=int, default=3, help="멤버 색인 재생성 측정 횟수")
+    parser.add_argument("--seed", type=int, default=42)
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    study_reminder.VOICE_CHANNEL_ID = VOICE_ID
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    results = {}
+    wall_started = time.perf_counter()
+    for size in sizes:
+        results[f"members_{size}"] = await bench_size(size, args)
+
+    keys = [
+        "index_build_ms",
+        "index_kb",
+        "exact_p50_ms",
+        "partial_p50_ms",
+        "miss_p50_ms",
+        "lookup_p99_ms",
+        "reminder_p50_ms",
+        "reminder_peak_kb",
+    ]
+    finish_report("large_guild", args, results, keys, elapsed_s=round(time.perf_counter() - wall_started, 2))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,127 @@
+# benchmarks/bench_notion_watcher.py
+"""NotionWatcherCog 폴링 부하 벤치마크.
+
+benchmarks/fake_notion.py 서버에 수천 개의 row를 시드한 뒤, 매 사이클마다 신규 row/상태 변경/수정을
+섞어 넣고 notion_update_poller 한 사이클을 직접 실행합니다.
+사이클 시간, Notion 요청 수, 발송된 알림 수를 측정합니다.
+
+    python -m benchmarks.bench_notion_watcher
+    python -m benchmarks.bench_notion_watcher --rows 10000 --latency-ms 80 --rate-limit 0.05
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from benchmarks.fakes import FakeBot, FakeChannel
+from benchmarks.fake_notion import FakeNotionServer
+from benchmarks.harness import NoSleepAsyncio, Timer, add_report_arguments, finish_report, latency_summary
+
+from cogs import notion_watcher
+from settings import build_settings
+
+FEATURE_DB = "feature-db"
+BOARD_DB = "board-db"
+FEATURE_CH = 4000
+ALARM_CH = 5000
+WARMUP_CH = 6000
+
+
+def mutate(server: FakeNotionServer, args):
+    """한 폴링 주기 동안 사람들이 Notion에서 할 법한 변경을 흉내 냅니다."""
+    for _ in range(args.new_per_cycle):
+        server.add_feature_row(FEATURE_DB)
+    for _ in range(args.complete_per_cycle):
+        server.edit_page(server.random_page_id(FEATURE_DB), status="완료")
+    for _ in range(args.edit_per_cycle):
+        page_id = server.random_page_id(FEATURE_DB)
+        server.edit_page(page_id, title=f"수정된 제목 {server.rng.randrange(10**6)}")
+    if server.rng.random() < 0.5:
+        server.add_board_row(BOARD_DB)
+
+
+async def run(args) -> dict:
+    server = FakeNotionServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit,
+        seed=args.seed,
+    )
+    server.seed_features(FEATURE_DB, args.rows)
+    server.seed_boards(BOARD_DB, max(1, args.rows // 10))
+    base_url = await server.start()
+
+    bot = FakeBot()
+    feature_ch = bot.add_channel(FakeChannel(FEATURE_CH, "feature"))
+    alarm_ch = bot.add_channel(FakeChannel(ALARM_CH, "alarm"))
+    bot.add_channel(FakeChannel(WARMUP_CH, "warmup"))
+
+    notion_watcher.NOTION_TOKEN = "bench-token"
+    notion_watcher.NOTION_API_BASE_URL = base_url
+    notion_watcher.NOTION_DATABASE_FEATURE_ID = FEATURE_DB
+    notion_watcher.NOTION_DATABASE_BOARD_ID = BOARD_DB
+    notion_watcher.asyncio = NoSleepAsyncio()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cog = notion_watcher.NotionWatcherCog(bot)
+        cog.db_file = os.path.join(tmp, "notion_db.json")
+
+        # 첫 사이클은 기존 row를 모두 "이미 본 것"으로 기록하는 워밍업입니다.
+        # 시드된 row가 전부 신규로 잡혀 알림이 나가므로, 이 사이클 동안만 알림을 버림 채널로 보내
+        # 측정 채널의 발송 수에는 섞이지 않게 합니다.
+        bot.settings.current = build_settings(
+            {"report_channel_id_feature": WARMUP_CH, "report_channel_id_alarm": WARMUP_CH}
+        )
+        await cog.notion_update_poller.coro(cog)
+        warmup_requests = sum(server.requests.values())
+        bot.settings.current = build_settings(
+            {"report_channel_id_feature": FEATURE_CH, "report_channel_id_alarm": ALARM_CH}
+        )
+
+        timer = Timer()
+        wall_started = time.perf_counter()
+        for _ in range(args.cycles):
+            mutate(server, args)
+            with timer:
+                await cog.notion_update_poller.coro(cog)
+        elapsed = time.perf_counter() - wall_started
+        state_bytes = os.path.getsize(cog.db_file) if os.path.exists(cog.db_file) else 0
+
+    await server.stop()
+
+    requests = sum(server.requests.values()) - warmup_requests
+    notifications = feature_ch.sent_messages + alarm_ch.sent_messages
+    return {
+        "cycles": args.cycles,
+        "cycle_total_s": round(elapsed, 3),
+        **{k.replace("_ms", "_cycle_ms"): v for k, v in latency_summary(timer.latencies).items()},
+        "warmup_requests": warmup_requests,
+        "requests": requests,
+        "requests_per_cycle": round(requests / args.cycles, 2) if args.cycles else 0.0,
+        "rate_limited": server.rate_limited,
+        "notifications": notifications,
+        "state_file_bytes": state_bytes,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="NotionWatcherCog load benchmark against a local fake Notion")
+    parser.add_argument("--rows", type=int, default=3000)
+    parser.add_argument("--cycles", type=int, default=30)
+    parser.add_argument("--new-per-cycle", type=int, default=2)
+    parser.add_argument("--complete-per-cycle", type=int, default=2)
+    parser.add_argument("--edit-per-cycle", type=int, default=3)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=7)
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    results = {"notion_poller": await run(args)}
+    finish_report("notion_watcher", args, results, ["p50_cycle_ms", "p99_cycle_ms", "requests_per_cycle", "notifications"])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
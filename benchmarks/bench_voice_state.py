@@ -0,0 +1,232 @@
+# benchmarks/bench_voice_state.py
+"""음성 상태 이벤트 재생(replay) 벤치마크.
+
+합성한 입장/퇴장 트레이스를 VoiceTimeCog.on_voice_state_update와 StateStore에 그대로 흘려보내고
+이벤트 처리량, 핸들러 지연(p50/p99), 이벤트당 디스크 쓰기량을 측정합니다.
+Notion API와 Discord 전송은 모두 가짜 객체로 대체됩니다.
+시간은 가상 시계(VirtualClock)로 흘려보내므로 debounce 묶기와 유예 시간 안의 재입장 묶기도 실제처럼 일어납니다.
+
+    python -m benchmarks.bench_voice_state
+    python -m benchmarks.bench_voice_state --users 5000 --save-baseline bench_baseline.json
+    python -m benchmarks.bench_voice_state --baseline bench_baseline.json
+"""
+import argparse
+import asyncio
+import datetime as dt
+import os
+import random
+import tempfile
+import time
+from collections import Counter
+
+from benchmarks.fakes import FakeBot, FakeChannel, FakeGuild, FakeMember, FakeVoiceState
+from benchmarks.harness import Timer, VirtualClock, add_report_arguments, finish_report, latency_summary
+
+import state_store
+from cogs import voice_time
+from settings import build_settings
+from time_utils import KST, to_epoch
+
+VOICE_ID = 1000
+REPORT_ID = 2000
+OTHER_VOICE_ID = 3000
+# 실제 Discord snowflake 와 비슷한 자릿수(18~19자리)를 써야 저장 크기 비교가 의미 있습니다.
+USER_ID_BASE = 300_000_000_000_000_000
+BOT_ID_BASE = 900_000_000_000_000_000
+
+
+def build_trace(
+    users: int,
+    sessions_per_user: int,
+    burst_ratio: float,
+    mute_ratio: float,
+    seed: int,
+    flap_ratio: float = 0.0,
+    short_break_ratio: float = 0.0,
+):
+    """(초 단위 오프셋, user_index, kind) 목록을 시간순으로 만듭니다.
+
+    flap_ratio: 세션 중 1초 안에 나갔다 들어오는(debounce로 묶일) 세션 비율
+    short_break_ratio: 다음 입장까지 쉬는 시간이 유예 시간(기본 120초)보다 짧은 세션 비율
+    """
+    rng = random.Random(seed)
+    events = []
+    burst_users = int(users * burst_ratio)
+    for idx in range(users):
+        # 일부 사용자는 정각 직후 몇 초 안에 몰려 들어옵니다(burst arrival).
+        t = rng.uniform(0, 5) if idx < burst_users else rng.uniform(0, 6 * 3600)
+        for _ in range(sessions_per_user):
+            events.append((t, idx, "join"))
+            duration = rng.choice((rng.uniform(60, 20 * 60), rng.uniform(30 * 60, 3 * 3600)))
+            mutes = int(rng.random() < mute_ratio) * rng.randint(1, 4)
+            for _ in range(mutes):
+                events.append((t + rng.uniform(1, duration - 1), idx, "mute"))
+            if rng.random() < flap_ratio:
+                flap = t + rng.uniform(1, duration - 3)
+                events.append((flap, idx, "leave"))
+                events.append((flap + rng.uniform(0.1, 1.0), idx, "join"))
+            t += duration
+            events.append((t, idx, "leave"))
+            t += rng.uniform(20, 100) if rng.random() < short_break_ratio else rng.uniform(30, 4 * 3600)
+    events.sort(key=lambda e: e[0])
+    return events
+
+
+def build_world(users: int):
+    bot = FakeBot()
+    guild = FakeGuild(1, "bench-guild")
+    voice = guild.add_channel(FakeChannel(VOICE_ID, "study-room"))
+    other = guild.add_channel(FakeChannel(OTHER_VOICE_ID, "lounge"))
+    report = guild.add_channel(FakeChannel(REPORT_ID, "report"))
+    bot.add_guild(guild)
+    members = [guild.add_member(FakeMember(USER_ID_BASE + i, f"user{i}")) for i in range(users)]
+    for i in range(max(1, users // 100)):
+        guild.add_member(FakeMember(BOT_ID_BASE + i, f"bot{i}", bot=True))
+    return bot, guild, voice, other, report, members
+
+
+async def replay(args, data_file: str) -> dict:
+    start = dt.datetime(2025, 1, 6, 9, 0, tzinfo=KST)
+    clock = VirtualClock(start)
+    voice_time.now_kst = clock.now
+    voice_time.asyncio = clock
+    voice_time.VOICE_CHANNEL_ID = VOICE_ID
+    voice_time.DATA_FILE = data_file
+
+    bot, guild, voice, other, report, members = build_world(args.users)
+    bot.settings.current = build_settings({"report_channel_id_enter": REPORT_ID})
+    cog = voice_time.VoiceTimeCog(bot)
+    cog._load_state()
+
+    notion_records = 0
+
+    async def fake_notion_record(record):
+        nonlocal notion_records
+        notion_records += 1
+        return True
+
+    cog._create_notion_voice_record = fake_notion_record
+
+    # debounce 뒤 실제로 처리한 입장/퇴장 수. 트레이스 이벤트 수와의 차이가 debounce로 묶인 만큼입니다.
+    transitions = Counter()
+    for name in ("_handle_join", "_handle_leave"):
+        handler = getattr(cog, name)
+
+        def counted(*handler_args, _handler=handler, _name=name):
+            transitions[_name] += 1
+            return _handler(*handler_args)
+
+        setattr(cog, name, counted)
+
+    saves = 0
+    bytes_written = 0
+    original_save = cog.store.save
+
+    def counting_save():
+        nonlocal saves, bytes_written
+        original_save()
+        saves += 1
+        bytes_written += os.path.getsize(cog.store.snapshot_file)
+
+    cog.store.save = counting_save
+
+    trace = build_trace(args.users, args.sessions, args.burst, args.mute, args.seed, args.flap, args.short_break)
+    timer = Timer()
+    in_channel = set()
+    wall_started = time.perf_counter()
+    for offset, idx, kind in trace:
+        member = members[idx]
+        if kind == "join":
+            before, after = FakeVoiceState(other), FakeVoiceState(voice)
+            voice.members.append(member)
+            in_channel.add(idx)
+        elif kind == "leave":
+            before, after = FakeVoiceState(voice), FakeVoiceState(None)
+            voice.members.remove(member)
+            in_channel.discard(idx)
+        else:
+            channel = voice if idx in in_channel else other
+            before, after = FakeVoiceState(channel), FakeVoiceState(channel, self_mute=True)
+        with timer:
+            # 이 이벤트 시각까지 예정된 debounce 처리, 입장 알림, 유예 만료 확정을 먼저 처리합니다.
+            await clock.advance_to(start + dt.timedelta(seconds=offset))
+            await cog.on_voice_state_update(member, before, after)
+    # 마지막 퇴장의 debounce와 유예 시간이 지나 세션이 모두 확정될 때까지 시계를 넘깁니다.
+    await clock.advance(bot.settings.current.session_grace_seconds + voice_time.VOICE_EVENT_DEBOUNCE_SECONDS + 60)
+    await cog.flush()
+    elapsed = time.perf_counter() - wall_started
+
+    events = len(trace)
+    result = {
+        "events": events,
+        "events_per_sec": round(events / elapsed, 1) if elapsed else 0.0,
+        **latency_summary(timer.latencies),
+        "saves": saves,
+        "bytes_written": bytes_written,
+        "bytes_per_event": round(bytes_written / events, 1) if events else 0.0,
+        "final_state_bytes": os.path.getsize(cog.store.snapshot_file),
+        "transitions": transitions["_handle_join"] + transitions["_handle_leave"],
+        "stints_closed": bot.dispatched["voice_session_closed"],
+        "notion_records": notion_records,
+        "discord_messages": report.sent_messages,
+    }
+    cog.cog_unload()
+    return result
+
+
+async def bench_store(args, data_file: str) -> dict:
+    """핸들러를 거치지 않고 StateStore의 세션 시작/종료 + 저장 비용만 잽니다."""
+    store = state_store.StateStore(data_file)
+    store.load()
+    rng = random.Random(args.seed)
+    timer = Timer()
+    bytes_written = 0
+    ops = args.users * args.sessions * 2
+    now = to_epoch(dt.datetime(2025, 1, 6, 9, 0, tzinfo=KST))
+    open_ids = []
+    wall_started = time.perf_counter()
+    for _ in range(ops):
+        now += rng.randint(1, 30)
+        with timer:
+            if open_ids and rng.random() < 0.5:
+                uid = open_ids.pop(rng.randrange(len(open_ids)))
+                store.end_session(uid, until=now)
+            else:
+                uid = USER_ID_BASE + rng.randrange(args.users)
+                store.start_session(uid, now)
+                open_ids.append(uid)
+            store.save()
+        bytes_written += os.path.getsize(store.snapshot_file)
+    elapsed = time.perf_counter() - wall_started
+    return {
+        "events": ops,
+        "events_per_sec": round(ops / elapsed, 1) if elapsed else 0.0,
+        **latency_summary(timer.latencies),
+        "bytes_written": bytes_written,
+        "bytes_per_event": round(bytes_written / ops, 1) if ops else 0.0,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="VoiceTimeCog / StateStore replay benchmark")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--sessions", type=int, default=3, help="사용자당 입장/퇴장 횟수")
+    parser.add_argument("--burst", type=float, default=0.3, help="몇 초 안에 몰려 들어오는 사용자 비율")
+    parser.add_argument("--mute", type=float, default=0.3, help="세션 중 음소거 토글 이벤트가 있는 비율")
+    parser.add_argument("--flap", type=float, default=0.1, help="세션 중 1초 안에 나갔다 들어오는 비율 (debounce)")
+    parser.add_argument("--short-break", type=float, default=0.2, help="유예 시간 안에 다시 들어오는 비율")
+    parser.add_argument("--seed", type=int, default=42)
+    add_report_arguments(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "voice_state_replay": await replay(args, os.path.join(tmp, "replay.json")),
+            "state_store": await bench_store(args, os.path.join(tmp, "store.json")),
+        }
+
+    finish_report("voice_state", args, results, ["events_per_sec", "p50_ms", "p99_ms", "bytes_per_event"])
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
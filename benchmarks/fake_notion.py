@@ -0,0 +1,360 @@
+# benchmarks/fake_notion.py
+"""로컬 Notion API 대역(stand-in) 서버.
+
+봇이 쓰는 엔드포인트만 흉내 냅니다.
+- POST /v1/databases/{id}/query : 페이지네이션(start_cursor/next_cursor), last_edited_time 정렬,
+                                  date / people / multi_select 필터와 and / or 조합
+- POST /v1/pages                : 페이지 생성
+- GET  /v1/users/me             : 통합(bot) 사용자 정보
+
+지연 시간과 429(rate limit) 응답을 주입할 수 있고, 시드 고정 데이터셋을 만들 수 있습니다.
+봇을 이 서버에 붙이려면 NOTION_API_BASE_URL=http://127.0.0.1:<port>/v1 로 실행하세요.
+
+    python -m benchmarks.fake_notion --feature-rows 5000 --port 8765
+"""
+import argparse
+import asyncio
+import datetime as dt
+import random
+import uuid
+from collections import Counter
+from typing import Any, Dict, List, Optional
+
+from aiohttp import web
+
+MAX_PAGE_SIZE = 100
+BOT_USER_ID = "00000000-0000-4000-8000-000000000b07"
+FEATURE_STATUSES = ("요청", "진행 중", "완료")
+TITLES = ("출석 통계", "메뉴 추천 개선", "공부 알림", "주간 리포트", "멘션 단축", "Notion 연동", "dark mode", "export CSV")
+PEOPLE = ("임아리", "김성아", "장민지", "Alex", "Jordan")
+
+
+def _rich(text: str) -> List[Dict[str, Any]]:
+    return [{"type": "text", "text": {"content": text}, "plain_text": text}]
+
+
+def _iso(ts: dt.datetime) -> str:
+    return ts.astimezone(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+class UnsupportedFilter(ValueError):
+    """대역 서버가 흉내 내지 않는 필터. 조용히 무시하지 않고 400으로 돌려줍니다."""
+
+
+def _parse_date(value: str):
+    """날짜만 있으면 date, 시각까지 있으면 aware datetime."""
+    if len(value) == 10:
+        return dt.date.fromisoformat(value)
+    parsed = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=dt.timezone.utc)
+
+
+def _match_date(prop: Dict[str, Any], cond: Dict[str, Any]) -> bool:
+    # Notion처럼 기간 속성은 시작 시각으로 비교합니다.
+    start = ((prop or {}).get("date") or {}).get("start")
+    if "is_empty" in cond:
+        return not start
+    if "is_not_empty" in cond:
+        return bool(start)
+    if not start:
+        return False
+    (op, raw), = cond.items()
+    target = _parse_date(raw)
+    value = _parse_date(start)
+    if isinstance(target, dt.datetime) and not isinstance(value, dt.datetime):
+        value = dt.datetime.combine(value, dt.time(), tzinfo=dt.timezone.utc)
+    elif not isinstance(target, dt.datetime) and isinstance(value, dt.datetime):
+        value = value.date()
+    compare = {
+        "equals": value == target,
+        "before": value < target,
+        "after": value > target,
+        "on_or_before": value <= target,
+        "on_or_after": value >= target,
+    }
+    if op not in compare:
+        raise UnsupportedFilter(f"date.{op}")
+    return compare[op]
+
+
+def _match_people(prop: Dict[str, Any], cond: Dict[str, Any]) -> bool:
+    ids = {p.get("id") for p in (prop or {}).get("people", [])}
+    (op, value), = cond.items()
+    if op == "contains":
+        return value in ids
+    if op == "does_not_contain":
+        return value not in ids
+    if op == "is_empty":
+        return not ids
+    if op == "is_not_empty":
+        return bool(ids)
+    raise UnsupportedFilter(f"people.{op}")
+
+
+def _match_multi_select(prop: Dict[str, Any], cond: Dict[str, Any]) -> bool:
+    names = {o.get("name") for o in (prop or {}).get("multi_select", [])}
+    (op, value), = cond.items()
+    if op == "contains":
+        return value in names
+    if op == "does_not_contain":
+        return value not in names
+    if op == "is_empty":
+        return not names
+    if op == "is_not_empty":
+        return bool(names)
+    raise UnsupportedFilter(f"multi_select.{op}")
+
+
+_PROPERTY_MATCHERS = {"date": _match_date, "people": _match_people, "multi_select": _match_multi_select}
+
+
+def matches_filter(page: Dict[str, Any], flt: Dict[str, Any]) -> bool:
+    """query 요청의 filter 본문을 page에 적용합니다. 흉내 내지 않는 조건이면 UnsupportedFilter."""
+    if "and" in flt:
+        return all(matches_filter(page, f) for f in flt["and"])
+    if "or" in flt:
+        return any(matches_filter(page, f) for f in flt["or"])
+    if "property" not in flt:
+        raise UnsupportedFilter(", ".join(flt) or "(empty)")
+    prop = page.get("properties", {}).get(flt["property"])
+    kinds = [k for k in flt if k != "property"]
+    if len(kinds) != 1 or kinds[0] not in _PROPERTY_MATCHERS:
+        raise UnsupportedFilter(", ".join(kinds) or "(empty)")
+    return _PROPERTY_MATCHERS[kinds[0]](prop, flt[kinds[0]])
+
+
+class FakeNotionServer:
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        rate_limit_ratio: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_ratio = rate_limit_ratio
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+
+        self.databases: Dict[str, List[Dict[str, Any]]] = {}
+        self.pages: Dict[str, Dict[str, Any]] = {}
+        self.requests: Counter = Counter()
+        self.rate_limited = 0
+        self.clock = dt.datetime(2025, 1, 6, 0, 0, tzinfo=dt.timezone.utc)
+
+        self._runner: Optional[web.AppRunner] = None
+        self.base_url = ""
+
+    # ------------------------------------------------------------------
+    # 데이터셋
+    # ------------------------------------------------------------------
+    def _tick(self) -> dt.datetime:
+        self.clock += dt.timedelta(seconds=1)
+        return self.clock
+
+    def _new_page(self, db_id: str, properties: Dict[str, Any], created_by: Optional[str] = None) -> Dict[str, Any]:
+        ts = self._tick()
+        page = {
+            "object": "page",
+            "id": str(uuid.UUID(int=self.rng.getrandbits(128), version=4)),
+            "created_time": _iso(ts),
+            "last_edited_time": _iso(ts),
+            "created_by": {"object": "user", "id": created_by or str(uuid.UUID(int=self.rng.getrandbits(128), version=4))},
+            "parent": {"type": "database_id", "database_id": db_id},
+            "properties": properties,
+        }
+        self.databases.setdefault(db_id, []).append(page)
+        self.pages[page["id"]] = page
+        return page
+
+    def feature_properties(self, title: str, description: str, status: str, assignee: Optional[str] = None):
+        props = {
+            "내용": {"id": "title", "type": "title", "title": _rich(title)},
+            "설명": {"id": "desc", "type": "rich_text", "rich_text": _rich(description)},
+            "상태": {"id": "stat", "type": "status", "status": {"name": status}},
+        }
+        if assignee:
+            props["담당자"] = {"id": "ppl", "type": "people", "people": [{"object": "user", "id": assignee, "name": assignee}]}
+        return props
+
+    def add_feature_row(self, db_id: str, status: Optional[str] = None) -> Dict[str, Any]:
+        title = f"{self.rng.choice(TITLES)} #{len(self.databases.get(db_id, [])) + 1}"
+        return self._new_page(
+            db_id,
+            self.feature_properties(
+                title,
+                f"{title} 설명",
+                status or self.rng.choice(FEATURE_STATUSES[:2]),
+                self.rng.choice(PEOPLE),
+            ),
+        )
+
+    def add_board_row(self, db_id: str) -> Dict[str, Any]:
+        title = f"게시글 {len(self.databases.get(db_id, [])) + 1}"
+        return self._new_page(db_id, {"이름": {"id": "title", "type": "title", "title": _rich(title)}})
+
+    def add_schedule_row(self, db_id: str, tag: str, start: dt.datetime, end: dt.datetime, goal_minutes: Optional[int] = None):
+        props = {
+            "이름": {"id": "title", "type": "title", "title": _rich(f"{tag} 일정")},
+            "날짜": {"id": "date", "type": "date", "date": {"start": start.isoformat(), "end": end.isoformat()}},
+            "태그": {"id": "tag", "type": "multi_select", "multi_select": [{"name": tag}]},
+        }
+        if goal_minutes is not None:
+            props["목표"] = {"id": "goal", "type": "number", "number": goal_minutes}
+        return self._new_page(db_id, props)
+
+    def seed_features(self, db_id: str, rows: int, completed_ratio: float = 0.3):
+        for _ in range(rows):
+            status = "완료" if self.rng.random() < completed_ratio else None
+            self.add_feature_row(db_id, status=status)
+
+    def seed_boards(self, db_id: str, rows: int):
+        for _ in range(rows):
+            self.add_board_row(db_id)
+
+    def edit_page(self, page_id: str, **changes: str):
+        """status/title/description 을 바꾸고 last_edited_time 을 갱신합니다."""
+        page = self.pages[page_id]
+        props = page["properties"]
+        if "status" in changes:
+            props["상태"]["status"] = {"name": changes["status"]}
+        if "title" in changes:
+            props["내용"]["title"] = _rich(changes["title"])
+        if "description" in changes:
+            props["설명"]["rich_text"] = _rich(changes["description"])
+        page["last_edited_time"] = _iso(self._tick())
+
+    def random_page_id(self, db_id: str) -> str:
+        return self.rng.choice(self.databases[db_id])["id"]
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+    async def _delay_or_limit(self, endpoint: str) -> Optional[web.Response]:
+        self.requests[endpoint] += 1
+        delay = self.latency_ms + (self.rng.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if self.rate_limit_ratio and self.rng.random() < self.rate_limit_ratio:
+            self.rate_limited += 1
+            return web.json_response(
+                {"object": "error", "status": 429, "code": "rate_limited", "message": "Rate limited"},
+                status=429,
+                headers={"Retry-After": str(self.retry_after)},
+            )
+        return None
+
+    async def _query(self, request: web.Request) -> web.Response:
+        limited = await self._delay_or_limit("query")
+        if limited:
+            return limited
+        db_id = request.match_info["db_id"]
+        if db_id not in self.databases:
+            return web.json_response(
+                {"object": "error", "status": 404, "code": "object_not_found", "message": "database not found"},
+                status=404,
+            )
+        body = await request.json() if request.can_read_body else {}
+        page_size = max(1, min(int(body.get("page_size", MAX_PAGE_SIZE)), MAX_PAGE_SIZE))
+        rows = list(self.databases[db_id])
+        if body.get("filter"):
+            try:
+                rows = [r for r in rows if matches_filter(r, body["filter"])]
+            except UnsupportedFilter as e:
+                return web.json_response(
+                    {
+                        "object": "error",
+                        "status": 400,
+                        "code": "validation_error",
+                        "message": f"fake Notion이 지원하지 않는 filter: {e}",
+                    },
+                    status=400,
+                )
+        for sort in reversed(body.get("sorts", [])):
+            key = sort.get("timestamp")
+            if key in ("last_edited_time", "created_time"):
+                rows.sort(key=lambda r: r[key], reverse=sort.get("direction") == "descending")
+
+        start = int(body.get("start_cursor") or 0)
+        chunk = rows[start : start + page_size]
+        has_more = start + page_size < len(rows)
+        return web.json_response(
+            {
+                "object": "list",
+                "results": chunk,
+                "next_cursor": str(start + page_size) if has_more else None,
+                "has_more": has_more,
+            }
+        )
+
+    async def _create_page(self, request: web.Request) -> web.Response:
+        limited = await self._delay_or_limit("pages")
+        if limited:
+            return limited
+        body = await request.json()
+        db_id = body.get("parent", {}).get("database_id", "")
+        page = self._new_page(db_id, body.get("properties", {}), created_by=BOT_USER_ID)
+        return web.json_response(page)
+
+    async def _users_me(self, request: web.Request) -> web.Response:
+        limited = await self._delay_or_limit("users_me")
+        if limited:
+            return limited
+        return web.json_response({"object": "user", "id": BOT_USER_ID, "type": "bot", "name": "fake-bot"})
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/v1/databases/{db_id}/query", self._query)
+        app.router.add_post("/v1/pages", self._create_page)
+        app.router.add_get("/v1/users/me", self._users_me)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        self._runner = web.AppRunner(self.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = self._runner.addresses[0][1]
+        self.base_url = f"http://{host}:{bound_port}/v1"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+async def _serve(args):
+    server = FakeNotionServer(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_limit_ratio=args.rate_limit,
+        seed=args.seed,
+    )
+    server.seed_features("feature-db", args.feature_rows)
+    server.seed_boards("board-db", args.board_rows)
+    server.databases.setdefault("schedule-db", [])
+    base_url = await server.start(port=args.port)
+    print(f"fake Notion: {base_url}")
+    print("DB ids: feature-db, board-db, schedule-db")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local fake Notion API")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--feature-rows", type=int, default=1000)
+    parser.add_argument("--board-rows", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--rate-limit", type=float, default=0.0, help="429 응답 비율 (0~1)")
+    parser.add_argument("--seed", type=int, default=0)
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
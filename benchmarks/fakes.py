@@ -0,0 +1,157 @@
+# benchmarks/fakes.py
+"""벤치마크용 가짜 Discord 객체.
+
+discord.py의 Member/VoiceState/Guild/채널 중 cog가 실제로 쓰는 속성만 흉내 냅니다.
+네트워크 호출은 하지 않고, 전송된 메시지는 카운트만 합니다.
+"""
+import os
+import tempfile
+from collections import Counter
+
+# config.py가 필수 환경변수 없이 import되면 SystemExit 하므로 벤치마크용 더미 값을 넣습니다.
+os.environ.setdefault("DISCORD_TOKEN", "bench-token")
+os.environ.setdefault("VOICE_CHANNEL_ID", "1000")
+os.environ.setdefault("REPORT_CHANNEL_ID_ENTER", "2000")
+
+from scheduler import JobScheduler  # noqa: E402  (환경변수 설정 후 import)
+from settings import SettingsService  # noqa: E402
+
+
+class FakeChannel:
+    def __init__(self, channel_id: int, name: str = "channel", guild=None):
+        self.id = channel_id
+        self.name = name
+        self.guild = guild
+        self.members: list = []
+        self.sent_messages = 0
+        self.sent_bytes = 0
+        self.sent_files = 0
+
+    async def send(self, content: str = "", **kwargs):
+        self.sent_messages += 1
+        self.sent_bytes += len((content or "").encode("utf-8"))
+        if kwargs.get("file") is not None:
+            self.sent_files += 1
+
+    def __repr__(self):
+        return f"<FakeChannel id={self.id} name={self.name!r}>"
+
+
+class FakeVoiceState:
+    def __init__(self, channel: FakeChannel | None = None, self_mute: bool = False):
+        self.channel = channel
+        self.self_mute = self_mute
+
+
+class FakeMember:
+    def __init__(
+        self,
+        member_id: int,
+        name: str,
+        display_name: str | None = None,
+        global_name: str | None = None,
+        bot: bool = False,
+        guild=None,
+    ):
+        self.id = member_id
+        self.name = name
+        self.display_name = display_name or name
+        self.global_name = global_name
+        self.nick = None
+        self.bot = bot
+        self.guild = guild
+        self.roles: list = []
+
+    @property
+    def mention(self) -> str:
+        return f"<@{self.id}>"
+
+    def __repr__(self):
+        return f"<FakeMember id={self.id} name={self.display_name!r}>"
+
+
+class FakeGuild:
+    def __init__(self, guild_id: int, name: str = "guild"):
+        self.id = guild_id
+        self.name = name
+        self.members: list[FakeMember] = []
+        self._channels: dict[int, FakeChannel] = {}
+        # discord.py 의 Guild 처럼 id 조회는 dict로 합니다. 큰 서버 벤치마크에서 가짜 객체가 병목이 되지 않도록 합니다.
+        self._members: dict[int, FakeMember] = {}
+
+    def add_member(self, member: FakeMember) -> FakeMember:
+        member.guild = self
+        self.members.append(member)
+        self._members[member.id] = member
+        return member
+
+    def add_channel(self, channel: FakeChannel) -> FakeChannel:
+        channel.guild = self
+        self._channels[channel.id] = channel
+        return channel
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    def get_member(self, member_id: int):
+        return self._members.get(member_id)
+
+
+class FakeMessage:
+    def __init__(self, author: FakeMember, content: str, channel: FakeChannel, guild: FakeGuild | None):
+        self.author = author
+        self.content = content
+        self.channel = channel
+        self.guild = guild
+
+
+class FakeBot:
+    """cog 생성자와 핸들러가 참조하는 최소한의 Bot 인터페이스."""
+
+    def __init__(self):
+        self.guilds: list[FakeGuild] = []
+        self.all_commands: dict = {}
+        self._channels: dict[int, FakeChannel] = {}
+        self._cogs: dict = {}
+        self.dispatched: Counter = Counter()
+        # 동시에 돌리는 벤치마크/테스트끼리 파일을 공유하지 않도록 봇마다 임시 디렉터리를 씁니다.
+        self._tmp = tempfile.TemporaryDirectory(prefix="fakebot_")
+        # 벤치마크에서는 작업을 등록만 하고 실행하지 않습니다.
+        self.scheduler = JobScheduler(os.path.join(self._tmp.name, "scheduler.json"))
+        # 설정 파일 없이 환경변수 기본값으로 시작합니다. 벤치마크는 current 를 build_settings(...)로 바꿔 씁니다.
+        self.settings = SettingsService(os.path.join(self._tmp.name, "settings.json"))
+
+    def add_guild(self, guild: FakeGuild) -> FakeGuild:
+        self.guilds.append(guild)
+        for channel in guild._channels.values():
+            self._channels[channel.id] = channel
+        return guild
+
+    def add_channel(self, channel: FakeChannel) -> FakeChannel:
+        self._channels[channel.id] = channel
+        return channel
+
+    def get_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    async def fetch_channel(self, channel_id: int):
+        return self._channels.get(channel_id)
+
+    def get_guild(self, guild_id: int):
+        return next((g for g in self.guilds if g.id == guild_id), None)
+
+    def get_cog(self, name: str):
+        return self._cogs.get(name)
+
+    def register_cog(self, cog):
+        self._cogs[type(cog).__name__] = cog
+        return cog
+
+    def dispatch(self, event_name: str, *args, **kwargs):
+        self.dispatched[event_name] += 1
+
+    async def wait_until_ready(self):
+        return None
+
+    def is_ready(self) -> bool:
+        return True
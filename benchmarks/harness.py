@@ -0,0 +1,179 @@
+# benchmarks/harness.py
+import argparse
+import asyncio
+import datetime as dt
+import heapq
+import json
+import os
+import platform
+import time
+from typing import Dict, List, Any
+
+from time_utils import now_kst
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * (pct / 100.0)
+    lo = int(k)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def latency_summary(latencies: List[float]) -> Dict[str, float]:
+    values = sorted(latencies)
+    return {
+        "p50_ms": round(percentile(values, 50) * 1000, 4),
+        "p99_ms": round(percentile(values, 99) * 1000, 4),
+        "max_ms": round((values[-1] if values else 0.0) * 1000, 4),
+    }
+
+
+class Timer:
+    def __init__(self):
+        self.latencies: List[float] = []
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.latencies.append(time.perf_counter() - self._started)
+        return False
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "recorded_at": now_kst().isoformat(),
+    }
+
+
+def write_report(path: str, report: Dict[str, Any]):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def compare_to_baseline(path: str, results: Dict[str, Dict[str, Any]], keys: List[str]) -> List[str]:
+    """기록된 기준값과 현재 결과를 시나리오별로 비교한 줄 목록을 반환합니다."""
+    with open(path, "r", encoding="utf-8") as f:
+        baseline = json.load(f).get("results", {})
+
+    lines = []
+    for scenario, current in results.items():
+        base = baseline.get(scenario)
+        if not base:
+            lines.append(f"{scenario}: 기준값 없음")
+            continue
+        for key in keys:
+            if key not in current or not base.get(key):
+                continue
+            ratio = current[key] / base[key]
+            lines.append(f"{scenario}.{key}: {base[key]} -> {current[key]} ({ratio:.2f}x)")
+    return lines
+
+
+class NoSleepAsyncio:
+    """모듈의 asyncio를 이것으로 바꾸면 asyncio.sleep만 즉시 반환하고 나머지는 그대로 씁니다."""
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    @staticmethod
+    async def sleep(_delay, result=None):
+        return result
+
+
+class VirtualClock:
+    """모듈의 asyncio / now_kst 를 대신하는 가상 시계.
+
+    asyncio.sleep은 가상 시각으로 예약만 하고, advance_to()로 시계를 넘길 때 예정 시각 순서대로 깨웁니다.
+    debounce나 유예 시간 같은 대기를 건너뛰지 않으면서도 실제로 기다리지는 않습니다.
+    """
+
+    SETTLE_STEPS = 10  # 깨운 작업이 다음 sleep이나 완료까지 진행하도록 이벤트 루프에 양보하는 횟수
+
+    def __init__(self, start: dt.datetime):
+        self.current = start
+        self._sleepers: list = []  # (예정 시각, 순번, future) heap
+        self._seq = 0
+
+    def __getattr__(self, name):
+        return getattr(asyncio, name)
+
+    def now(self) -> dt.datetime:
+        return self.current
+
+    async def sleep(self, delay, result=None):
+        if delay <= 0:
+            await asyncio.sleep(0)
+            return result
+        future = asyncio.get_running_loop().create_future()
+        self._seq += 1
+        heapq.heappush(self._sleepers, (self.current + dt.timedelta(seconds=delay), self._seq, future))
+        await future
+        return result
+
+    async def _settle(self):
+        for _ in range(self.SETTLE_STEPS):
+            await asyncio.sleep(0)
+
+    async def advance_to(self, moment: dt.datetime):
+        # 방금 만든 작업이 sleep을 예약할 기회를 먼저 줍니다.
+        await self._settle()
+        while self._sleepers and self._sleepers[0][0] <= moment:
+            due, _, future = heapq.heappop(self._sleepers)
+            self.current = max(self.current, due)
+            if not future.done():  # 취소된 작업의 sleep은 건너뜁니다.
+                future.set_result(None)
+                await self._settle()
+        self.current = max(self.current, moment)
+
+    async def advance(self, seconds: float):
+        await self.advance_to(self.current + dt.timedelta(seconds=seconds))
+
+
+REPORT_ARGS = ("output", "save_baseline", "baseline")
+
+
+def add_report_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--save-baseline", help="결과를 기준값으로 저장할 경로")
+    parser.add_argument("--baseline", help="비교할 기준값 JSON 경로")
+
+
+def finish_report(
+    name: str,
+    args: argparse.Namespace,
+    results: Dict[str, Dict[str, Any]],
+    compare_keys: List[str],
+    **extra: Any,
+) -> Dict[str, Any]:
+    """결과를 출력하고, --output / --save-baseline 으로 저장하고, --baseline 과 비교합니다."""
+    report = {
+        "benchmark": name,
+        "params": {k: v for k, v in vars(args).items() if k not in REPORT_ARGS},
+        "environment": environment(),
+        **extra,
+        "results": results,
+    }
+    for scenario, result in results.items():
+        print(f"[{scenario}]")
+        for key, value in result.items():
+            print(f"  {key}: {value}")
+
+    if args.output:
+        write_report(args.output, report)
+    if args.save_baseline:
+        write_report(args.save_baseline, report)
+        print(f"기준값 저장: {args.save_baseline}")
+    if args.baseline:
+        print("[baseline 비교]")
+        for line in compare_to_baseline(args.baseline, results, compare_keys):
+            print(f"  {line}")
+    return report
@@ -1,8 +1,26 @@
 # bot.py
+import hashlib
+import json
+import logging
+import os
+import subprocess  # [추가] 깃 명령어 실행용 (로컬 실행 시 build_info.txt가 없을 때만)
+from functools import lru_cache
+from pathlib import Path
+
 import discord
-import subprocess  # [추가] 깃 명령어 실행용
 from discord.ext import commands
-from config import REPORT_CHANNEL_ID_DEPLOY
+from config import SETTINGS_FILE
+from scheduler import JobScheduler
+from settings import SettingsService
+from startup_report import startup
+
+BASE_DIR = Path(__file__).resolve().parent
+# redeploy.sh가 이미지 빌드 전에 만들어 두는 파일 (1줄: 해시, 2줄: 작성자, 3줄: 커밋 메시지)
+BUILD_INFO_FILE = BASE_DIR / "build_info.txt"
+COMMAND_SYNC_FILE = BASE_DIR / "data" / "command_sync.json"
+SCHEDULER_FILE = BASE_DIR / "data" / "scheduler.json"
+
+log = logging.getLogger("bot")
 
 intents = discord.Intents.default()
 intents.guilds = True
@@ -11,41 +29,111 @@ intents.members = True
 intents.message_content = True
 
 bot = commands.Bot(command_prefix="!", intents=intents)
+# 정기 작업(주간 리포트, 공부 알림 등)은 cog들이 여기에 등록합니다.
+bot.scheduler = JobScheduler(str(SCHEDULER_FILE))
+# cog들은 작업마다 bot.settings.current 를 읽습니다. 파일 감시는 cogs/config_watcher.py 가 맡습니다.
+bot.settings = SettingsService(SETTINGS_FILE)
+
+# 재연결 시에도 on_ready가 다시 호출되므로, 최초 1회만 실행할 작업을 구분합니다.
+_startup_done = False
+
 
-# [추가] 최신 커밋 정보를 가져오는 함수
+def _read_build_info() -> list[str] | None:
+    if BUILD_INFO_FILE.exists():
+        lines = BUILD_INFO_FILE.read_text(encoding="utf-8").splitlines()
+        if len(lines) >= 3:
+            return lines[:3]
+    # 로컬 개발 환경: 깃 명령어 한 번으로 세 값을 모두 가져옵니다.
+    out = subprocess.check_output(
+        ["git", "log", "-1", "--pretty=format:%h%n%an%n%s"], encoding="utf-8", cwd=BASE_DIR
+    )
+    lines = out.splitlines()
+    return lines[:3] if len(lines) >= 3 else None
+
+
+# [추가] 최신 커밋 정보를 가져오는 함수 (프로세스당 한 번만 읽습니다)
+@lru_cache(maxsize=None)
 def get_git_commit_info():
     try:
-        # 최신 커밋 메시지 가져오기
-        msg = subprocess.check_output(['git', 'log', '-1', '--pretty=%s'], encoding='utf-8').strip()
-        # 최신 커밋 해시(짧게) 가져오기
-        sha = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], encoding='utf-8').strip()
-        # 작성자 가져오기
-        author = subprocess.check_output(['git', 'log', '-1', '--pretty=%an'], encoding='utf-8').strip()
-        
+        info = _read_build_info()
+        if not info:
+            raise ValueError("빌드 정보 형식이 올바르지 않습니다.")
+        sha, author, msg = info
         return f"{msg} (`{sha}` by {author})"
     except Exception as e:
-        print(f"[WARNING] 커밋 정보 가져오기 실패: {e}")
+        log.warning("커밋 정보 가져오기 실패: %s", e)
         return "커밋 정보를 불러올 수 없습니다."
 
+
+def _command_tree_hash() -> str:
+    payload = sorted(
+        (cmd.to_dict(bot.tree) for cmd in bot.tree.get_commands()),
+        key=lambda c: (c.get("type", 1), c["name"]),
+    )
+    raw = json.dumps(
+        {"application_id": bot.application_id, "commands": payload},
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _load_synced_hash() -> str | None:
+    try:
+        with open(COMMAND_SYNC_FILE, "r", encoding="utf-8") as f:
+            return json.load(f).get("hash")
+    except (OSError, ValueError):
+        return None
+
+
+def _save_synced_hash(tree_hash: str):
+    os.makedirs(COMMAND_SYNC_FILE.parent, exist_ok=True)
+    with open(COMMAND_SYNC_FILE, "w", encoding="utf-8") as f:
+        json.dump({"hash": tree_hash}, f)
+
+
+async def sync_command_tree_if_changed():
+    tree_hash = _command_tree_hash()
+    if tree_hash == _load_synced_hash():
+        log.debug("slash commands unchanged, sync skipped (%s)", tree_hash[:12])
+        return
+    synced = await bot.tree.sync()
+    _save_synced_hash(tree_hash)
+    log.info("slash commands synced: %d (%s)", len(synced), tree_hash[:12])
+
 @bot.event
 async def on_ready():
-    print(f"Logged in as {bot.user} (id={bot.user.id})")
-    print(f"[DEBUG] deploy channel id: {REPORT_CHANNEL_ID_DEPLOY}")
+    log.info("Logged in as %s (id=%s)", bot.user, bot.user.id)
+    global _startup_done
+    if _startup_done:
+        log.info("재연결 감지: 명령어 동기화와 배포 알림 생략")
+        return
+    _startup_done = True
+    startup.end("ready")
+    startup.finish()
+    logging.getLogger("startup").info(
+        "시작 시간: %s",
+        ", ".join(startup.lines()),
+        extra={"durations": startup.durations, "total": startup.total},
+    )
+    # 채널 조회가 가능해진 뒤에 정기 작업(놓친 실행 포함)을 시작합니다.
+    bot.scheduler.start()
+    deploy_channel_id = bot.settings.current.report_channel_id_deploy
+    log.debug("deploy channel id: %s", deploy_channel_id)
 
     try:
-        synced = await bot.tree.sync()
-        print(f"[DEBUG] slash commands synced: {len(synced)}")
-    except Exception as e:
-        print(f"[DEBUG] slash sync error: {e}")
+        await sync_command_tree_if_changed()
+    except Exception:
+        log.exception("slash sync error")
 
     # ---------------------------------------------------------
     # 배포 완료 알림 (커밋 정보 포함)
     # ---------------------------------------------------------
-    if REPORT_CHANNEL_ID_DEPLOY:
+    if deploy_channel_id:
         try:
-            channel = bot.get_channel(REPORT_CHANNEL_ID_DEPLOY)
+            channel = bot.get_channel(deploy_channel_id)
             if not channel:
-                channel = await bot.fetch_channel(REPORT_CHANNEL_ID_DEPLOY)
+                channel = await bot.fetch_channel(deploy_channel_id)
             
             if channel:
                 # 커밋 정보 조회
@@ -57,13 +145,17 @@ async def on_ready():
                     color=discord.Color.green()
                 )
                 embed.add_field(name="최신 커밋 내용", value=commit_info, inline=False)
+                embed.add_field(name="시작 시간", value="\n".join(startup.lines()), inline=False)
+                if startup.failures:
+                    failed = "\n".join(f"{name}: {err}" for name, err in startup.failures.items())
+                    embed.add_field(name="⚠️ 로드 실패 확장", value=failed[:1024], inline=False)
                 embed.set_footer(text=f"버전: {bot.user.name} | 현재 시간 정상 작동 중")
                 
                 await channel.send(embed=embed)
-                print(f"[DEBUG] 배포 알림 전송 완료: channel={REPORT_CHANNEL_ID_DEPLOY}")
+                log.info("배포 알림 전송 완료: channel=%s", deploy_channel_id)
                 
-        except Exception as e:
-            print(f"[ERROR] 배포 알림 전송 실패: {e}")
+        except Exception:
+            log.exception("배포 알림 전송 실패")
     else:
-        print("[DEBUG] REPORT_CHANNEL_ID_DEPLOY 미설정으로 배포 알림 생략")
+        log.info("report_channel_id_deploy 미설정으로 배포 알림 생략")
             
@@ -0,0 +1,71 @@
+# cogs/config_watcher.py
+import asyncio
+import logging
+
+from discord.ext import commands, tasks
+
+SETTINGS_POLL_SECONDS = 10
+MESSAGE_LIMIT = 1900  # 디스코드 메시지 2000자 제한에 여유를 둡니다.
+
+log = logging.getLogger("settings")
+
+
+class ConfigCog(commands.Cog):
+    """설정 파일(bot.settings)을 주기적으로 확인해 바뀐 값을 적용하고 config_update 이벤트로 알립니다."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    async def cog_load(self) -> None:
+        self.settings_poller.start()
+
+    def cog_unload(self):
+        self.settings_poller.cancel()
+
+    async def _apply(self, force: bool = False) -> list[str]:
+        service = self.bot.settings
+        # 파일 읽기는 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+        changed = await asyncio.to_thread(service.reload if force else service.reload_if_changed)
+        if changed:
+            # 값을 캐시해 둔 cog(DiagnosticsCog 등)는 on_config_update 로 새 값을 반영합니다.
+            self.bot.dispatch("config_update", changed)
+        return changed
+
+    @tasks.loop(seconds=SETTINGS_POLL_SECONDS)
+    async def settings_poller(self):
+        try:
+            await self._apply()
+        except Exception:
+            log.exception("설정 파일 확인 실패")
+
+    @commands.group(name="config", invoke_without_command=True)
+    @commands.has_permissions(administrator=True)
+    async def config(self, ctx: commands.Context):
+        service = self.bot.settings
+        lines = [f"현재 설정 ({service.path}):"]
+        lines += [f"- {line}" for line in service.describe()]
+        if service.last_error:
+            lines.append(f"⚠️ 마지막 설정 파일 적용 실패 (이전 값 유지): {service.last_error}")
+        chunk = ""
+        for line in lines:
+            if len(chunk) + len(line) + 1 > MESSAGE_LIMIT:
+                await ctx.send(chunk)
+                chunk = ""
+            chunk += line + "\n"
+        if chunk:
+            await ctx.send(chunk)
+
+    @config.command(name="reload")
+    @commands.has_permissions(administrator=True)
+    async def config_reload(self, ctx: commands.Context):
+        changed = await self._apply(force=True)
+        if self.bot.settings.last_error:
+            await ctx.send(f"설정 파일 적용 실패, 이전 값을 유지합니다: {self.bot.settings.last_error}")
+        elif changed:
+            await ctx.send("설정 변경 적용: " + ", ".join(changed))
+        else:
+            await ctx.send("바뀐 설정이 없습니다.")
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(ConfigCog(bot))
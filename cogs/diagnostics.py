@@ -0,0 +1,90 @@
+# cogs/diagnostics.py
+import io
+import logging
+
+import discord
+from discord.ext import commands
+
+from loop_monitor import LoopLagMonitor, SamplingProfiler, profile_loop_pstats
+from time_utils import now_kst
+
+MAX_PROFILE_SECONDS = 120
+PROFILE_FORMATS = ("collapsed", "pstats")
+
+log = logging.getLogger("loop")
+
+
+class DiagnosticsCog(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.monitor = LoopLagMonitor(threshold=bot.settings.current.loop_lag_threshold_ms / 1000)
+        self.profiling = False
+
+    async def cog_load(self) -> None:
+        self.monitor.start()
+
+    def cog_unload(self) -> None:
+        self.monitor.stop()
+
+    @commands.Cog.listener()
+    async def on_config_update(self, changed: list[str]):
+        if "loop_lag_threshold_ms" in changed:
+            self.monitor.threshold = self.bot.settings.current.loop_lag_threshold_ms / 1000
+
+    @commands.command(name="looplag")
+    @commands.has_permissions(administrator=True)
+    async def looplag(self, ctx: commands.Context):
+        await ctx.send(
+            "이벤트 루프 지연 현황:\n"
+            f"- 최근: {self.monitor.last_lag * 1000:.1f}ms\n"
+            f"- 최대: {self.monitor.max_lag * 1000:.1f}ms\n"
+            f"- 기준({self.monitor.threshold * 1000:.0f}ms) 초과 횟수: {self.monitor.slow_count}"
+        )
+        self.monitor.reset()
+
+    @commands.command(name="jobs")
+    @commands.has_permissions(administrator=True)
+    async def jobs(self, ctx: commands.Context):
+        lines = self.bot.scheduler.describe()
+        if not lines:
+            await ctx.send("등록된 정기 작업이 없습니다.")
+            return
+        await ctx.send("등록된 정기 작업:\n" + "\n".join(f"- {line}" for line in lines))
+
+    @commands.command(name="profile")
+    @commands.has_permissions(administrator=True)
+    async def profile(self, ctx: commands.Context, seconds: int = 10, fmt: str = "collapsed"):
+        fmt = fmt.lower()
+        if fmt not in PROFILE_FORMATS:
+            await ctx.send(f"지원하는 형식: {', '.join(PROFILE_FORMATS)}")
+            return
+        if self.profiling:
+            await ctx.send("이미 프로파일링이 진행 중입니다.")
+            return
+        seconds = max(1, min(seconds, MAX_PROFILE_SECONDS))
+
+        self.profiling = True
+        try:
+            await ctx.send(f"{seconds}초 동안 프로파일링합니다 ({fmt})...")
+            stamp = now_kst().strftime("%Y%m%d-%H%M%S")
+            if fmt == "pstats":
+                data = await profile_loop_pstats(seconds)
+                filename = f"profile-{stamp}.pstats"
+                summary = "`python -m pstats` 또는 snakeviz로 열어보세요."
+            else:
+                profiler = SamplingProfiler(self.monitor.loop_thread_id)
+                await profiler.run(seconds)
+                data = profiler.collapsed().encode("utf-8")
+                filename = f"profile-{stamp}.collapsed.txt"
+                summary = f"샘플 {profiler.sample_count}개 (flamegraph.pl / speedscope로 열어보세요)"
+            await ctx.send(summary, file=discord.File(io.BytesIO(data), filename=filename))
+            log.info("프로파일 업로드 완료: %s (%d bytes)", filename, len(data))
+        except Exception:
+            log.exception("프로파일링 실패")
+            await ctx.send("프로파일링 중 오류가 발생했습니다.")
+        finally:
+            self.profiling = False
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(DiagnosticsCog(bot))
@@ -0,0 +1,207 @@
+# cogs/member_directory.py
+import logging
+import random
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+log = logging.getLogger("members")
+
+
+def normalize_name(s: Optional[str]) -> str:
+    return (s or "").replace(" ", "").lower()
+
+
+def _name_keys(member: discord.Member) -> Tuple[str, ...]:
+    keys = {
+        normalize_name(getattr(member, "display_name", "")),
+        normalize_name(getattr(member, "name", "")),
+        normalize_name(getattr(member, "global_name", None)),
+    }
+    keys.discard("")
+    return tuple(keys)
+
+
+def _role_ids(member: discord.Member) -> Tuple[int, ...]:
+    return tuple(role.id for role in getattr(member, "roles", []) or [])
+
+
+class GuildIndex:
+    """한 서버의 봇이 아닌 멤버 목록과 이름/역할 색인."""
+
+    def __init__(self):
+        self.humans: Dict[int, discord.Member] = {}
+        self.by_name: Dict[str, Set[int]] = {}
+        self.by_role: Dict[int, Set[int]] = {}
+        self._keys: Dict[int, Tuple[str, ...]] = {}
+        self._roles: Dict[int, Tuple[int, ...]] = {}
+
+    def add(self, member: discord.Member):
+        if member.bot:
+            return
+        self.remove(member.id)
+        self.humans[member.id] = member
+        keys = _name_keys(member)
+        roles = _role_ids(member)
+        self._keys[member.id] = keys
+        self._roles[member.id] = roles
+        for key in keys:
+            self.by_name.setdefault(key, set()).add(member.id)
+        for role_id in roles:
+            self.by_role.setdefault(role_id, set()).add(member.id)
+
+    def remove(self, member_id: int):
+        if self.humans.pop(member_id, None) is None:
+            return
+        for key in self._keys.pop(member_id, ()):
+            ids = self.by_name.get(key)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self.by_name[key]
+        for role_id in self._roles.pop(member_id, ()):
+            ids = self.by_role.get(role_id)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self.by_role[role_id]
+
+    def _members(self, ids: Iterable[int]) -> List[discord.Member]:
+        return [self.humans[i] for i in ids if i in self.humans]
+
+    def _sorted_members(self, ids: Iterable[int]) -> List[discord.Member]:
+        # 이름 색인은 set 이라 순서가 매번 달라지므로, 후보 목록은 표시 이름, id 순으로 고정합니다.
+        return sorted(self._members(ids), key=lambda m: (m.display_name, m.id))
+
+
+class MemberDirectory:
+    """서버별 GuildIndex 묶음. 처음 조회하는 서버는 guild.members로 한 번 색인을 만듭니다."""
+
+    def __init__(self):
+        self.guilds: Dict[int, GuildIndex] = {}
+
+    def build(self, guild: discord.Guild) -> GuildIndex:
+        index = GuildIndex()
+        for member in guild.members:
+            index.add(member)
+        self.guilds[guild.id] = index
+        return index
+
+    def index(self, guild: discord.Guild) -> GuildIndex:
+        return self.guilds.get(guild.id) or self.build(guild)
+
+    def drop(self, guild_id: int):
+        self.guilds.pop(guild_id, None)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def humans(self, guild: discord.Guild) -> List[discord.Member]:
+        return list(self.index(guild).humans.values())
+
+    def human_count(self, guild: discord.Guild) -> int:
+        return len(self.index(guild).humans)
+
+    def humans_except(self, guild: discord.Guild, excluded_ids: Iterable[int]) -> List[discord.Member]:
+        excluded = set(excluded_ids)
+        return [m for uid, m in self.index(guild).humans.items() if uid not in excluded]
+
+    def random_human(self, guild: discord.Guild) -> Optional[discord.Member]:
+        humans = self.index(guild).humans
+        if not humans:
+            return None
+        return random.choice(list(humans.values()))
+
+    def find_exact(self, guild: discord.Guild, name: str) -> List[discord.Member]:
+        index = self.index(guild)
+        return index._sorted_members(index.by_name.get(normalize_name(name), ()))
+
+    def find_partial(self, guild: discord.Guild, name: str) -> List[discord.Member]:
+        # 멤버 수가 아니라 서로 다른 이름 키 수만큼만 훑습니다.
+        target = normalize_name(name)
+        index = self.index(guild)
+        ids: Set[int] = set()
+        for key, members in index.by_name.items():
+            if target in key:
+                ids |= members
+        return index._sorted_members(ids)
+
+    def members_with_role(self, guild: discord.Guild, role_id: int) -> List[discord.Member]:
+        index = self.index(guild)
+        return index._members(index.by_role.get(role_id, ()))
+
+
+def get_member_directory(bot: commands.Bot) -> MemberDirectory:
+    """MemberDirectoryCog가 없으면(로드 실패 등) 매번 새로 색인하는 임시 디렉터리를 돌려줍니다."""
+    cog = bot.get_cog("MemberDirectoryCog")
+    return cog.directory if cog is not None else MemberDirectory()
+
+
+class MemberDirectoryCog(commands.Cog):
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.directory = MemberDirectory()
+
+    def _index_if_built(self, guild_id: int) -> Optional[GuildIndex]:
+        # 아직 한 번도 조회하지 않은 서버는 조회 시점에 통째로 색인하므로 여기서 만들 필요가 없습니다.
+        return self.directory.guilds.get(guild_id)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        for guild in self.bot.guilds:
+            self.directory.build(guild)
+        total = sum(len(index.humans) for index in self.directory.guilds.values())
+        log.info(
+            "멤버 색인 완료 guilds=%d humans=%d",
+            len(self.directory.guilds),
+            total,
+            extra={"guilds": len(self.directory.guilds), "humans": total},
+        )
+
+    @commands.Cog.listener()
+    async def on_guild_available(self, guild: discord.Guild):
+        self.directory.build(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_join(self, guild: discord.Guild):
+        self.directory.build(guild)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        self.directory.drop(guild.id)
+
+    @commands.Cog.listener()
+    async def on_member_join(self, member: discord.Member):
+        index = self._index_if_built(member.guild.id)
+        if index is not None:
+            index.add(member)
+
+    @commands.Cog.listener()
+    async def on_raw_member_remove(self, payload: discord.RawMemberRemoveEvent):
+        index = self._index_if_built(payload.guild_id)
+        if index is not None:
+            index.remove(payload.user.id)
+
+    @commands.Cog.listener()
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.nick == after.nick and before.roles == after.roles:
+            return
+        index = self._index_if_built(after.guild.id)
+        if index is not None:
+            index.add(after)
+
+    @commands.Cog.listener()
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if before.name == after.name and before.global_name == after.global_name:
+            return
+        for guild_id, index in self.directory.guilds.items():
+            member = index.humans.get(after.id)
+            if member is None:
+                continue
+            guild = self.bot.get_guild(guild_id)
+            index.add((guild.get_member(after.id) if guild else None) or member)
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(MemberDirectoryCog(bot))
@@ -2,7 +2,7 @@
 import discord
 from discord.ext import commands
 
-from config import MENTION_CHANNEL_ID
+from cogs.member_directory import get_member_directory
 
 class MentionShortcutCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
@@ -30,41 +30,28 @@ class MentionShortcutCog(commands.Cog):
 
         base_cmd = raw.split()[0].lower()
 
-        # [핵심] 이미 존재하는 명령어(menu, voicetime 등)라면
+        # [핵심] 이미 존재하는 명령어(menu, voicetime, profile 등)라면
         # 여기서 아무것도 하지 말고 함수를 종료해야 합니다.
         # 그래야 봇이 기본 기능으로 딱 한 번만 실행합니다.
-        if base_cmd in {"menu", "voicetime"}:
+        if base_cmd in self.bot.all_commands:
             return
 
         # ---------------------------------------------------------
         # 아래는 명령어가 아닐 때만 작동하는 '멘션 단축키' 기능입니다.
         # ---------------------------------------------------------
 
-        def normalize(s: str) -> str:
-            return (s or "").replace(" ", "").lower()
-
         if " " in raw:
             target = raw.split(" ", 1)[0]
         else:
             target = raw
-        target_n = normalize(target)
-
-        def is_match(m: discord.Member) -> bool:
-            display = getattr(m, "display_name", "")
-            uname = getattr(m, "name", "")
-            gname = getattr(m, "global_name", None) or ""
-            return (
-                normalize(display) == target_n
-                or normalize(uname) == target_n
-                or normalize(gname) == target_n
-            )
-
-        members = [m for m in message.guild.members if not m.bot]
-        exact_matches = [m for m in members if is_match(m)]
-
-        if MENTION_CHANNEL_ID:
-            target_ch = self.bot.get_channel(MENTION_CHANNEL_ID) \
-                or await self.bot.fetch_channel(MENTION_CHANNEL_ID)
+
+        directory = get_member_directory(self.bot)
+        exact_matches = directory.find_exact(message.guild, target)
+
+        mention_channel_id = self.bot.settings.current.mention_channel_id
+        if mention_channel_id:
+            target_ch = self.bot.get_channel(mention_channel_id) \
+                or await self.bot.fetch_channel(mention_channel_id)
         else:
             target_ch = message.channel
 
@@ -84,17 +71,7 @@ class MentionShortcutCog(commands.Cog):
             return
 
         # 부분 일치 확인
-        def is_partial(m: discord.Member) -> bool:
-            display = getattr(m, "display_name", "")
-            uname = getattr(m, "name", "")
-            gname = getattr(m, "global_name", None) or ""
-            return (
-                target_n in normalize(display)
-                or target_n in normalize(uname)
-                or target_n in normalize(gname)
-            )
-
-        partials = [m for m in members if is_partial(m)]
+        partials = directory.find_partial(message.guild, target)
         if len(partials) == 1:
             await target_ch.send(compose_with_extra(partials[0].mention))
         elif len(partials) > 1:
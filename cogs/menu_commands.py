@@ -1,18 +1,21 @@
 # cogs/menu_commands.py
+import asyncio
+
 import discord
 from discord.ext import commands
 
 from menu_recommender import MenuRecommender
 
 class MenuCog(commands.Cog):
-    def __init__(self, bot: commands.Bot):
+    def __init__(self, bot: commands.Bot, recommender: MenuRecommender):
         self.bot = bot
-        self.recommender = MenuRecommender()
+        self.recommender = recommender
 
     # 슬래시 명령
     @discord.app_commands.command(name="menu", description="무작위로 메뉴를 추천합니다.")
     async def menu_slash(self, interaction: discord.Interaction):
-        self.recommender.reload()
+        # 메뉴 파일 읽기는 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+        await asyncio.to_thread(self.recommender.reload)
         gid = interaction.guild_id
         uid = interaction.user.id if interaction.user else None
         picked = self.recommender.recommend(guild_id=gid, user_id=uid)
@@ -24,7 +27,8 @@ class MenuCog(commands.Cog):
     # prefix 명령
     @commands.command(name="menu")
     async def menu_prefix(self, ctx: commands.Context):
-        self.recommender.reload()
+        # 메뉴 파일 읽기는 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+        await asyncio.to_thread(self.recommender.reload)
         gid = ctx.guild.id if ctx.guild else None
         uid = ctx.author.id if ctx.author else None
         picked = self.recommender.recommend(guild_id=gid, user_id=uid)
@@ -35,4 +39,6 @@ class MenuCog(commands.Cog):
 
 
 async def setup(bot: commands.Bot):
-    await bot.add_cog(MenuCog(bot))
+    # 메뉴/기록 JSON 로드는 다른 확장 로드를 막지 않도록 스레드에서 처리합니다.
+    recommender = await asyncio.to_thread(MenuRecommender)
+    await bot.add_cog(MenuCog(bot, recommender))
@@ -2,6 +2,7 @@
 import asyncio
 import aiohttp
 import json
+import logging
 import os
 from typing import Dict, Set, List, Optional, Any
 
@@ -9,26 +10,62 @@ from discord.ext import commands, tasks
 
 from config import (
     NOTION_TOKEN,
+    NOTION_API_BASE_URL,
     NOTION_DATABASE_FEATURE_ID,
     NOTION_DATABASE_BOARD_ID,
-    REPORT_CHANNEL_ID_FEATURE,
-    REPORT_CHANNEL_ID_ALARM,
+)
+from notion_api import clean_env, notion_headers
+from notion_rows import (
+    CREATED,
+    COMPLETED,
+    STATUS_CHANGED,
+    RENAMED,
+    DESCRIBED,
+    REASSIGNED,
+    EVENT_KINDS,
+    ChangeEvent,
+    RowFingerprint,
+    diff_rows,
+    prune_fingerprints,
 )
 
-
-def _is_completed_status(name: str) -> bool:
-    n = (name or "").strip().lower()
-    if not n:
-        return False
-    return ("완료" in n) or (n in {"done", "completed", "complete"})
-
-
-def _any_completed(status_names: List[str]) -> bool:
-    return any(_is_completed_status(n) for n in status_names)
-
-
-def _clean_env(val: Optional[str]) -> str:
-    return str(val).strip() if val else ""
+# 이벤트 종류별 알림 헤더. 신규 row는 완료 여부에 따라 요청/추가 헤더로 나뉩니다.
+NOTIFY_HEADERS = {
+    CREATED: "기능 요청이 들어왔습니다 ✨",
+    COMPLETED: "기능이 추가됐습니다 ✅",
+    STATUS_CHANGED: "기능 상태가 변경됐습니다 🔄",
+    RENAMED: "기능 제목이 변경됐습니다 ✏️",
+    DESCRIBED: "기능 설명이 변경됐습니다 📝",
+    REASSIGNED: "기능 담당자가 변경됐습니다 👤",
+}
+
+# 한 번에 조회하는 최근 수정 row 수와, 기억해 둘 row 해시 수.
+# 조회 범위(50개) 밖으로 밀려난 row도 한동안 기억해 두어야 다시 수정됐을 때 새 row로 오인하지 않습니다.
+QUERY_PAGE_SIZE = 50
+MAX_FEATURE_FINGERPRINTS = QUERY_PAGE_SIZE * 10
+
+# 변화 없는 폴링 요약은 60초마다 찍히므로 이 간격에 한 줄만 남깁니다.
+POLL_SUMMARY_LOG_SECONDS = 10 * 60
+
+log = logging.getLogger("notion")
+
+
+def _log_poll(db: str, stored: int, fetched: int, new: int):
+    log.info(
+        "%s DB 폴링 stored=%d fetched=%d new=%d",
+        db,
+        stored,
+        fetched,
+        new,
+        extra={
+            "db": db,
+            "stored": stored,
+            "fetched": fetched,
+            "new": new,
+            "rate_limit": 0 if new else POLL_SUMMARY_LOG_SECONDS,
+            "rate_key": f"poll:{db}",
+        },
+    )
 
 
 class NotionWatcherCog(commands.Cog):
@@ -36,49 +73,61 @@ class NotionWatcherCog(commands.Cog):
         self.bot = bot
         self.db_file = "data/notion_db.json"
 
-        self.last_notion_row_ids: Set[str] = set()
-        self.last_feature_status_by_id: Dict[str, str] = {}
+        self.feature_rows: Dict[str, RowFingerprint] = {}
         self.last_board_row_ids: Set[str] = set()
 
-        self.load_state()
+    @property
+    def notify_events(self) -> Set[str]:
+        # 설정 파일(notion_feature_notify_events)을 바꾸면 다음 폴링부터 바로 반영됩니다.
+        return set(self.bot.settings.current.notion_feature_notify_events)
 
     def load_state(self):
         if not os.path.exists(self.db_file) or os.path.getsize(self.db_file) == 0:
-            print(f"[NOTION] {self.db_file} 파일이 없거나 비어 있어 새로 시작합니다.")
+            log.info("%s 파일이 없거나 비어 있어 새로 시작합니다.", self.db_file)
             return
         try:
             with open(self.db_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
-                self.last_notion_row_ids = set(data.get("features", []))
-                self.last_feature_status_by_id = data.get("feature_statuses", {})
-                self.last_board_row_ids = set(data.get("boards", []))
-            print(f"[NOTION] {self.db_file} 로드 완료.")
-        except Exception as e:
-            print(f"[NOTION] 로드 중 오류: {e}")
+            if "feature_rows" in data:
+                self.feature_rows = {
+                    row_id: RowFingerprint.from_list(fp) for row_id, fp in data["feature_rows"].items()
+                }
+            else:
+                # 예전 형식: 상태 문자열만 있으므로 완료 여부만 아는 해시로 옮깁니다.
+                statuses = data.get("feature_statuses", {})
+                for row_id in set(data.get("features", [])) | set(statuses):
+                    self.feature_rows[row_id] = RowFingerprint.legacy(statuses.get(row_id))
+            self.last_board_row_ids = set(data.get("boards", []))
+            log.info("%s 로드 완료.", self.db_file)
+        except Exception:
+            log.exception("상태 로드 중 오류")
 
     def save_state(self):
         data = {
-            "features": list(self.last_notion_row_ids),
-            "feature_statuses": self.last_feature_status_by_id,
+            "feature_rows": {row_id: fp.to_list() for row_id, fp in self.feature_rows.items()},
             "boards": list(self.last_board_row_ids),
         }
         try:
             os.makedirs(os.path.dirname(self.db_file), exist_ok=True)
             with open(self.db_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
-        except Exception as e:
-            print(f"[NOTION] 저장 중 오류: {e}")
+                json.dump(data, f, ensure_ascii=False)
+        except Exception:
+            log.exception("상태 저장 중 오류")
 
     async def cog_load(self) -> None:
+        await asyncio.to_thread(self.load_state)
         if NOTION_TOKEN and (NOTION_DATABASE_FEATURE_ID or NOTION_DATABASE_BOARD_ID):
             self.notion_update_poller.start()
         else:
-            print("[NOTION] 설정 부족으로 폴링 안 함")
+            log.warning("설정 부족으로 폴링 안 함")
 
     def cog_unload(self) -> None:
         if self.notion_update_poller.is_running():
             self.notion_update_poller.cancel()
 
+    async def flush(self):
+        await asyncio.to_thread(self.save_state)
+
     async def _send_long_message(self, channel, header, lines):
         if not lines:
             return
@@ -92,29 +141,52 @@ class NotionWatcherCog(commands.Cog):
             await channel.send(current_message)
 
     async def _fetch_notion_db(self, session: aiohttp.ClientSession, db_id: str) -> List[Dict[str, Any]]:
-        clean_db_id = _clean_env(db_id)
+        clean_db_id = clean_env(db_id)
         if not clean_db_id:
             return []
         db_label = clean_db_id[-8:] if len(clean_db_id) > 8 else clean_db_id
-        url = f"https://api.notion.com/v1/databases/{clean_db_id}/query"
-        headers = {
-            "Authorization": f"Bearer {_clean_env(NOTION_TOKEN)}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        }
-        payload = {"page_size": 50, "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}]}
+        url = f"{NOTION_API_BASE_URL}/databases/{clean_db_id}/query"
+        payload = {"page_size": QUERY_PAGE_SIZE, "sorts": [{"timestamp": "last_edited_time", "direction": "descending"}]}
         try:
-            async with session.post(url, headers=headers, json=payload) as resp:
+            async with session.post(url, headers=notion_headers(), json=payload) as resp:
                 if resp.status != 200:
                     text = await resp.text()
-                    print(f"[NOTION] DB 조회 실패 db={db_label} status={resp.status} body={text[:500]}")
+                    log.error(
+                        "DB 조회 실패 status=%s",
+                        resp.status,
+                        extra={"db": db_label, "http_status": resp.status, "body": text[:500]},
+                    )
                     return []
                 data = await resp.json()
                 return data.get("results", [])
-        except Exception as e:
-            print(f"[NOTION] DB 조회 예외 db={db_label}: {e}")
+        except Exception:
+            log.exception("DB 조회 예외", extra={"db": db_label})
             return []
 
+    async def _notify_feature_events(self, events: List[ChangeEvent]):
+        lines_by_header: Dict[str, List[str]] = {}
+        notify_events = self.notify_events
+        for event in events:
+            # 처음 보는 row가 이미 완료 상태면 '기능 추가'(completed)로 보고 알림 대상인지 판단합니다.
+            kind = COMPLETED if event.kind == CREATED and event.row.completed else event.kind
+            if kind not in notify_events:
+                continue
+
+            line = event.row.line()
+            if kind == STATUS_CHANGED:
+                line += f" (상태: {', '.join(event.row.status_names) or '없음'})"
+            elif kind == REASSIGNED:
+                line += f" (담당: {', '.join(event.row.assignees) or '없음'})"
+            lines_by_header.setdefault(NOTIFY_HEADERS[kind], []).append(line)
+
+        channel_id = self.bot.settings.current.report_channel_id_feature
+        if not lines_by_header or not channel_id:
+            return
+        ch = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+        for header, lines in lines_by_header.items():
+            log.info("알림 발송 '%s' count=%d", header, len(lines))
+            await self._send_long_message(ch, header, lines)
+
     @tasks.loop(seconds=60)
     async def notion_update_poller(self):
         if not NOTION_TOKEN:
@@ -123,144 +195,42 @@ class NotionWatcherCog(commands.Cog):
             async with aiohttp.ClientSession() as session:
                 if NOTION_DATABASE_FEATURE_ID:
                     rows = await self._fetch_notion_db(session, NOTION_DATABASE_FEATURE_ID)
-                    new_row_ids = {row["id"] for row in rows}
-                    only_new = new_row_ids - self.last_notion_row_ids
-                    print(
-                        "[NOTION] 기능 DB 폴링 "
-                        f"stored={len(self.last_notion_row_ids)} "
-                        f"fetched={len(new_row_ids)} "
-                        f"new={len(only_new)} "
-                        f"statuses={len(self.last_feature_status_by_id)}"
-                    )
+                    new_count = sum(1 for row in rows if row["id"] not in self.feature_rows)
+                    _log_poll("feature", len(self.feature_rows), len(rows), new_count)
 
-                    if only_new:
+                    if new_count:
+                        # 막 만든 row는 내용이 비어 있는 경우가 많아 잠시 기다렸다가 다시 읽습니다.
                         await asyncio.sleep(20)
                         rows = await self._fetch_notion_db(session, NOTION_DATABASE_FEATURE_ID)
-                        print(
-                            "[NOTION] 기능 DB 신규 감지 후 재조회 "
-                            f"stored={len(self.last_notion_row_ids)} "
-                            f"fetched={len(rows)} "
-                            f"new={len(only_new)}"
-                        )
-
-                    if only_new:
-                        new_req, new_comp = [], []
-                        for row in rows:
-                            if row["id"] not in only_new:
-                                continue
-                            props = row.get("properties", {})
-                            status_names = []
-                            st = props.get("상태") or next(
-                                (
-                                    v
-                                    for v in props.values()
-                                    if isinstance(v, dict) and v.get("type") in ("status", "select", "multi_select")
-                                ),
-                                None,
-                            )
-                            if st:
-                                if st["type"] == "status":
-                                    status_names.append(st["status"]["name"])
-                                elif st["type"] == "select":
-                                    status_names.append(st["select"]["name"])
-                                elif st["type"] == "multi_select":
-                                    status_names.extend(o["name"] for o in st["multi_select"])
-
-                            c_txt = "".join(
-                                x["plain_text"]
-                                for x in (props.get("내용", {}).get("title") or props.get("내용", {}).get("rich_text") or [])
-                            ) or "(내용 없음)"
-                            d_txt = "".join(
-                                x["plain_text"]
-                                for x in (props.get("설명", {}).get("rich_text") or props.get("Description", {}).get("rich_text") or [])
-                            ) or "(설명 없음)"
-                            line = f"- {c_txt} — {d_txt}"
 
-                            if _any_completed(status_names):
-                                new_comp.append(line)
-                            else:
-                                new_req.append(line)
-                            self.last_feature_status_by_id[row["id"]] = ",".join(status_names)
-
-                        ch = self.bot.get_channel(REPORT_CHANNEL_ID_FEATURE) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_FEATURE)
-                        await self._send_long_message(ch, "기능 요청이 들어왔습니다 ✨", new_req)
-                        await self._send_long_message(ch, "기능이 추가됐습니다 ✅", new_comp)
-
-                    st_change = []
-                    for row in rows:
-                        props = row.get("properties", {})
-                        status_names = []
-                        st = props.get("상태") or next(
-                            (
-                                v
-                                for v in props.values()
-                                if isinstance(v, dict) and v.get("type") in ("status", "select", "multi_select")
-                            ),
-                            None,
+                    events, changed = diff_rows(rows, self.feature_rows)
+                    changed = prune_fingerprints(self.feature_rows, MAX_FEATURE_FINGERPRINTS) or changed
+                    if events:
+                        counts = {kind: sum(1 for e in events if e.kind == kind) for kind in EVENT_KINDS}
+                        log.info(
+                            "기능 DB 변경 감지 %s",
+                            " ".join(f"{kind}={count}" for kind, count in counts.items()),
+                            extra={"db": "feature", "events": counts},
                         )
-                        if st:
-                            if st["type"] == "status":
-                                status_names.append(st["status"]["name"])
-                            elif st["type"] == "select":
-                                status_names.append(st["select"]["name"])
-                            elif st["type"] == "multi_select":
-                                status_names.extend(o["name"] for o in st["multi_select"])
-
-                        prev = self.last_feature_status_by_id.get(row["id"])
-                        if prev is not None:
-                            prev_c = _any_completed([p.strip() for p in prev.split(",")])
-                            curr_c = _any_completed(status_names)
-                            if curr_c and not prev_c:
-                                c_txt = "".join(
-                                    x["plain_text"]
-                                    for x in (props.get("내용", {}).get("title") or props.get("내용", {}).get("rich_text") or [])
-                                ) or "(내용 없음)"
-                                d_txt = "".join(
-                                    x["plain_text"]
-                                    for x in (props.get("설명", {}).get("rich_text") or props.get("Description", {}).get("rich_text") or [])
-                                ) or "(설명 없음)"
-                                st_change.append(f"- {c_txt} — {d_txt}")
-                                print(
-                                    "[NOTION] 기능 완료 상태 변경 감지 "
-                                    f"id={row['id']} "
-                                    f"prev='{prev}' "
-                                    f"curr='{','.join(status_names)}' "
-                                    f"title='{c_txt}'"
-                                )
-                        self.last_feature_status_by_id[row["id"]] = ",".join(status_names)
-
-                    print(f"[NOTION] 기능 완료 상태 변경 발송 대상 count={len(st_change)}")
-                    if st_change:
-                        ch = self.bot.get_channel(REPORT_CHANNEL_ID_FEATURE) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_FEATURE)
-                        print(f"[NOTION] 기능이 추가됐습니다 상태 변경 메시지 발송 count={len(st_change)}")
-                        await self._send_long_message(ch, "기능이 추가됐습니다 ✅", st_change)
-
-                    self.last_notion_row_ids = new_row_ids
-                    print(
-                        "[NOTION] 기능 DB 상태 저장 "
-                        f"features={len(self.last_notion_row_ids)} "
-                        f"statuses={len(self.last_feature_status_by_id)}"
-                    )
-                    self.save_state()
+                        await self._notify_feature_events(events)
+                    if changed:
+                        log.debug("기능 DB 상태 저장 features=%d", len(self.feature_rows))
+                        self.save_state()
 
-                if NOTION_DATABASE_BOARD_ID and REPORT_CHANNEL_ID_ALARM:
+                alarm_channel_id = self.bot.settings.current.report_channel_id_alarm
+                if NOTION_DATABASE_BOARD_ID and alarm_channel_id:
                     rows = await self._fetch_notion_db(session, NOTION_DATABASE_BOARD_ID)
                     ids = {r["id"] for r in rows}
-                    print(
-                        "[NOTION] 게시판 DB 폴링 "
-                        f"stored={len(self.last_board_row_ids)} "
-                        f"fetched={len(ids)} "
-                        f"new={len(ids - self.last_board_row_ids)}"
-                    )
+                    _log_poll("board", len(self.last_board_row_ids), len(ids), len(ids - self.last_board_row_ids))
                     if ids - self.last_board_row_ids:
-                        ch = self.bot.get_channel(REPORT_CHANNEL_ID_ALARM) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_ALARM)
+                        ch = self.bot.get_channel(alarm_channel_id) or await self.bot.fetch_channel(alarm_channel_id)
                         await ch.send("게시판에 새로운 글이 올라왔습니다.")
                         self.last_board_row_ids = ids
-                        print(f"[NOTION] 게시판 DB 상태 저장 boards={len(self.last_board_row_ids)}")
+                        log.debug("게시판 DB 상태 저장 boards=%d", len(self.last_board_row_ids))
                         self.save_state()
 
-        except Exception as e:
-            print(f"[NOTION] Error: {e}")
+        except Exception:
+            log.exception("폴링 중 오류")
 
 
 async def setup(bot: commands.Bot):
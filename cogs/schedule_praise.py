@@ -0,0 +1,181 @@
+# cogs/schedule_praise.py
+import datetime as dt
+import logging
+from collections import deque
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+import discord
+from discord.ext import commands, tasks
+
+from config import (
+    NOTION_TOKEN,
+    NOTION_API_BASE_URL,
+    NOTION_DATABASE_SCHEDULE_ID,
+)
+from notion_api import clean_env, notion_headers
+from schedule_index import ScheduleIndex, SCHEDULE_DATE_PROPERTY, parse_schedule_page
+from time_utils import KST, now_kst, to_epoch
+
+SCHEDULE_LOOKBACK_DAYS = 14  # 끝난 지 이만큼 지난 일정은 캐시와 진행도에서 뺍니다.
+# Notion 날짜 필터는 기간 일정도 시작 날짜로만 비교하므로, 시작이 (LOOKBACK + MAX_SPAN)일 안인 일정을 받아
+# 끝 시각으로 다시 거릅니다. 이보다 긴 일정은 끝나기 전이라도 캐시에서 빠집니다.
+SCHEDULE_MAX_SPAN_DAYS = 90
+SCHEDULE_REFRESH_MINUTES = 10
+# 첫 일정 캐시가 준비되기 전에 끝난 세션은 이만큼까지 모아 두었다가 캐시가 준비되면 적립합니다.
+MAX_PENDING_CREDITS = 500
+PRAISE_MESSAGE = "{mention} 🎉 **{title}** 일정 목표({goal}분)를 달성했어요! 누적 {done}분 공부했습니다."
+
+log = logging.getLogger("praise")
+
+
+class SchedulePraiseCog(commands.Cog):
+    """Notion 일정 DB를 캐시해 두고, 음성 채널 공부 시간을 겹치는 일정에 적립해 목표 달성 시 칭찬합니다."""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self.index = ScheduleIndex()
+        self.notion_bot_user_id: Optional[str] = None
+        self.loaded = False  # 첫 일정 캐시 갱신이 끝났는지
+        self._pending_credits: deque = deque(maxlen=MAX_PENDING_CREDITS)
+
+    async def cog_load(self) -> None:
+        if NOTION_TOKEN and NOTION_DATABASE_SCHEDULE_ID:
+            self.schedule_refresher.start()
+        else:
+            log.warning("설정 부족으로 일정 캐시 안 함")
+
+    def cog_unload(self) -> None:
+        if self.schedule_refresher.is_running():
+            self.schedule_refresher.cancel()
+
+    async def _fetch_bot_user_id(self, session: aiohttp.ClientSession) -> Optional[str]:
+        # 봇이 직접 만든 공부 기록은 "일정"이 아니므로 캐시에서 제외하기 위해 통합 사용자 id를 알아둡니다.
+        async with session.get(f"{NOTION_API_BASE_URL}/users/me", headers=notion_headers()) as resp:
+            if resp.status != 200:
+                log.error("Notion 봇 사용자 조회 실패 status=%s", resp.status)
+                return None
+            data = await resp.json()
+            return data.get("id")
+
+    async def _fetch_schedule_pages(self, session: aiohttp.ClientSession, since: dt.date) -> Optional[List[Dict[str, Any]]]:
+        db_id = clean_env(NOTION_DATABASE_SCHEDULE_ID)
+        url = f"{NOTION_API_BASE_URL}/databases/{db_id}/query"
+        started_since = (since - dt.timedelta(days=SCHEDULE_MAX_SPAN_DAYS)).isoformat()
+        payload: Dict[str, Any] = {
+            "page_size": 100,
+            "filter": {"property": SCHEDULE_DATE_PROPERTY, "date": {"on_or_after": started_since}},
+        }
+        pages: List[Dict[str, Any]] = []
+        while True:
+            async with session.post(url, headers=notion_headers(), json=payload) as resp:
+                if resp.status != 200:
+                    text = await resp.text()
+                    log.error(
+                        "일정 DB 조회 실패 status=%s",
+                        resp.status,
+                        extra={"http_status": resp.status, "body": text[:300]},
+                    )
+                    return None
+                data = await resp.json()
+            pages.extend(data.get("results", []))
+            if not data.get("has_more") or not data.get("next_cursor"):
+                return pages
+            payload["start_cursor"] = data["next_cursor"]
+
+    @tasks.loop(minutes=SCHEDULE_REFRESH_MINUTES)
+    async def schedule_refresher(self):
+        since = (now_kst() - dt.timedelta(days=SCHEDULE_LOOKBACK_DAYS)).date()
+        try:
+            async with aiohttp.ClientSession() as session:
+                if self.notion_bot_user_id is None:
+                    self.notion_bot_user_id = await self._fetch_bot_user_id(session)
+                if self.notion_bot_user_id is None:
+                    # 봇 id를 모르면 봇이 만든 공부 기록까지 일정으로 잡히므로, 다음 주기에 다시 시도합니다.
+                    log.warning("Notion 봇 사용자 id를 몰라 일정 캐시 갱신 생략")
+                    return
+                pages = await self._fetch_schedule_pages(session, since)
+        except Exception:
+            log.exception("일정 캐시 갱신 오류")
+            return
+        if pages is None:
+            return
+
+        # 오래전에 시작했어도 아직 끝나지 않은 일정은 남깁니다.
+        cutoff = to_epoch(dt.datetime(since.year, since.month, since.day, tzinfo=KST))
+        parsed = (parse_schedule_page(p, ignore_creator_id=self.notion_bot_user_id) for p in pages)
+        self.index.rebuild(p for p in parsed if p is not None and p.end > cutoff)
+        log.info(
+            "일정 캐시 갱신 fetched=%d indexed=%d",
+            len(pages),
+            len(self.index),
+            extra={"fetched": len(pages), "indexed": len(self.index), "rate_limit": 60 * 60},
+        )
+
+        # 조회 범위를 벗어난 일정의 진행도/칭찬 기록은 더 이상 필요 없습니다.
+        store = self._store()
+        if store is not None:
+            store.retain_schedule_pages(self.index.pages.keys())
+            store.save()
+
+        if not self.loaded:
+            self.loaded = True
+            while self._pending_credits:
+                await self._credit(*self._pending_credits.popleft())
+
+    def _store(self):
+        voice_cog = self.bot.get_cog("VoiceTimeCog")
+        return voice_cog.store if voice_cog is not None else None
+
+    async def _send_praise(self, member: discord.Member, title: str, goal_seconds: int, done_seconds: int):
+        settings = self.bot.settings.current
+        channel_id = settings.report_channel_id_daily or settings.report_channel_id_alarm
+        if not channel_id:
+            return
+        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+        await channel.send(
+            PRAISE_MESSAGE.format(
+                mention=member.mention,
+                title=title,
+                goal=goal_seconds // 60,
+                done=done_seconds // 60,
+            )
+        )
+
+    @commands.Cog.listener()
+    async def on_voice_session_closed(self, member: discord.Member, notion_name: str, start_at: int, end_at: int):
+        if not self.loaded:
+            if self.schedule_refresher.is_running():
+                self._pending_credits.append((member, notion_name, start_at, end_at))
+            return
+        await self._credit(member, notion_name, start_at, end_at)
+
+    async def _credit(self, member: discord.Member, notion_name: str, start_at: int, end_at: int):
+        store = self._store()
+        if store is None or not len(self.index):
+            return
+
+        overlaps = self.index.overlapping(notion_name, start_at, end_at)
+        if not overlaps:
+            return
+
+        praised = []
+        for page, seconds in overlaps:
+            done = store.credit_schedule(page.page_id, seconds)
+            if done >= page.goal_seconds and store.mark_praised(page.page_id):
+                praised.append((page, done))
+        store.save()
+
+        for page, done in praised:
+            try:
+                await self._send_praise(member, page.title, page.goal_seconds, done)
+                log.info("일정 목표 달성 칭찬: %s", notion_name, extra={"page_id": page.page_id})
+            except Exception:
+                # 칭찬 기록을 되돌려, 다음에 이 일정에 공부 시간이 적립될 때 다시 보냅니다.
+                store.unmark_praised(page.page_id)
+                store.save()
+                log.exception("칭찬 메시지 전송 실패", extra={"page_id": page.page_id})
+
+
+async def setup(bot: commands.Bot):
+    await bot.add_cog(SchedulePraiseCog(bot))
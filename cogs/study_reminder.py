@@ -1,48 +1,61 @@
 # cogs/study_reminder.py
 import datetime as dt
-import random
+import logging
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from config import (
     DATA_FILE,
-    MENTION_CHANNEL_ID,
     VOICE_CHANNEL_ID,
 )
+from cogs.member_directory import get_member_directory
 from state_store import StateStore
-from time_utils import KST, now_kst, parse_iso
+from time_utils import now_epoch
 
 RANDOM_STUDY_MESSAGE = "{mention}님 공부하세요!"
 INACTIVE_STUDY_MESSAGE = "{mention}\n{days}일 이상 공부 기록이 없습니다. 공부하세요!"
-INACTIVE_STUDY_DAYS = 3
+STUDY_REMINDER_JOB = "daily_study_reminder"
+STUDY_REMINDER_CRON = "0 12 * * *"  # 매일 12:00 (KST)
+
+log = logging.getLogger("study")
 
 
 class StudyReminderCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
-        self.daily_study_reminder.start()
+
+    async def cog_load(self) -> None:
+        # 점심 알림은 몇 시간 늦는 정도까지만 따라잡습니다. 한밤중에 보내지 않도록 합니다.
+        self.bot.scheduler.register(
+            STUDY_REMINDER_JOB,
+            STUDY_REMINDER_CRON,
+            self.daily_study_reminder,
+            catch_up=dt.timedelta(hours=3),
+            jitter=60,
+        )
 
     def cog_unload(self):
-        self.daily_study_reminder.cancel()
+        self.bot.scheduler.unregister(STUDY_REMINDER_JOB)
 
-    @tasks.loop(time=dt.time(hour=12, minute=0, tzinfo=KST))
     async def daily_study_reminder(self):
-        channel_id = MENTION_CHANNEL_ID
+        settings = self.bot.settings.current
+        channel_id = settings.mention_channel_id
         if not channel_id:
-            print("[STUDY] MENTION_CHANNEL_ID 미설정으로 공부 알림 생략")
+            log.warning("mention_channel_id 미설정으로 공부 알림 생략")
             return
 
         try:
             channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
             guild = getattr(channel, "guild", None)
             if not guild:
-                print("[STUDY] 서버 채널이 아니라 공부 알림을 보낼 수 없습니다.")
+                log.warning("서버 채널이 아니라 공부 알림을 보낼 수 없습니다.")
                 return
 
-            candidates = [member for member in guild.members if not member.bot]
-            if not candidates:
-                print("[STUDY] 태그할 서버 멤버가 없어 공부 알림 생략")
+            directory = get_member_directory(self.bot)
+            random_member = directory.random_human(guild)
+            if random_member is None:
+                log.info("태그할 서버 멤버가 없어 공부 알림 생략")
                 return
 
             allowed_mentions = discord.AllowedMentions(
@@ -51,20 +64,22 @@ class StudyReminderCog(commands.Cog):
                 everyone=False,
             )
 
-            random_member = random.choice(candidates)
             await channel.send(
                 RANDOM_STUDY_MESSAGE.format(mention=random_member.mention),
                 allowed_mentions=allowed_mentions,
             )
-            print(f"[STUDY] 랜덤 공부 알림 전송 완료: {now_kst().isoformat()} user={random_member.id}")
-
-            store = StateStore(DATA_FILE)
-            store.load()
-            cutoff = now_kst() - dt.timedelta(days=INACTIVE_STUDY_DAYS)
-            fallback_iso = store.state.get("study_tracking_started_at")
-            fallback_at = parse_iso(fallback_iso) if fallback_iso else now_kst()
-            if fallback_at.tzinfo is None:
-                fallback_at = fallback_at.replace(tzinfo=KST)
+            log.info("랜덤 공부 알림 전송 완료 user=%s", random_member.id)
+
+            # 음성 시간 cog가 떠 있으면 메모리의 최신 상태를 그대로 사용합니다.
+            voice_cog = self.bot.get_cog("VoiceTimeCog")
+            if voice_cog is not None:
+                store = voice_cog.store
+            else:
+                store = StateStore(DATA_FILE)
+                store.load()
+            now_ts = now_epoch()
+            cutoff = now_ts - settings.inactive_study_days * 24 * 60 * 60
+            fallback_at = store.study_tracking_started_at or now_ts
 
             target_voice = guild.get_channel(VOICE_CHANNEL_ID)
             active_user_ids = {
@@ -74,38 +89,32 @@ class StudyReminderCog(commands.Cog):
             }
 
             inactive_members = []
-            for member in guild.members:
-                if member.bot or member.id in active_user_ids:
-                    continue
-
-                last_study_iso = store.state["last_study_at"].get(str(member.id))
-                last_study_at = parse_iso(last_study_iso) if last_study_iso else fallback_at
-                if last_study_at.tzinfo is None:
-                    last_study_at = last_study_at.replace(tzinfo=KST)
+            for member in directory.humans_except(guild, active_user_ids):
+                last_study_at = store.last_study_at(member.id) or fallback_at
                 if last_study_at <= cutoff:
                     inactive_members.append(member)
 
             if not inactive_members:
-                print("[STUDY] 며칠간 안 들어온 멤버가 없어 공부 알림 생략")
+                log.info("며칠간 안 들어온 멤버가 없어 공부 알림 생략")
                 return
 
             mention_list = " ".join(member.mention for member in inactive_members)
             content = INACTIVE_STUDY_MESSAGE.format(
                 mention=mention_list,
-                days=INACTIVE_STUDY_DAYS,
+                days=settings.inactive_study_days,
             )
             await channel.send(
                 content,
                 allowed_mentions=allowed_mentions,
             )
-            user_ids = ",".join(str(member.id) for member in inactive_members)
-            print(f"[STUDY] 미기록자 공부 알림 전송 완료: {now_kst().isoformat()} users={user_ids}")
-        except Exception as e:
-            print(f"[STUDY] 공부 알림 전송 실패: {e}")
-
-    @daily_study_reminder.before_loop
-    async def before_daily_study_reminder(self):
-        await self.bot.wait_until_ready()
+            user_ids = [member.id for member in inactive_members]
+            log.info(
+                "미기록자 공부 알림 전송 완료 count=%d",
+                len(inactive_members),
+                extra={"user_ids": user_ids},
+            )
+        except Exception:
+            log.exception("공부 알림 전송 실패")
 
 
 async def setup(bot: commands.Bot):
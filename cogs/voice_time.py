@@ -1,57 +1,283 @@
 # cogs/voice_time.py
 import datetime as dt
 import asyncio
+import logging
 import aiohttp
 
 import discord
-from discord.ext import commands, tasks
+from discord.ext import commands
 
 from config import (
     VOICE_CHANNEL_ID,
-    REPORT_CHANNEL_ID_ENTER,
-    REPORT_CHANNEL_ID_ALARM,
     DATA_FILE,
     NOTION_TOKEN,
+    NOTION_API_BASE_URL,
     NOTION_DATABASE_SCHEDULE_ID,
 )
-from time_utils import now_kst, iso, KST, parse_iso
-from state_store import StateStore
+from notion_api import clean_env, notion_headers
+from time_utils import now_kst, KST, to_epoch, from_epoch
+from state_store import NotionRecord, StateStore
+from cogs.member_directory import get_member_directory
 
-COOLDOWN_SECONDS = 10 * 60  # 10분
-MINIMUM_NOTION_RECORD_SECONDS = 30 * 60  # 30분
-DISCORD_TO_NOTION_NAME = {
-    "이유": "임아리",
-    "SAK": "김성아",
-    "민둥": "장민지",
-}
+WEEKLY_REPORT_JOB = "voice_weekly_report"
+WEEKLY_REPORT_CRON = "0 23 * * 0"  # 매주 일요일 23:00 (KST)
+VOICE_EVENT_DEBOUNCE_SECONDS = 1.5  # 이 시간 안에 반복된 입장/퇴장/음소거는 한 번으로 합칩니다.
+ENTER_ALERT_DELAY_SECONDS = 1  # 함께 들어오는 멤버를 기다렸다가 입장 알림을 판단합니다.
+CHECKPOINT_JOB = "voice_checkpoint"
+CHECKPOINT_CRON = "*/5 * * * *"  # 비정상 종료 시 퇴장 시각을 추정하는 기준. 최대 5분 오차
+
+log = logging.getLogger("voice")
+
+
+class PendingVoiceChange:
+    """debounce 구간 동안 모은 한 멤버의 대상 채널 입퇴장 변화."""
+
+    __slots__ = ("member", "was_in", "is_in", "at", "channel")
+
+    def __init__(self, member: discord.Member, was_in: bool, at: dt.datetime):
+        self.member = member
+        self.was_in = was_in    # 첫 이벤트 직전 대상 채널에 있었는지
+        self.is_in = was_in     # 마지막 이벤트 직후 대상 채널에 있는지
+        self.at = at            # 첫 이벤트 시각 (입장/퇴장 시각으로 씁니다)
+        self.channel = None     # 대상 음성 채널 객체
 
 
 class VoiceTimeCog(commands.Cog):
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.store = StateStore(DATA_FILE)
-        self.store.load()
-        if not self.store.state.get("study_tracking_started_at"):
-            self.store.state["study_tracking_started_at"] = iso(now_kst())
-            self.store.save()
         self.channel_active = False
         self.last_alert_time: dt.datetime | None = None
-        self.daily_reporter.start()
+        self._deliveries: set[asyncio.Task] = set()
+        self._delivering: set[NotionRecord] = set()  # 지금 전송 중인 outbox 기록 (중복 전송 방지)
+        self._finalizers: dict[int, asyncio.Task] = {}  # user_id -> 유예 후 세션 확정 작업
+        self._leaving: dict[int, discord.Member | None] = {}  # user_id -> 유예 중인 멤버 (확정 작업을 다시 잡을 때 씁니다)
+        self._pending: dict[int, PendingVoiceChange] = {}  # user_id -> 아직 처리하지 않은 입퇴장
+        self._workers: dict[int, asyncio.Task] = {}  # user_id -> 멤버별 이벤트 처리 작업
+        self._alert_task: asyncio.Task | None = None
+        self._reconciled = False
+
+    @property
+    def settings(self):
+        # 설정 파일이 바뀌면 bot.settings.current 가 통째로 바뀌므로, 작업마다 새로 읽습니다.
+        return self.bot.settings.current
+
+    def _load_state(self):
+        self.store.load()
+        if self.store.study_tracking_started_at is None:
+            self.store.study_tracking_started_at = to_epoch(now_kst())
+            self.store.save()
+
+    async def cog_load(self) -> None:
+        # 파일 읽기는 이벤트 루프를 막지 않도록 스레드에서 처리합니다.
+        await asyncio.to_thread(self._load_state)
+        # 봇이 꺼져 있어 일요일 리포트를 놓쳤으면 3일 안에는 늦게라도 보내고 누적 시간을 초기화합니다.
+        self.bot.scheduler.register(
+            WEEKLY_REPORT_JOB,
+            WEEKLY_REPORT_CRON,
+            self.weekly_report,
+            catch_up=dt.timedelta(days=3),
+        )
+        self.bot.scheduler.register(CHECKPOINT_JOB, CHECKPOINT_CRON, self.checkpoint_job)
 
     def cog_unload(self):
-        self.daily_reporter.cancel()
+        self.bot.scheduler.unregister(WEEKLY_REPORT_JOB)
+        self.bot.scheduler.unregister(CHECKPOINT_JOB)
+
+    async def checkpoint(self):
+        self.store.checkpoint_at = to_epoch(now_kst())
+        self.store.save()
+
+    async def checkpoint_job(self):
+        await self.checkpoint()
+        # 실행 중에 전송하지 못해 outbox에 남은 기록은 다음 재배포까지 기다리지 않고 5분마다 다시 보냅니다.
+        self.retry_outbox()
+
+    def retry_outbox(self):
+        for record in list(self.store.notion_outbox):
+            self._spawn_delivery(record)
+
+    async def flush(self):
+        """종료 직전 호출됩니다. 상태와 체크포인트를 저장하고, 진행 중인 Notion 전송이 끝나기를 기다립니다.
+
+        기한 안에 끝나지 못한 전송은 outbox에 남아 있다가 다음 시작 때 다시 보냅니다.
+        """
+        await self.drain()
+        await self.checkpoint()
+        if self._deliveries:
+            log.info("Notion 전송 마무리 대기 count=%d", len(self._deliveries))
+            await asyncio.gather(*self._deliveries, return_exceptions=True)
+
+    @commands.Cog.listener()
+    async def on_ready(self):
+        # 재연결 때가 아니라 프로세스 시작 후 처음 한 번만 실행합니다.
+        if self._reconciled:
+            return
+        self._reconciled = True
+        # 지난 실행에서 보내지 못한 기록도 함께 보냅니다. 보정 중 새로 닫히는 세션은 보정 쪽에서 이미 보내고 있습니다.
+        self.reconcile_sessions()
+        self.retry_outbox()
+
+    @commands.Cog.listener()
+    async def on_config_update(self, changed: list[str]):
+        # 이미 기다리고 있는 확정 작업도 새 유예 시간(퇴장 시각 기준)으로 다시 잡습니다.
+        if "session_grace_seconds" not in changed:
+            return
+        for user_id, member in list(self._leaving.items()):
+            left_at = self.store.pending_leave_at(user_id)
+            if left_at is not None:
+                self._schedule_finalize(user_id, member, left_at)
+
+    def reconcile_sessions(self):
+        """저장된 세션과 지금 채널에 있는 멤버를 비교해 한 번에 맞춥니다.
+
+        - 세션이 열려 있는데 채널에 없음: 마지막 체크포인트 시각에 퇴장한 것으로 처리합니다.
+        - 세션이 열려 있고 채널에도 있음: 그대로 이어갑니다.
+        - 세션 없이 채널에 있음: 지금 시각으로 입장 처리합니다 (유예 중인 세션이 있으면 이어 붙임).
+        - 유예 시간이 지난 세션: 확정해 공부 기록을 남깁니다.
+        """
+        grace = self.settings.session_grace_seconds
+        channel = self.bot.get_channel(VOICE_CHANNEL_ID)
+        if channel is None:
+            log.warning("세션 보정 생략: 음성 채널을 찾을 수 없습니다 (id=%s)", VOICE_CHANNEL_ID)
+            return
+        guild = channel.guild
+        present = {m.id: m for m in channel.members if not m.bot}
+        now_ts = to_epoch(now_kst())
+        last_alive = self.store.checkpoint_at or now_ts
+
+        open_sessions = self.store.open_sessions()
+        absent = [uid for uid in open_sessions if uid not in present]
+        stints = [self._leave(uid, guild.get_member(uid), until=max(open_sessions[uid], last_alive)) for uid in absent]
+
+        records = []
+        deferred = []
+        for uid, left_at in self.store.pending_sessions().items():
+            if now_ts - left_at > grace:
+                record = self._finalize_session(uid, guild.get_member(uid))
+                if record is not None:
+                    records.append(record)
+            elif uid not in present:
+                deferred.append((uid, left_at))
+        opened = [uid for uid in present if uid not in open_sessions]
+        for uid in opened:
+            self.store.start_session(uid, now_ts)
+
+        # 재시작 직후에는 입장 알림을 다시 보내지 않고 채널 상태만 맞춥니다.
+        self.channel_active = bool(present)
+        self.store.checkpoint_at = now_ts
+        self.store.save()
+
+        for stint in stints:
+            if stint is not None:
+                self._announce_closed(*stint)
+        for record in records:
+            self._spawn_delivery(record)
+        for uid, left_at in deferred:
+            self._schedule_finalize(uid, guild.get_member(uid), left_at)
+        log.info(
+            "세션 보정 완료 closed=%d kept=%d opened=%d finalized=%d",
+            len(absent),
+            len(open_sessions) - len(absent),
+            len(opened),
+            len(records),
+            extra={
+                "closed": len(absent),
+                "kept": len(open_sessions) - len(absent),
+                "opened": len(opened),
+                "finalized": len(records),
+            },
+        )
+
+    def _leave(self, user_id: int, member: discord.Member | None, until: int):
+        """채널 퇴장: 머문 시간을 누적하고 세션을 유예 상태로 둡니다. 저장은 호출한 쪽에서 합니다.
+
+        머문 구간이 있으면 (member, 입장 시각, 퇴장 시각)을 반환합니다.
+        """
+        start_at, elapsed = self.store.end_session(user_id, until=until)
+        if start_at is None or elapsed <= 0 or member is None:
+            return None
+        return member, start_at, until
+
+    def _finalize_session(self, user_id: int, member: discord.Member | None) -> NotionRecord | None:
+        """유예가 끝난 세션을 확정하고, 머문 시간이 최소 기록 시간(기본 30분) 이상이면 공부 기록과 Notion outbox에 남깁니다.
+
+        저장은 호출한 쪽에서 합니다. outbox에 넣은 기록이 있으면 반환합니다.
+        """
+        result = self.store.finalize_session(user_id)
+        if result is None:
+            return None
+        origin, end_at, seconds = result
+        if seconds < self.settings.minimum_notion_record_seconds:
+            log.debug(
+                "최소 기록 시간 미만 세션이라 노션 기록 생략: %s (%ss)",
+                getattr(member, "display_name", user_id),
+                seconds,
+                extra={"user_id": user_id},
+            )
+            return None
+        self.store.mark_studied(user_id, end_at)
+        if member is None:
+            return None
+        return self.store.enqueue_notion_record(user_id, self._resolve_notion_name(member), origin, end_at)
+
+    def _schedule_finalize(self, user_id: int, member: discord.Member | None, left_at: int):
+        self._cancel_finalize(user_id)
+        delay = max(0, left_at + self.settings.session_grace_seconds - to_epoch(now_kst()))
+        self._leaving[user_id] = member
+        self._finalizers[user_id] = asyncio.create_task(self._finalize_later(user_id, member, left_at, delay))
+
+    def _cancel_finalize(self, user_id: int):
+        self._leaving.pop(user_id, None)
+        task = self._finalizers.pop(user_id, None)
+        if task is not None:
+            task.cancel()
+
+    async def _finalize_later(self, user_id: int, member: discord.Member | None, left_at: int, delay: float):
+        await asyncio.sleep(delay)
+        self._finalizers.pop(user_id, None)
+        self._leaving.pop(user_id, None)
+        if self.store.pending_leave_at(user_id) != left_at:
+            return  # 그 사이 다시 들어왔습니다.
+        record = self._finalize_session(user_id, member)
+        self.store.save()
+        if record is not None:
+            self._spawn_delivery(record)
+
+    def _announce_closed(self, member: discord.Member, start_at: int, end_at: int):
+        # 일정별 공부 시간 적립(SchedulePraiseCog)은 채널에 머문 구간마다 이 이벤트를 받아 처리합니다.
+        self.bot.dispatch("voice_session_closed", member, self._resolve_notion_name(member), start_at, end_at)
+
+    def _spawn_delivery(self, record: NotionRecord):
+        if record in self._delivering:
+            return
+        self._delivering.add(record)
+        task = asyncio.create_task(self._deliver(record))
+        self._deliveries.add(task)
+        task.add_done_callback(self._deliveries.discard)
+
+    async def _deliver(self, record: NotionRecord):
+        try:
+            done = await self._create_notion_voice_record(record)
+        finally:
+            self._delivering.discard(record)
+        if done:
+            self.store.complete_notion_record(record)
+            self.store.save()
 
     def _resolve_notion_name(self, member: discord.Member) -> str:
+        names = self.settings.discord_to_notion_name
         for candidate in (member.display_name, member.name):
-            if candidate in DISCORD_TO_NOTION_NAME:
-                return DISCORD_TO_NOTION_NAME[candidate]
+            if candidate in names:
+                return names[candidate]
         return member.display_name
 
     async def _send_schedule_alert(self, notion_name: str, start_at: dt.datetime, end_at: dt.datetime):
-        if not REPORT_CHANNEL_ID_ALARM:
+        channel_id = self.settings.report_channel_id_alarm
+        if not channel_id:
             return
 
-        channel = self.bot.get_channel(REPORT_CHANNEL_ID_ALARM) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_ALARM)
+        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
         line = (
             f"{notion_name} — "
             f"{start_at.astimezone(KST).strftime('%Y-%m-%d %H:%M')} ~ "
@@ -59,20 +285,17 @@ class VoiceTimeCog(commands.Cog):
         )
         await channel.send(f"공부 일정이 종료되었습니다 📅\n{line}")
 
-    async def _create_notion_voice_record(self, member: discord.Member, start_at: dt.datetime, end_at: dt.datetime):
+    async def _create_notion_voice_record(self, record: NotionRecord) -> bool:
+        """Notion에 공부 기록 page를 만듭니다. 다시 시도할 필요가 없으면(성공 또는 영구 실패) True를 반환합니다."""
         if not NOTION_TOKEN or not NOTION_DATABASE_SCHEDULE_ID:
-            return
+            return True
 
-        notion_name = self._resolve_notion_name(member)
+        notion_name = record.notion_name
+        start_at, end_at = from_epoch(record.start_at), from_epoch(record.end_at)
         session_title = f"{notion_name} {start_at.strftime('%Y-%m-%d %H:%M')}"
-        url = "https://api.notion.com/v1/pages"
-        headers = {
-            "Authorization": f"Bearer {NOTION_TOKEN}",
-            "Notion-Version": "2022-06-28",
-            "Content-Type": "application/json",
-        }
+        url = f"{NOTION_API_BASE_URL}/pages"
         payload = {
-            "parent": {"database_id": str(NOTION_DATABASE_SCHEDULE_ID).strip()},
+            "parent": {"database_id": clean_env(NOTION_DATABASE_SCHEDULE_ID)},
             "properties": {
                 "이름": {
                     "title": [
@@ -96,77 +319,146 @@ class VoiceTimeCog(commands.Cog):
 
         async with aiohttp.ClientSession() as session:
             try:
-                async with session.post(url, headers=headers, json=payload) as resp:
+                async with session.post(url, headers=notion_headers(), json=payload) as resp:
                     if resp.status in (200, 201):
-                        print(f"[NOTION] 음성 기록 생성 성공: {member.display_name}")
-                        await self._send_schedule_alert(notion_name, start_at, end_at)
+                        log.info("음성 기록 생성 성공: %s", notion_name, extra={"user_id": record.user_id})
                     else:
                         text = await resp.text()
-                        print(f"[NOTION] 음성 기록 생성 실패 ({resp.status}): {text}")
-            except Exception as e:
-                print(f"[NOTION] API 요청 중 오류 발생: {e}")
+                        log.error(
+                            "음성 기록 생성 실패 (%s)",
+                            resp.status,
+                            extra={"user_id": record.user_id, "http_status": resp.status, "body": text[:500]},
+                        )
+                        # 요청 한도 초과나 서버 오류는 outbox에 남겨 체크포인트 작업이나 다음 시작 때 다시 보냅니다.
+                        return resp.status != 429 and resp.status < 500
+            except Exception:
+                log.exception("Notion API 요청 중 오류 발생", extra={"user_id": record.user_id})
+                return False
+
+        try:
+            await self._send_schedule_alert(notion_name, start_at, end_at)
+        except Exception:
+            log.exception("일정 종료 알림 전송 실패", extra={"user_id": record.user_id})
+        return True
 
     @commands.Cog.listener()
     async def on_voice_state_update(self, member: discord.Member, before: discord.VoiceState, after: discord.VoiceState):
+        # 여기서는 이벤트를 멤버별 대기열에 넣기만 합니다. 실제 처리는 멤버별 작업이 순서대로 합니다.
         target_id = VOICE_CHANNEL_ID
-        uid = str(member.id)
-        before_id = before.channel.id if before.channel else None
-        after_id = after.channel.id if after.channel else None
+        was_in = before.channel is not None and before.channel.id == target_id
+        is_in = after.channel is not None and after.channel.id == target_id
 
-        if before_id != target_id and after_id == target_id:
-            print(f"[DEBUG] 입장 감지: {member.display_name} (ID: {uid})")
-            self.store.state["sessions"][uid] = iso(now_kst())
-            self.store.save()
+        pending = self._pending.get(member.id)
+        if pending is None:
+            if was_in == is_in:
+                return  # 음소거 등 대상 채널 입퇴장과 무관한 변경
+            pending = self._pending[member.id] = PendingVoiceChange(member, was_in, now_kst())
+        pending.member = member
+        pending.is_in = is_in
+        pending.channel = after.channel if is_in else (before.channel if was_in else pending.channel)
 
-            voice_channel = after.channel
-            guild = member.guild
-            if not voice_channel or not guild:
-                return
+        if member.id not in self._workers:
+            self._workers[member.id] = asyncio.create_task(self._member_worker(member.id))
+
+    async def _member_worker(self, user_id: int):
+        """한 멤버의 음성 이벤트를 순서대로 처리합니다.
+
+        첫 이벤트 후 VOICE_EVENT_DEBOUNCE_SECONDS 동안 들어온 이벤트는 하나로 합쳐, 처음과 마지막 상태만 비교합니다.
+        """
+        try:
+            while user_id in self._pending:
+                await asyncio.sleep(VOICE_EVENT_DEBOUNCE_SECONDS)
+                pending = self._pending.pop(user_id)
+                if pending.was_in == pending.is_in:
+                    continue  # 들어왔다 바로 나감 / 나갔다 바로 들어옴
+                try:
+                    if pending.is_in:
+                        self._handle_join(pending.member, pending.channel, pending.at)
+                    else:
+                        self._handle_leave(pending.member, pending.channel, pending.at)
+                except Exception:
+                    log.exception("음성 이벤트 처리 실패", extra={"user_id": user_id})
+        finally:
+            self._workers.pop(user_id, None)
+
+    def _handle_join(self, member: discord.Member, voice_channel, joined: dt.datetime):
+        log.debug("입장 감지: %s", member.display_name, extra={"user_id": member.id})
+        now_ts = to_epoch(joined)
+        self._cancel_finalize(member.id)
+        record = None
+        left_at = self.store.pending_leave_at(member.id)
+        if left_at is not None and now_ts - left_at > self.settings.session_grace_seconds:
+            # 유예가 이미 끝났는데 확정 작업보다 재입장이 먼저 처리된 경우입니다.
+            record = self._finalize_session(member.id, member)
+        # 유예 중인 세션이 남아 있으면 같은 세션으로 이어 붙습니다.
+        self.store.start_session(member.id, now_ts)
+        self.store.save()
+        if record is not None:
+            self._spawn_delivery(record)
+
+        if voice_channel is not None and member.guild is not None:
+            self._request_enter_alert(voice_channel)
 
+    def _handle_leave(self, member: discord.Member, voice_channel, left: dt.datetime):
+        log.debug("퇴장 감지: %s", member.display_name, extra={"user_id": member.id})
+        left_at = to_epoch(left)
+        stint = self._leave(member.id, member, until=left_at)
+        record = None
+        if self.settings.session_grace_seconds <= 0:
+            record = self._finalize_session(member.id, member)
+        self.store.save()
+
+        if voice_channel is not None and not any(not m.bot for m in voice_channel.members):
+            self.channel_active = False
+
+        if stint is not None:
+            self._announce_closed(*stint)
+        if record is not None:
+            self._spawn_delivery(record)
+        elif self.store.pending_leave_at(member.id) == left_at:
+            # 유예 시간 안에 다시 들어오면 같은 세션으로 묶고, 아니면 그때 기록을 확정합니다.
+            self._schedule_finalize(member.id, member, left_at)
+
+    def _request_enter_alert(self, voice_channel):
+        # 여러 명이 연달아 들어와도 입장 알림 판단은 작업 하나가 한 번만 합니다.
+        if self._alert_task is None or self._alert_task.done():
+            self._alert_task = asyncio.create_task(self._send_enter_alert(voice_channel))
+
+    async def _send_enter_alert(self, voice_channel):
+        await asyncio.sleep(ENTER_ALERT_DELAY_SECONDS)
+        try:
             members_in_channel = [m for m in voice_channel.members if not m.bot]
             now = now_kst()
+            settings = self.settings
             cooldown_ok = (
                 self.last_alert_time is None
-                or (now - self.last_alert_time).total_seconds() > COOLDOWN_SECONDS
+                or (now - self.last_alert_time).total_seconds() > settings.enter_alert_cooldown_seconds
             )
+            if self.channel_active or not members_in_channel or not cooldown_ok:
+                return
 
-            if not self.channel_active and members_in_channel and cooldown_ok:
-                self.channel_active = True
-                self.last_alert_time = now
-                await asyncio.sleep(1)
-                members_not_in_channel = [
-                    m for m in guild.members if not m.bot and m not in voice_channel.members
-                ]
-                report_ch = self.bot.get_channel(REPORT_CHANNEL_ID_ENTER) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_ENTER)
-                header = f"음성 채널 **{voice_channel.name}**에 멤버가 있습니다!"
-                if members_not_in_channel:
-                    await self._send_mentions_in_chunks(report_ch, members_not_in_channel, header_text=header)
-                else:
-                    await report_ch.send(header)
-            return
-
-        if before_id == target_id and after_id != target_id:
-            leave_time = now_kst()
-            print(f"[DEBUG] 퇴장 감지: {member.display_name}")
-
-            start_iso = self.store.state["sessions"].get(uid)
-            session_seconds = self.store.add_session_time(member.id)
-            self.store.state["sessions"].pop(uid, None)
-            self.store.save()
-
-            if before.channel and len([m for m in before.channel.members if not m.bot]) == 0:
-                self.channel_active = False
-
-            if start_iso and session_seconds >= MINIMUM_NOTION_RECORD_SECONDS:
-                start_time = parse_iso(start_iso)
-                if start_time.tzinfo is None:
-                    start_time = start_time.replace(tzinfo=KST)
-                self.store.state["last_study_at"][uid] = iso(leave_time)
-                self.store.save()
-                await self._create_notion_voice_record(member, start_time, leave_time)
+            self.channel_active = True
+            self.last_alert_time = now
+            members_not_in_channel = get_member_directory(self.bot).humans_except(
+                voice_channel.guild, (m.id for m in voice_channel.members)
+            )
+            channel_id = settings.report_channel_id_enter
+            report_ch = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+            header = f"음성 채널 **{voice_channel.name}**에 멤버가 있습니다!"
+            if members_not_in_channel:
+                await self._send_mentions_in_chunks(report_ch, members_not_in_channel, header_text=header)
             else:
-                print(f"[DEBUG] 30분 미만 세션이라 노션 기록 생략: {member.display_name} ({session_seconds}s)")
-            return
+                await report_ch.send(header)
+        except Exception:
+            log.exception("입장 알림 전송 실패")
+
+    async def drain(self):
+        """대기 중인 음성 이벤트와 입장 알림이 모두 처리될 때까지 기다립니다."""
+        while self._workers or (self._alert_task is not None and not self._alert_task.done()):
+            tasks = list(self._workers.values())
+            if self._alert_task is not None and not self._alert_task.done():
+                tasks.append(self._alert_task)
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def _send_mentions_in_chunks(self, report_ch, members_to_ping, header_text="", chunk_size=40):
         for i in range(0, len(members_to_ping), chunk_size):
@@ -175,41 +467,45 @@ class VoiceTimeCog(commands.Cog):
             text = f"{mention_list}\n{header_text}" if header_text else mention_list
             await report_ch.send(text)
 
-    @tasks.loop(time=dt.time(hour=14, minute=0, tzinfo=dt.timezone.utc))
-    async def daily_reporter(self):
+    async def weekly_report(self):
         now = now_kst()
-        if now.weekday() != 6:
-            return
-
-        for uid in list(self.store.state["sessions"].keys()):
-            self.store.add_session_time(int(uid), until=now)
-            self.store.state["sessions"][uid] = iso(now)
+        now_ts = to_epoch(now)
+        for uid in list(self.store.open_sessions()):
+            self.store.add_session_time(uid, until=now_ts)
+            self.store.start_session(uid, now_ts)
 
-        if not self.store.state["totals"]:
+        items = self.store.totals()
+        if not items:
             content = "이번 주 대상 음성 채널 체류 기록이 없습니다."
         else:
-            items = sorted(self.store.state["totals"].items(), key=lambda kv: kv[1], reverse=True)
             lines = ["이번 주 음성 채널 체류 시간 (일~토, 단위: 시간)"]
             for uid, sec in items:
                 hours = sec / 3600.0
                 lines.append(f"- <@{uid}>: {hours:.2f}h")
             content = "\n".join(lines)
 
-        channel = self.bot.get_channel(REPORT_CHANNEL_ID_ENTER) or await self.bot.fetch_channel(REPORT_CHANNEL_ID_ENTER)
+        channel_id = self.settings.report_channel_id_enter
+        channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+        cancelled = False
         try:
             await channel.send(content)
+        except asyncio.CancelledError:
+            # 종료 중에 끊기면 누적 시간을 남겨 두고, 다음 시작 때 스케줄러가 따라잡아 다시 보냅니다.
+            cancelled = True
+            raise
         finally:
-            self.store.state["totals"] = {}
-            self.store.save()
+            if not cancelled:
+                self.store.reset_totals()
+                self.store.save()
 
     @commands.command()
     @commands.has_permissions(administrator=True)
     async def voicetime(self, ctx: commands.Context):
-        if not self.store.state["totals"]:
+        items = self.store.totals()
+        if not items:
             await ctx.send("현재 누적 데이터가 없습니다.")
             return
 
-        items = sorted(self.store.state["totals"].items(), key=lambda kv: kv[1], reverse=True)
         lines = ["현재 누적 음성 채널 체류 시간:"]
         for uid, sec in items:
             hours = sec / 3600.0
@@ -4,7 +4,6 @@ from pathlib import Path
 from dotenv import load_dotenv
 
 env_path = Path(__file__).resolve().parent / ".env"
-print(f"[DEBUG] loading env from {env_path}")
 load_dotenv(dotenv_path=env_path, override=True)
 
 DISCORD_TOKEN = os.getenv("DISCORD_TOKEN", "")
@@ -14,15 +13,46 @@ DATA_FILE = os.getenv("DATA_FILE", "voice_time.json")
 MENTION_CHANNEL_ID = int(os.getenv("MENTION_CHANNEL_ID", "0"))
 NOTION_TOKEN = os.getenv("NOTION_TOKEN", "")
 NOTION_DATABASE_FEATURE_ID = os.getenv("NOTION_DATABASE_FEATURE_ID", "")
+# 로컬 Notion 대역 서버(benchmarks/fake_notion.py)로 돌릴 때만 바꿉니다.
+# .env.example 처럼 값이 비어 있으면 기본 주소를 씁니다.
+NOTION_API_BASE_URL = (os.getenv("NOTION_API_BASE_URL") or "https://api.notion.com/v1").rstrip("/")
 REPORT_CHANNEL_ID_FEATURE = int(os.getenv("REPORT_CHANNEL_ID_FEATURE", "0"))
 REPORT_CHANNEL_ID_DEPLOY = int(os.getenv("REPORT_CHANNEL_ID_DEPLOY", "0"))
 
 NOTION_DATABASE_BOARD_ID = os.getenv("NOTION_DATABASE_BOARD_ID", "")
+# 기능 DB 변경 중 알림을 보낼 이벤트 (created, completed, status_changed, renamed, described, reassigned)
+NOTION_FEATURE_NOTIFY_EVENTS = [
+    e.strip() for e in (os.getenv("NOTION_FEATURE_NOTIFY_EVENTS") or "created,completed").split(",") if e.strip()
+]
 REPORT_CHANNEL_ID_ALARM = int(os.getenv("REPORT_CHANNEL_ID_ALARM", "0"))
 NOTION_DATABASE_SCHEDULE_ID = os.getenv("NOTION_DATABASE_SCHEDULE_ID", "")
 REPORT_CHANNEL_ID_DAILY = int(os.getenv("REPORT_CHANNEL_ID_DAILY", "0"))
 REPORT_CHANNEL_ID_CHASE = int(os.getenv("REPORT_CHANNEL_ID_CHASE", "0"))
 
+# 음성 채널에서 나갔다가 이 시간(초) 안에 다시 들어오면 같은 공부 세션으로 묶습니다. 0이면 묶지 않습니다.
+SESSION_GRACE_SECONDS = int(os.getenv("SESSION_GRACE_SECONDS") or "120")
+
+# 재시작 없이 바꿀 수 있는 설정 파일 (채널 ID, 이름 매핑, 알림 기준 등). settings.py 참고.
+# 파일에 적은 값이 위 환경변수보다 우선합니다.
+SETTINGS_FILE = os.getenv("SETTINGS_FILE") or "data/settings.json"
+
+# 이벤트 루프 지연 감시 (ms). 이 값보다 오래 루프를 막는 콜백은 스택과 함께 로그에 남깁니다.
+LOOP_LAG_THRESHOLD_MS = int(os.getenv("LOOP_LAG_THRESHOLD_MS") or "250")
+
+# 종료 신호(SIGTERM)를 받은 뒤 상태 저장과 대기 중인 전송을 마무리하는 최대 시간(초).
+# docker-compose.yml 의 stop_grace_period 보다 짧아야 합니다.
+SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("SHUTDOWN_TIMEOUT_SECONDS") or "20")
+
+# 로그 설정. LOG_LEVELS 는 "notion=WARNING,voice=DEBUG" 처럼 서브시스템(logger 이름)별 레벨입니다.
+LOG_LEVEL = (os.getenv("LOG_LEVEL") or "INFO").upper()
+LOG_LEVELS = {
+    name.strip(): level.strip().upper()
+    for name, _, level in (
+        item.partition("=") for item in os.getenv("LOG_LEVELS", "").split(",") if "=" in item
+    )
+}
+LOG_FORMAT = (os.getenv("LOG_FORMAT") or "json").lower()  # json | text
+
 if not DISCORD_TOKEN:
     raise SystemExit("DISCORD_TOKEN 환경변수를 설정하세요 (.env 사용 가능).")
 if not VOICE_CHANNEL_ID or not REPORT_CHANNEL_ID_ENTER:
@@ -0,0 +1,162 @@
+# log_setup.py
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# LogRecord 기본 속성. 이 외의 속성은 logger.info(..., extra={...}) 로 넘어온 필드입니다.
+_RESERVED_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "rate_limit", "rate_key"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Datadog 로그 파이프라인이 바로 인식하는 속성 이름(status, logger.name, error.*)으로 한 줄 JSON을 만듭니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": int(record.created * 1000),
+            "status": record.levelname.lower(),
+            "logger": {"name": record.name, "thread_name": record.threadName},
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS and not key.startswith("_"):
+                payload[key] = value
+        if record.exc_info:
+            exc_type, exc, _ = record.exc_info
+            payload["error"] = {
+                "kind": exc_type.__name__ if exc_type else "",
+                "message": str(exc),
+                "stack": self.formatException(record.exc_info),
+            }
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+class TextFormatter(logging.Formatter):
+    """로컬 실행용. 예전 print 로그처럼 `[logger] 메시지` 형태에 extra 필드를 덧붙입니다."""
+
+    def __init__(self):
+        super().__init__("%(asctime)s %(levelname)s [%(name)s] %(message)s")
+
+    def format(self, record: logging.LogRecord) -> str:
+        text = super().format(record)
+        extras = [
+            f"{key}={value}"
+            for key, value in vars(record).items()
+            if key not in _RESERVED_ATTRS and not key.startswith("_")
+        ]
+        # 메시지에 이미 `key=value` 로 들어간 필드는 다시 붙이지 않습니다.
+        extras = [item for item in extras if item not in text]
+        return f"{text} {' '.join(extras)}" if extras else text
+
+
+class RateLimitFilter(logging.Filter):
+    """extra={"rate_limit": 초} 가 붙은 로그를 (logger, 메시지 템플릿)마다 그 간격에 한 번만 통과시킵니다.
+
+    같은 템플릿을 여러 대상에 쓰면 extra={"rate_key": ...} 로 대상별로 따로 셉니다.
+
+    막힌 줄 수는 다음에 통과하는 레코드의 suppressed 필드로 붙습니다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._lock = threading.Lock()
+        self._state: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        interval = getattr(record, "rate_limit", None)
+        if not interval:
+            return True
+        key = (record.name, str(getattr(record, "rate_key", record.msg)))
+        now = time.monotonic()
+        with self._lock:
+            last, suppressed = self._state.get(key, (None, 0))
+            if last is not None and now - last < interval:
+                self._state[key] = (last, suppressed + 1)
+                return False
+            self._state[key] = (now, 0)
+        if suppressed:
+            record.suppressed = suppressed
+        return True
+
+
+class _LocalQueueHandler(logging.handlers.QueueHandler):
+    # 같은 프로세스 안의 큐라 pickle 할 필요가 없으므로 exc_info와 extra 필드를 그대로 넘깁니다.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _parse_level(value: str) -> Optional[int]:
+    """"DEBUG", "warning", "10" 같은 값을 로그 레벨 숫자로 바꿉니다. 알 수 없는 값이면 None."""
+    text = str(value).strip().upper()
+    if text.isdigit():
+        return int(text)
+    level = logging.getLevelName(text)
+    return level if isinstance(level, int) else None
+
+
+def setup_logging(
+    level: str = "INFO",
+    levels: Optional[Dict[str, str]] = None,
+    fmt: str = "json",
+) -> logging.handlers.QueueListener:
+    """루트 로거에 QueueHandler를 달고, 실제 stdout 쓰기는 별도 스레드의 QueueListener가 맡습니다.
+
+    이벤트 루프에서는 레코드를 큐에 넣기만 하므로 stdout이 느려도 루프가 막히지 않습니다.
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    stream = logging.StreamHandler(sys.stdout)
+    stream.setFormatter(TextFormatter() if fmt == "text" else JsonFormatter())
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = _LocalQueueHandler(log_queue)
+    # 버려질 레코드는 큐에 넣기 전에 거릅니다.
+    queue_handler.addFilter(RateLimitFilter())
+
+    # 잘못된 레벨 때문에 봇이 뜨지 못하는 일이 없도록, 알 수 없는 값은 경고만 남기고 기본값(INFO)을 씁니다.
+    invalid = []
+    root_level = _parse_level(level)
+    if root_level is None:
+        invalid.append(f"LOG_LEVEL={level}")
+        root_level = logging.INFO
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(root_level)
+    for name, sub_level in (levels or {}).items():
+        parsed = _parse_level(sub_level)
+        if parsed is None:
+            invalid.append(f"LOG_LEVELS {name}={sub_level}")
+            continue
+        logging.getLogger(name).setLevel(parsed)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    if invalid:
+        logging.getLogger("startup").warning("알 수 없는 로그 레벨 무시 (기본 INFO 사용): %s", ", ".join(invalid))
+    return _listener
+
+
+def stop_logging():
+    """큐에 남은 로그를 모두 쓰고 listener 스레드를 멈춥니다."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
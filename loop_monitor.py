@@ -0,0 +1,152 @@
+# loop_monitor.py
+import asyncio
+import cProfile
+import logging
+import marshal
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Optional
+
+log = logging.getLogger("loop")
+
+
+def _format_stack(frame, limit: int = 25) -> str:
+    return "".join(traceback.format_stack(frame, limit=limit))
+
+
+class LoopLagMonitor:
+    """이벤트 루프 지연(lag)을 측정하고, 오래 걸리는 콜백의 스택을 기록합니다.
+
+    루프 안의 heartbeat 태스크가 주기적으로 깨어나며 지연을 재고,
+    별도 watchdog 스레드는 heartbeat가 멈춘 동안 루프 스레드의 스택을 찍습니다.
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.25):
+        self.interval = interval
+        self.threshold = threshold
+
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.slow_count = 0
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = time.perf_counter()
+        self._stall_reported = False
+
+    @property
+    def loop_thread_id(self) -> Optional[int]:
+        return self._loop_thread_id
+
+    def start(self):
+        if self._task and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._last_beat = time.perf_counter()
+        self._task = self._loop.create_task(self._heartbeat())
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self):
+        self.max_lag = 0.0
+        self.slow_count = 0
+
+    async def _heartbeat(self):
+        while not self._stop.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            lag = max(0.0, now - started - self.interval)
+            self._last_beat = now
+            self._stall_reported = False
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            if lag >= self.threshold:
+                self.slow_count += 1
+                log.warning(
+                    "이벤트 루프 지연 감지 lag=%.0fms threshold=%.0fms",
+                    lag * 1000,
+                    self.threshold * 1000,
+                    extra={"lag_ms": round(lag * 1000)},
+                )
+
+    def _watch(self):
+        # heartbeat가 interval + threshold 이상 멈춰 있으면 루프가 어떤 콜백에 막혀 있는 것입니다.
+        # threshold는 설정 파일로 바뀔 수 있으므로 확인 간격을 매번 다시 계산합니다.
+        while not self._stop.wait(min(self.interval, self.threshold) / 2):
+            stalled = time.perf_counter() - self._last_beat - self.interval
+            if stalled < self.threshold or self._stall_reported:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self._stall_reported = True
+            log.warning(
+                "느린 콜백 감지 (>%.0fms 진행 중), 루프 스레드 스택:\n%s",
+                stalled * 1000,
+                _format_stack(frame),
+                extra={"stalled_ms": round(stalled * 1000)},
+            )
+
+
+class SamplingProfiler:
+    """지정한 스레드의 스택을 주기적으로 샘플링해 collapsed-stack 형식으로 모읍니다."""
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self.sample_count = 0
+
+    def _collapse(self, frame) -> str:
+        parts = []
+        while frame is not None:
+            code = frame.f_code
+            parts.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+            frame = frame.f_back
+        return ";".join(reversed(parts))
+
+    def _run(self, duration: float):
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._collapse(frame)] += 1
+                self.sample_count += 1
+            time.sleep(self.interval)
+
+    async def run(self, duration: float):
+        # 샘플러는 별도 스레드에서 돌아가므로 루프는 평소처럼 일을 계속합니다.
+        await asyncio.to_thread(self._run, duration)
+
+    def collapsed(self) -> str:
+        lines = [f"{stack} {count}" for stack, count in self.samples.most_common()]
+        return "\n".join(lines) + "\n"
+
+
+async def profile_loop_pstats(duration: float) -> bytes:
+    """루프 스레드에서 cProfile을 duration 초 동안 켜고 pstats 덤프 바이트를 반환합니다."""
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        profiler.disable()
+    profiler.create_stats()
+    return marshal.dumps(profiler.stats)
+
@@ -1,20 +1,102 @@
 # main.py
 import asyncio
+import logging
+import signal
+
+from startup_report import startup  # 시작 시간 측정을 위해 가장 먼저 import 합니다.
+
+with startup.measure("config"):
+    from config import DISCORD_TOKEN, LOG_FORMAT, LOG_LEVEL, LOG_LEVELS, SHUTDOWN_TIMEOUT_SECONDS
+    from log_setup import setup_logging
+
+    setup_logging(LOG_LEVEL, LOG_LEVELS, LOG_FORMAT)
+with startup.measure("import"):
+    from bot import bot  # 위에서 만든 bot 인스턴스를 가져옵니다.
+
+# cogs 폴더에 있는 확장들. 단계 순서대로 로드하고, 같은 단계 안의 확장은 동시에 로드합니다.
+EXTENSION_STAGES = (
+    # 다른 cog가 get_member_directory()로 찾습니다. 없으면 호출마다 서버 전체를 다시 색인합니다.
+    ("cogs.member_directory",),
+    # schedule_praise, study_reminder 가 VoiceTimeCog.store 를 씁니다.
+    ("cogs.voice_time",),
+    # 아래 확장들은 위 cog와 bot.settings / bot.scheduler(bot.py에서 생성)에만 의존하고 서로는 독립적입니다.
+    (
+        "cogs.config_watcher",
+        "cogs.mention_shortcut",
+        "cogs.menu_commands",
+        "cogs.notion_watcher",
+        "cogs.study_reminder",
+        "cogs.diagnostics",
+        "cogs.schedule_praise",
+    ),
+)
+
+log = logging.getLogger("startup")
+shutdown_log = logging.getLogger("shutdown")
+
+
+async def load_extension_isolated(name: str, concurrent: bool = False):
+    # 확장 하나가 실패해도 나머지 확장과 봇 실행은 계속됩니다.
+    try:
+        with startup.measure(name, concurrent=concurrent):
+            await bot.load_extension(name)
+    except Exception as e:
+        startup.fail(name, e)
+        log.error("확장 로드 실패: %s (%s)", name, e, extra={"extension": name})
+
+
+async def flush_extension(name: str, cog):
+    # 확장 하나의 저장이 실패해도 나머지 확장은 계속 저장합니다.
+    try:
+        await cog.flush()
+    except Exception:
+        shutdown_log.exception("종료 전 저장 실패: %s", name)
+
+
+async def shutdown(sig: signal.Signals):
+    shutdown_log.info("종료 신호 수신: %s, 최대 %.0f초 동안 상태를 저장합니다.", sig.name, SHUTDOWN_TIMEOUT_SECONDS)
+    bot.scheduler.stop()
+    flushers = [flush_extension(name, cog) for name, cog in bot.cogs.items() if hasattr(cog, "flush")]
+    try:
+        await asyncio.wait_for(asyncio.gather(*flushers), timeout=SHUTDOWN_TIMEOUT_SECONDS)
+        shutdown_log.info("종료 전 저장 완료")
+    except asyncio.TimeoutError:
+        shutdown_log.warning("종료 전 저장이 %.0f초 안에 끝나지 않았습니다. 남은 작업은 다음 시작 때 이어서 처리합니다.", SHUTDOWN_TIMEOUT_SECONDS)
+    await bot.close()
+
+
+def install_signal_handlers():
+    loop = asyncio.get_running_loop()
+    stopping = []
+
+    def on_signal(sig: signal.Signals):
+        if stopping:
+            return
+        stopping.append(loop.create_task(shutdown(sig)))
+
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        try:
+            loop.add_signal_handler(sig, on_signal, sig)
+        except NotImplementedError:
+            # Windows 로컬 실행에서는 Ctrl+C 기본 동작을 그대로 씁니다.
+            pass
 
-from config import DISCORD_TOKEN
-from bot import bot  # 위에서 만든 bot 인스턴스를 가져옵니다.
 
 async def main():
     async with bot:
-        # cogs 폴더에 있는 확장들을 여기서 로드합니다.
-        await bot.load_extension("cogs.voice_time")
-        await bot.load_extension("cogs.mention_shortcut")
-        await bot.load_extension("cogs.menu_commands")
-        await bot.load_extension("cogs.notion_watcher")
-        await bot.load_extension("cogs.study_reminder")
-
-        # 실제 디스코드 봇 실행
-        await bot.start(DISCORD_TOKEN)
+        install_signal_handlers()
+        with startup.measure("extensions"):
+            for stage in EXTENSION_STAGES:
+                concurrent = len(stage) > 1
+                await asyncio.gather(*(load_extension_isolated(name, concurrent) for name in stage))
+        if startup.failures:
+            log.warning("로드되지 않은 확장: %s", ", ".join(startup.failures))
+
+        # 실제 디스코드 봇 실행 (bot.start = login + connect)
+        with startup.measure("login"):
+            await bot.login(DISCORD_TOKEN)
+        startup.begin("ready")
+        await bot.connect()
 
 if __name__ == "__main__":
     asyncio.run(main())
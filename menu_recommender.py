@@ -1,4 +1,5 @@
 import json
+import logging
 import random
 import time
 from pathlib import Path
@@ -10,32 +11,32 @@ HISTORY_FILE = DATA_DIR / "menu_history.json"
 
 COOLDOWN_SECONDS = 3 * 24 * 60 * 60  # 최근 3일 회피
 
+log = logging.getLogger("menu")
+
 def _load_json(path: Path, default):
-    # 디버깅을 위해 절대 경로를 출력합니다.
-    abs_path = path.resolve()
-    print(f"[DEBUG] JSON 파일 로드 시도: {abs_path}")
+    # 디버깅을 위해 절대 경로를 남깁니다.
+    log.debug("JSON 파일 로드 시도: %s", path.resolve())
 
     if not path.exists():
-        print(f"[DEBUG] 오류: 파일을 찾을 수 없습니다.")
+        # 기록 파일은 첫 추천 전까지 없는 것이 정상이고, /menu 마다 읽으므로 DEBUG로 남깁니다.
+        log.debug("파일을 찾을 수 없습니다: %s", path)
         return default
     
-    print(f"[DEBUG] 성공: 파일을 찾았습니다.")
-    
     try:
         with path.open("r", encoding="utf-8") as f:
             content = f.read()
             if not content.strip():
-                print("[DEBUG] 오류: 파일 내용이 비어있습니다.")
+                log.debug("파일 내용이 비어있습니다: %s", path)
                 return default
             
             data = json.loads(content)
-            print(f"[DEBUG] 성공: JSON 파싱 완료. {len(data)}개의 메뉴를 불러왔습니다.")
+            log.debug("JSON 파싱 완료: %s (%d개)", path.name, len(data))
             return data
     except json.JSONDecodeError as e:
-        print(f"[DEBUG] 오류: JSON 형식이 올바르지 않습니다. {e}")
+        log.error("JSON 형식이 올바르지 않습니다: %s (%s)", path, e)
         return default
     except Exception as e:
-        print(f"[DEBUG] 오류: 파일을 읽는 중 예외가 발생했습니다. {e}")
+        log.exception("파일을 읽는 중 예외가 발생했습니다: %s", path)
         return default
 
 def _save_json(path: Path, obj):
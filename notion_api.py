@@ -0,0 +1,19 @@
+# notion_api.py
+from typing import Dict, Optional
+
+from config import NOTION_TOKEN
+
+NOTION_VERSION = "2022-06-28"
+
+
+def clean_env(val: Optional[str]) -> str:
+    return str(val).strip() if val else ""
+
+
+def notion_headers() -> Dict[str, str]:
+    """Notion REST API 공통 요청 헤더."""
+    return {
+        "Authorization": f"Bearer {clean_env(NOTION_TOKEN)}",
+        "Notion-Version": NOTION_VERSION,
+        "Content-Type": "application/json",
+    }
@@ -0,0 +1,197 @@
+# notion_rows.py
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+# 변경 이벤트 종류
+CREATED = "created"
+STATUS_CHANGED = "status_changed"
+COMPLETED = "completed"          # 상태 변경 중 '완료'로 바뀐 경우
+RENAMED = "renamed"
+DESCRIBED = "described"
+REASSIGNED = "reassigned"
+
+EVENT_KINDS = (CREATED, STATUS_CHANGED, COMPLETED, RENAMED, DESCRIBED, REASSIGNED)
+
+_SEP = "\x1f"
+
+
+def is_completed_status(name: str) -> bool:
+    n = (name or "").strip().lower()
+    if not n:
+        return False
+    return ("완료" in n) or (n in {"done", "completed", "complete"})
+
+
+def any_completed(status_names: List[str]) -> bool:
+    return any(is_completed_status(n) for n in status_names)
+
+
+def _plain(items: Optional[List[Dict[str, Any]]]) -> str:
+    return "".join(x.get("plain_text", "") for x in (items or []))
+
+
+def extract_status_names(props: Dict[str, Any]) -> List[str]:
+    st = props.get("상태") or next(
+        (
+            v
+            for v in props.values()
+            if isinstance(v, dict) and v.get("type") in ("status", "select", "multi_select")
+        ),
+        None,
+    )
+    if not st:
+        return []
+    if st["type"] == "status":
+        return [st["status"]["name"]] if st.get("status") else []
+    if st["type"] == "select":
+        return [st["select"]["name"]] if st.get("select") else []
+    if st["type"] == "multi_select":
+        return [o["name"] for o in st["multi_select"]]
+    return []
+
+
+def extract_title(props: Dict[str, Any]) -> str:
+    content = props.get("내용", {})
+    return _plain(content.get("title") or content.get("rich_text"))
+
+
+def extract_description(props: Dict[str, Any]) -> str:
+    return _plain(props.get("설명", {}).get("rich_text") or props.get("Description", {}).get("rich_text"))
+
+
+def extract_assignees(props: Dict[str, Any]) -> List[str]:
+    people = next(
+        (v for v in props.values() if isinstance(v, dict) and v.get("type") == "people"),
+        None,
+    )
+    if not people:
+        return []
+    return sorted(p.get("name") or p.get("id", "") for p in people.get("people", []))
+
+
+def _digest(text: str, size: int) -> str:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=size).hexdigest()
+
+
+class FeatureRow:
+    """알림 문구를 만들 때만 쓰는, 한 번의 폴링 동안만 살아 있는 row 요약."""
+
+    __slots__ = ("id", "title", "description", "status_names", "assignees", "completed")
+
+    def __init__(self, row: Dict[str, Any]):
+        props = row.get("properties", {})
+        self.id: str = row["id"]
+        self.title = extract_title(props)
+        self.description = extract_description(props)
+        self.status_names = extract_status_names(props)
+        self.assignees = extract_assignees(props)
+        self.completed = any_completed(self.status_names)
+
+    def line(self) -> str:
+        return f"- {self.title or '(내용 없음)'} — {self.description or '(설명 없음)'}"
+
+
+class RowFingerprint:
+    """row의 관심 속성 해시. 전체 payload 대신 이것만 기억해 둡니다.
+
+    필드 해시가 None 이면 예전 상태 파일에서 옮겨 와 값을 모르는 필드이며, 그 필드의 변경 이벤트는 내지 않습니다.
+    """
+
+    __slots__ = ("digest", "status", "title", "description", "assignees", "completed")
+
+    def __init__(
+        self,
+        digest: str,
+        status: Optional[str],
+        title: Optional[str],
+        description: Optional[str],
+        assignees: Optional[str],
+        completed: bool,
+    ):
+        self.digest = digest
+        self.status = status
+        self.title = title
+        self.description = description
+        self.assignees = assignees
+        self.completed = completed
+
+    @classmethod
+    def of(cls, row: FeatureRow) -> "RowFingerprint":
+        status = _digest(_SEP.join(row.status_names), 4)
+        title = _digest(row.title, 4)
+        description = _digest(row.description, 4)
+        assignees = _digest(_SEP.join(row.assignees), 4)
+        digest = _digest(_SEP.join((status, title, description, assignees)), 8)
+        return cls(digest, status, title, description, assignees, row.completed)
+
+    @classmethod
+    def legacy(cls, status_text: Optional[str]) -> "RowFingerprint":
+        # 예전 notion_db.json 은 상태를 콤마로 이어 붙인 문자열만 저장했습니다.
+        names = [p.strip() for p in (status_text or "").split(",")]
+        return cls("", None, None, None, None, any_completed(names))
+
+    def to_list(self) -> list:
+        return [self.digest, self.status, self.title, self.description, self.assignees, int(self.completed)]
+
+    @classmethod
+    def from_list(cls, data: list) -> "RowFingerprint":
+        digest, status, title, description, assignees, completed = data
+        return cls(digest, status, title, description, assignees, bool(completed))
+
+
+class ChangeEvent:
+    __slots__ = ("kind", "row")
+
+    def __init__(self, kind: str, row: FeatureRow):
+        self.kind = kind
+        self.row = row
+
+
+def diff_rows(
+    rows: List[Dict[str, Any]],
+    fingerprints: Dict[str, RowFingerprint],
+) -> Tuple[List[ChangeEvent], bool]:
+    """조회한 row들을 저장된 해시와 한 번에 비교해 변경 이벤트를 만들고, fingerprints를 갱신합니다.
+
+    두 번째 반환값은 fingerprints가 바뀌었는지 여부입니다.
+    """
+    events: List[ChangeEvent] = []
+    changed = False
+    for raw in rows:
+        row = FeatureRow(raw)
+        current = RowFingerprint.of(row)
+        previous = fingerprints.get(row.id)
+
+        if previous is None:
+            events.append(ChangeEvent(CREATED, row))
+        elif previous.digest == current.digest:
+            # 최근에 본 row를 뒤로 보내 prune_fingerprints 가 오래 안 보인 row부터 지우게 합니다.
+            fingerprints[row.id] = fingerprints.pop(row.id)
+            continue
+        else:
+            if previous.completed != current.completed or (
+                previous.status is not None and previous.status != current.status
+            ):
+                kind = COMPLETED if current.completed and not previous.completed else STATUS_CHANGED
+                events.append(ChangeEvent(kind, row))
+            if previous.title is not None and previous.title != current.title:
+                events.append(ChangeEvent(RENAMED, row))
+            if previous.description is not None and previous.description != current.description:
+                events.append(ChangeEvent(DESCRIBED, row))
+            if previous.assignees is not None and previous.assignees != current.assignees:
+                events.append(ChangeEvent(REASSIGNED, row))
+
+        fingerprints.pop(row.id, None)
+        fingerprints[row.id] = current
+        changed = True
+    return events, changed
+
+
+def prune_fingerprints(fingerprints: Dict[str, RowFingerprint], limit: int) -> bool:
+    """가장 오래 안 보인 row부터 지워 fingerprints를 limit개 이하로 유지합니다. 지운 것이 있으면 True."""
+    excess = len(fingerprints) - limit
+    if excess <= 0:
+        return False
+    for row_id in list(fingerprints)[:excess]:
+        del fingerprints[row_id]
+    return True
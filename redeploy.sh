@@ -13,6 +13,9 @@ if [ ! -f .env ]; then
     exit 1
 fi
 
+# 컨테이너 안에는 .git이 없으므로, 배포 알림에 쓸 커밋 정보를 빌드 전에 파일로 남깁니다.
+git log -1 --pretty=format:'%h%n%an%n%s' > build_info.txt
+
 echo "🐳 [2/4] 봇을 재조립(Build)하고 갈아끼웁니다..."
 # --build: 코드 변경사항 적용을 위해 강제 재빌드
 # -d: 백그라운드 실행
@@ -0,0 +1,113 @@
+# schedule_index.py
+import datetime as dt
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from time_utils import KST, to_epoch
+
+SCHEDULE_TITLE_PROPERTY = "이름"
+SCHEDULE_DATE_PROPERTY = "날짜"
+SCHEDULE_TAG_PROPERTY = "태그"
+SCHEDULE_GOAL_PROPERTY = "목표"  # number, 분 단위 (없으면 일정 길이를 목표로 사용)
+
+
+class SchedulePage:
+    __slots__ = ("page_id", "title", "tags", "start", "end", "goal_seconds")
+
+    def __init__(self, page_id: str, title: str, tags: Tuple[str, ...], start: int, end: int, goal_seconds: int):
+        self.page_id = page_id
+        self.title = title
+        self.tags = tags
+        self.start = start
+        self.end = end
+        self.goal_seconds = goal_seconds
+
+
+def _parse_notion_datetime(value: str) -> Tuple[dt.datetime, bool]:
+    """Notion date 문자열을 datetime으로 바꿉니다. 두 번째 값은 날짜만 있는지 여부입니다."""
+    if len(value) == 10:
+        day = dt.date.fromisoformat(value)
+        return dt.datetime(day.year, day.month, day.day, tzinfo=KST), True
+    parsed = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=KST)
+    return parsed, False
+
+
+def parse_schedule_page(page: Dict[str, Any], ignore_creator_id: Optional[str] = None) -> Optional[SchedulePage]:
+    """일정 DB row를 SchedulePage로 바꿉니다. 기간이나 태그가 없는 row, 봇이 만든 기록은 None."""
+    if ignore_creator_id and page.get("created_by", {}).get("id") == ignore_creator_id:
+        return None
+
+    props = page.get("properties", {})
+    date = (props.get(SCHEDULE_DATE_PROPERTY) or {}).get("date") or {}
+    tags = tuple(o["name"] for o in (props.get(SCHEDULE_TAG_PROPERTY) or {}).get("multi_select") or [])
+    if not date.get("start") or not tags:
+        return None
+
+    start, start_is_date = _parse_notion_datetime(date["start"])
+    if date.get("end"):
+        end, end_is_date = _parse_notion_datetime(date["end"])
+        if end_is_date:
+            end += dt.timedelta(days=1)
+    elif start_is_date:
+        end = start + dt.timedelta(days=1)
+    else:
+        return None
+
+    start_ts, end_ts = to_epoch(start), to_epoch(end)
+    if end_ts <= start_ts:
+        return None
+
+    goal = (props.get(SCHEDULE_GOAL_PROPERTY) or {}).get("number")
+    goal_seconds = int(goal * 60) if goal else end_ts - start_ts
+    title = "".join(
+        x.get("plain_text", "") for x in (props.get(SCHEDULE_TITLE_PROPERTY) or {}).get("title") or []
+    ) or "(제목 없음)"
+    return SchedulePage(page["id"], title, tags, start_ts, end_ts, goal_seconds)
+
+
+class ScheduleIndex:
+    """태그(사용자)별로 시작 시각 순 정렬해 둔 일정 목록. 구간이 겹치는 일정을 이분 탐색으로 찾습니다."""
+
+    def __init__(self):
+        self.pages: Dict[str, SchedulePage] = {}
+        self._by_tag: Dict[str, Tuple[List[int], List[SchedulePage], int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def rebuild(self, pages: Iterable[SchedulePage]):
+        grouped: Dict[str, List[SchedulePage]] = defaultdict(list)
+        by_id: Dict[str, SchedulePage] = {}
+        for page in pages:
+            by_id[page.page_id] = page
+            for tag in page.tags:
+                grouped[tag].append(page)
+
+        by_tag = {}
+        for tag, items in grouped.items():
+            items.sort(key=lambda p: p.start)
+            max_span = max(p.end - p.start for p in items)
+            by_tag[tag] = ([p.start for p in items], items, max_span)
+
+        # 조회 중인 코드가 중간 상태를 보지 않도록 한 번에 교체합니다.
+        self.pages = by_id
+        self._by_tag = by_tag
+
+    def overlapping(self, tag: str, start: int, end: int) -> List[Tuple[SchedulePage, int]]:
+        """[start, end) 구간과 겹치는 tag의 일정과 겹친 초를 반환합니다."""
+        entry = self._by_tag.get(tag)
+        if not entry or end <= start:
+            return []
+        starts, items, max_span = entry
+        # 시작이 end 이전이고, (start - 가장 긴 일정 길이) 이후인 일정만 겹칠 수 있습니다.
+        lo = bisect_left(starts, start - max_span)
+        hi = bisect_left(starts, end)
+        result = []
+        for page in items[lo:hi]:
+            overlap = min(end, page.end) - max(start, page.start)
+            if overlap > 0:
+                result.append((page, overlap))
+        return result
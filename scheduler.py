@@ -0,0 +1,247 @@
+# scheduler.py
+import asyncio
+import datetime as dt
+import json
+import logging
+import os
+import random
+import tempfile
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from time_utils import KST, now_kst, to_epoch, from_epoch
+
+TICK_SECONDS = 30
+MAX_SEARCH_DAYS = 366 * 5
+
+log = logging.getLogger("scheduler")
+
+
+def _parse_field(field: str, lo: int, hi: int) -> Set[int]:
+    values: Set[int] = set()
+    for part in field.split(","):
+        step = 1
+        if "/" in part:
+            part, step_text = part.split("/", 1)
+            step = int(step_text)
+        if part == "*":
+            start, end = lo, hi
+        elif "-" in part:
+            start_text, end_text = part.split("-", 1)
+            start, end = int(start_text), int(end_text)
+        else:
+            start = end = int(part)
+        if start < lo or end > hi or start > end or step < 1:
+            raise ValueError(f"범위를 벗어난 cron 값: {field}")
+        values.update(range(start, end + 1, step))
+    return values
+
+
+class CronSpec:
+    """KST 기준 5필드 cron 식 (분 시 일 월 요일). 요일은 0(또는 7)=일요일."""
+
+    def __init__(self, expr: str):
+        fields = expr.split()
+        if len(fields) != 5:
+            raise ValueError(f"cron 식은 5개 필드여야 합니다: {expr!r}")
+        self.expr = expr
+        self.minutes = _parse_field(fields[0], 0, 59)
+        self.hours = _parse_field(fields[1], 0, 23)
+        self.days = _parse_field(fields[2], 1, 31)
+        self.months = _parse_field(fields[3], 1, 12)
+        self.weekdays = {d % 7 for d in _parse_field(fields[4], 0, 7)}
+        self._dom_any = fields[2] == "*"
+        self._dow_any = fields[4] == "*"
+        self._sorted_hours = sorted(self.hours)
+        self._sorted_minutes = sorted(self.minutes)
+
+    def _day_matches(self, day: dt.date) -> bool:
+        if day.month not in self.months:
+            return False
+        dom_ok = day.day in self.days
+        dow_ok = (day.weekday() + 1) % 7 in self.weekdays
+        # 표준 cron처럼 일/요일이 둘 다 지정되면 둘 중 하나만 맞아도 됩니다.
+        if self._dom_any or self._dow_any:
+            return dom_ok and dow_ok
+        return dom_ok or dow_ok
+
+    def _slots(self, day: dt.date) -> List[dt.datetime]:
+        return [
+            dt.datetime(day.year, day.month, day.day, h, m, tzinfo=KST)
+            for h in self._sorted_hours
+            for m in self._sorted_minutes
+        ]
+
+    def next_after(self, moment: dt.datetime) -> dt.datetime:
+        moment = moment.astimezone(KST)
+        day = moment.date()
+        for _ in range(MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for slot in self._slots(day):
+                    if slot > moment:
+                        return slot
+            day += dt.timedelta(days=1)
+        raise ValueError(f"다음 실행 시각을 찾을 수 없습니다: {self.expr}")
+
+    def prev_at_or_before(self, moment: dt.datetime) -> Optional[dt.datetime]:
+        moment = moment.astimezone(KST)
+        day = moment.date()
+        for _ in range(MAX_SEARCH_DAYS):
+            if self._day_matches(day):
+                for slot in reversed(self._slots(day)):
+                    if slot <= moment:
+                        return slot
+            day -= dt.timedelta(days=1)
+        return None
+
+
+class Job:
+    def __init__(
+        self,
+        name: str,
+        spec: CronSpec,
+        callback: Callable[[], Awaitable[None]],
+        catch_up: dt.timedelta,
+        jitter: float,
+    ):
+        self.name = name
+        self.spec = spec
+        self.callback = callback
+        self.catch_up = catch_up
+        self.jitter = jitter
+        self.next_slot: Optional[dt.datetime] = None    # 다음 예정 시각 (cron 기준)
+        self.next_run_at: Optional[dt.datetime] = None  # jitter를 더한 실제 실행 시각
+
+
+class JobScheduler:
+    """cog들이 등록한 정기 작업을 실행하고, 마지막 실행 시각을 파일에 남겨 놓친 실행을 따라잡습니다.
+
+    ledger에는 작업별로 마지막으로 처리한 cron 예정 시각(epoch)을 저장합니다.
+    봇이 꺼져 있던 동안 예정 시각이 지나갔다면, 시작 후 catch_up 범위 안일 때 한 번 실행합니다.
+    """
+
+    def __init__(self, ledger_file: str):
+        self.ledger_file = ledger_file
+        self.jobs: Dict[str, Job] = {}
+        self.ledger: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup = asyncio.Event()
+        self._load_ledger()
+
+    def _load_ledger(self):
+        if not os.path.exists(self.ledger_file):
+            return
+        try:
+            with open(self.ledger_file, "r", encoding="utf-8") as f:
+                self.ledger = {k: int(v) for k, v in json.load(f).items()}
+        except Exception as e:
+            log.error("실행 기록 로드 실패: %s", e)
+
+    def _save_ledger(self):
+        directory = os.path.dirname(self.ledger_file) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix="scheduler_", suffix=".json", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(self.ledger, f)
+            os.replace(temp_path, self.ledger_file)
+        except Exception as e:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            log.error("실행 기록 저장 실패: %s", e)
+
+    def register(
+        self,
+        name: str,
+        cron: str,
+        callback: Callable[[], Awaitable[None]],
+        catch_up: dt.timedelta = dt.timedelta(0),
+        jitter: float = 0.0,
+    ):
+        self.jobs[name] = Job(name, CronSpec(cron), callback, catch_up, jitter)
+        self._wakeup.set()
+        log.info("작업 등록: %s '%s' catch_up=%s jitter=%ss", name, cron, catch_up, jitter, extra={"job": name})
+
+    def unregister(self, name: str):
+        self.jobs.pop(name, None)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _prepare(self, job: Job, now: dt.datetime):
+        """처음 보는 작업의 다음 실행 시각을 정합니다. 놓친 실행이 있으면 지금 실행하도록 잡습니다."""
+        last = self.ledger.get(job.name)
+        prev_slot = job.spec.prev_at_or_before(now)
+        if last is None:
+            # 처음 등록된 작업은 과거 실행을 따라잡지 않고 다음 예정 시각부터 시작합니다.
+            self.ledger[job.name] = to_epoch(prev_slot) if prev_slot else to_epoch(now)
+            self._save_ledger()
+        elif prev_slot is not None and last < to_epoch(prev_slot):
+            if now - prev_slot <= job.catch_up:
+                log.info("놓친 실행 따라잡기: %s (예정 %s)", job.name, prev_slot.isoformat(), extra={"job": job.name})
+                job.next_slot = prev_slot
+                job.next_run_at = now
+                return
+            log.warning(
+                "놓친 실행 생략 (catch_up 초과): %s (예정 %s)",
+                job.name,
+                prev_slot.isoformat(),
+                extra={"job": job.name},
+            )
+            self.ledger[job.name] = to_epoch(prev_slot)
+            self._save_ledger()
+        self._schedule_next(job, now)
+
+    def _schedule_next(self, job: Job, now: dt.datetime):
+        job.next_slot = job.spec.next_after(now)
+        offset = random.uniform(0, job.jitter) if job.jitter else 0.0
+        job.next_run_at = job.next_slot + dt.timedelta(seconds=offset)
+
+    async def _run_job(self, job: Job, now: dt.datetime):
+        slot = job.next_slot
+        try:
+            await job.callback()
+        except asyncio.CancelledError:
+            # 종료(stop) 중에 끊긴 실행은 처리하지 않은 것으로 두어, 다음 시작 때 catch_up 범위 안이면 다시 실행합니다.
+            raise
+        except Exception:
+            log.exception("작업 실패: %s", job.name, extra={"job": job.name})
+        # 실패해도 같은 예정 시각을 반복 실행하지 않도록 처리한 것으로 기록합니다.
+        self.ledger[job.name] = to_epoch(slot)
+        self._save_ledger()
+        self._schedule_next(job, max(now, slot))
+
+    async def _run(self):
+        while True:
+            self._wakeup.clear()
+            now = now_kst()
+            for job in list(self.jobs.values()):
+                if job.next_run_at is None:
+                    self._prepare(job, now)
+                if job.next_run_at is not None and job.next_run_at <= now:
+                    await self._run_job(job, now)
+
+            upcoming = [j.next_run_at for j in self.jobs.values() if j.next_run_at]
+            delay = TICK_SECONDS
+            if upcoming:
+                delay = max(0.0, min(delay, (min(upcoming) - now_kst()).total_seconds()))
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def describe(self) -> List[str]:
+        lines = []
+        for job in self.jobs.values():
+            last = self.ledger.get(job.name)
+            last_text = from_epoch(last).strftime("%Y-%m-%d %H:%M") if last else "-"
+            next_text = job.next_run_at.strftime("%Y-%m-%d %H:%M:%S") if job.next_run_at else "-"
+            lines.append(f"{job.name} `{job.spec.expr}` 마지막={last_text} 다음={next_text}")
+        return lines
@@ -0,0 +1,220 @@
+# settings.py
+import json
+import logging
+import os
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import config
+from notion_rows import EVENT_KINDS
+
+log = logging.getLogger("settings")
+
+# !config 에서 값 대신 설정 여부만 보여 줄 환경변수
+SECRET_NAMES = ("DISCORD_TOKEN", "NOTION_TOKEN", "DD_API_KEY")
+
+# 디스코드 표시 이름 -> Notion 태그 이름 (settings.json 의 discord_to_notion_name 으로 덮어씁니다)
+DEFAULT_DISCORD_TO_NOTION_NAME = {
+    "이유": "임아리",
+    "SAK": "김성아",
+    "민둥": "장민지",
+}
+
+
+def _int(value: Any) -> int:
+    if isinstance(value, bool):
+        raise ValueError("정수여야 합니다")
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    if not isinstance(value, int):
+        raise ValueError("정수여야 합니다")
+    return value
+
+
+def _channel_id(value: Any) -> int:
+    value = _int(value)
+    if value < 0:
+        raise ValueError("0 이상이어야 합니다 (0 = 사용 안 함)")
+    return value
+
+
+def _required_channel_id(value: Any) -> int:
+    value = _int(value)
+    if value <= 0:
+        raise ValueError("비워 둘 수 없습니다")
+    return value
+
+
+def _seconds(value: Any) -> int:
+    value = _int(value)
+    if value < 0:
+        raise ValueError("0 이상이어야 합니다")
+    return value
+
+
+def _positive(value: Any) -> int:
+    value = _int(value)
+    if value < 1:
+        raise ValueError("1 이상이어야 합니다")
+    return value
+
+
+def _name_map(value: Any) -> Dict[str, str]:
+    if not isinstance(value, dict):
+        raise ValueError("{\"디스코드 이름\": \"Notion 이름\"} 형식이어야 합니다")
+    for key, name in value.items():
+        if not isinstance(name, str) or not key.strip() or not name.strip():
+            raise ValueError(f"비어 있거나 문자열이 아닌 항목: {key!r}")
+    return {key.strip(): name.strip() for key, name in value.items()}
+
+
+def _event_list(value: Any) -> Tuple[str, ...]:
+    if isinstance(value, str):
+        value = [e.strip() for e in value.split(",") if e.strip()]
+    if not isinstance(value, list):
+        raise ValueError("이벤트 이름 목록이어야 합니다")
+    unknown = sorted(set(value) - set(EVENT_KINDS))
+    if unknown:
+        raise ValueError(f"알 수 없는 이벤트: {', '.join(unknown)} (가능: {', '.join(EVENT_KINDS)})")
+    return tuple(dict.fromkeys(value))
+
+
+# .env 의 알림 이벤트에 오타가 있어도 봇은 뜨도록, 기본값에서는 경고만 하고 뺍니다.
+_ENV_NOTIFY_EVENTS = [e for e in config.NOTION_FEATURE_NOTIFY_EVENTS if e in EVENT_KINDS]
+if len(_ENV_NOTIFY_EVENTS) != len(config.NOTION_FEATURE_NOTIFY_EVENTS):
+    log.warning(
+        "알 수 없는 알림 이벤트 무시: %s",
+        ", ".join(sorted(set(config.NOTION_FEATURE_NOTIFY_EVENTS) - set(EVENT_KINDS))),
+    )
+
+# settings.json 에서 바꿀 수 있는 값: 키 -> (검증 함수, 기본값)
+# 토큰, 음성 채널 ID, 데이터 파일 경로처럼 재시작이 필요한 값은 .env 에만 둡니다.
+FIELDS: Dict[str, Tuple[Callable[[Any], Any], Any]] = {
+    "report_channel_id_enter": (_required_channel_id, config.REPORT_CHANNEL_ID_ENTER),
+    "report_channel_id_feature": (_channel_id, config.REPORT_CHANNEL_ID_FEATURE),
+    "report_channel_id_deploy": (_channel_id, config.REPORT_CHANNEL_ID_DEPLOY),
+    "report_channel_id_alarm": (_channel_id, config.REPORT_CHANNEL_ID_ALARM),
+    "report_channel_id_daily": (_channel_id, config.REPORT_CHANNEL_ID_DAILY),
+    "mention_channel_id": (_channel_id, config.MENTION_CHANNEL_ID),
+    "discord_to_notion_name": (_name_map, DEFAULT_DISCORD_TO_NOTION_NAME),
+    "enter_alert_cooldown_seconds": (_seconds, 10 * 60),
+    "minimum_notion_record_seconds": (_seconds, 30 * 60),
+    "session_grace_seconds": (_seconds, config.SESSION_GRACE_SECONDS),
+    "inactive_study_days": (_positive, 3),
+    "notion_feature_notify_events": (_event_list, _ENV_NOTIFY_EVENTS),
+    "loop_lag_threshold_ms": (_positive, config.LOOP_LAG_THRESHOLD_MS),
+}
+
+
+class Settings:
+    """한 시점의 설정 값 묶음. 바꾸지 않고, 새 값이 오면 통째로 갈아 끼웁니다."""
+
+    __slots__ = tuple(FIELDS) + ("sources",)
+
+    report_channel_id_enter: int
+    report_channel_id_feature: int
+    report_channel_id_deploy: int
+    report_channel_id_alarm: int
+    report_channel_id_daily: int
+    mention_channel_id: int
+    discord_to_notion_name: Dict[str, str]
+    enter_alert_cooldown_seconds: int
+    minimum_notion_record_seconds: int
+    session_grace_seconds: int
+    inactive_study_days: int
+    notion_feature_notify_events: Tuple[str, ...]
+    loop_lag_threshold_ms: int
+
+    def __init__(self, values: Dict[str, Any], sources: Dict[str, str]):
+        for key in FIELDS:
+            setattr(self, key, values[key])
+        self.sources = sources  # 키 -> "file" | "env/default"
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {key: getattr(self, key) for key in FIELDS}
+
+
+def build_settings(overrides: Dict[str, Any]) -> Settings:
+    """기본값에 overrides를 덮어 검증합니다. 잘못된 값이 하나라도 있으면 전부 모아 ValueError를 냅니다."""
+    if not isinstance(overrides, dict):
+        raise ValueError("설정 파일 최상위는 객체여야 합니다")
+    errors = [f"{key}: 알 수 없는 설정" for key in overrides if key not in FIELDS]
+    values: Dict[str, Any] = {}
+    sources: Dict[str, str] = {}
+    for key, (validate, default) in FIELDS.items():
+        from_file = key in overrides
+        try:
+            values[key] = validate(overrides[key] if from_file else default)
+        except ValueError as e:
+            errors.append(f"{key}: {e}")
+        sources[key] = "file" if from_file else "env/default"
+    if errors:
+        raise ValueError("; ".join(errors))
+    return Settings(values, sources)
+
+
+def _mask(value: str) -> str:
+    return f"설정됨 ({len(value)}자)" if value else "미설정"
+
+
+class SettingsService:
+    """settings.json 을 읽어 검증된 Settings 를 제공합니다.
+
+    파일이 바뀌면 reload_if_changed()가 새 Settings 를 만들어 current 를 한 번에 바꿉니다.
+    검증에 실패하면 이전 값을 그대로 쓰고 last_error 에 이유를 남깁니다.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.current = build_settings({})
+        self.last_error: Optional[str] = None
+        self._stamp: Optional[Tuple[int, int]] = None
+        self.reload()
+
+    def _file_stamp(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def reload_if_changed(self) -> List[str]:
+        if self._file_stamp() == self._stamp:
+            return []
+        return self.reload()
+
+    def reload(self) -> List[str]:
+        """파일을 다시 읽어 적용하고, 값이 바뀐 키 목록을 반환합니다."""
+        stamp = self._file_stamp()
+        try:
+            overrides: Dict[str, Any] = {}
+            if stamp is not None:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    overrides = json.load(f)
+            new = build_settings(overrides)
+        except (OSError, ValueError) as e:  # json.JSONDecodeError 도 ValueError 입니다.
+            # 같은 잘못된 파일을 폴링마다 다시 읽지 않도록 stamp는 갱신합니다.
+            self._stamp = stamp
+            self.last_error = str(e)
+            log.error("설정 파일 적용 실패, 이전 설정을 유지합니다: %s", e, extra={"path": self.path})
+            return []
+
+        changed = [key for key in FIELDS if getattr(new, key) != getattr(self.current, key)]
+        self.current = new
+        self._stamp = stamp
+        self.last_error = None
+        if changed:
+            log.info("설정 변경 적용: %s", ", ".join(changed), extra={"changed": changed})
+        return changed
+
+    def describe(self) -> List[str]:
+        """!config 용 유효 설정 목록. 비밀 값은 설정 여부만 보여 줍니다."""
+        lines = [f"{name} = {_mask(os.getenv(name, ''))}" for name in SECRET_NAMES]
+        lines.append(f"VOICE_CHANNEL_ID = {config.VOICE_CHANNEL_ID} (env, 재시작 필요)")
+        lines.append(f"DATA_FILE = {config.DATA_FILE} (env, 재시작 필요)")
+        for key, value in self.current.as_dict().items():
+            if isinstance(value, tuple):
+                value = ",".join(value)
+            elif isinstance(value, dict):
+                value = json.dumps(value, ensure_ascii=False)
+            lines.append(f"{key} = {value} ({self.current.sources[key]})")
+        return lines
@@ -0,0 +1,56 @@
+# startup_report.py
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Set
+
+# 이 모듈이 처음 import되는 시점을 프로세스 시작으로 봅니다 (main.py에서 가장 먼저 import).
+PROCESS_STARTED = time.perf_counter()
+
+
+class StartupTimer:
+    """시작 단계별 소요 시간과 실패한 단계를 모아 두는 기록기."""
+
+    def __init__(self, started: float = PROCESS_STARTED):
+        self.started = started
+        self.durations: Dict[str, float] = {}
+        self.failures: Dict[str, str] = {}
+        self.concurrent: Set[str] = set()  # 다른 단계와 겹쳐 측정된 단계 (합산하면 안 됩니다)
+        self.total: float | None = None
+        self._open: Dict[str, float] = {}
+
+    def begin(self, name: str):
+        self._open[name] = time.perf_counter()
+
+    def end(self, name: str):
+        started = self._open.pop(name, None)
+        if started is not None:
+            self.durations[name] = time.perf_counter() - started
+
+    @contextmanager
+    def measure(self, name: str, concurrent: bool = False):
+        if concurrent:
+            self.concurrent.add(name)
+        self.begin(name)
+        try:
+            yield
+        finally:
+            self.end(name)
+
+    def fail(self, name: str, error: BaseException):
+        self.failures[name] = f"{type(error).__name__}: {error}"
+
+    def finish(self):
+        if self.total is None:
+            self.total = time.perf_counter() - self.started
+
+    def lines(self) -> List[str]:
+        lines = [
+            f"{name}: {seconds * 1000:.0f}ms" + (" (동시 로드 경과 시간)" if name in self.concurrent else "")
+            for name, seconds in self.durations.items()
+        ]
+        if self.total is not None:
+            lines.append(f"total: {self.total * 1000:.0f}ms")
+        return lines
+
+
+startup = StartupTimer()
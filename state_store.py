@@ -1,46 +1,263 @@
 # state_store.py
 import os
+import sys
 import json
-import datetime as dt
+import logging
+import struct
 import tempfile
-from typing import Dict, Any
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from time_utils import now_epoch, parse_iso, to_epoch, from_epoch
+
+# 바이너리 스냅샷 형식 (little endian)
+#   header        : magic(4s) version(H) reserved(H)
+#   tracking      : study_tracking_started_at(I)
+#   checkpoint    : checkpoint_at(I)
+#   members       : count(I) + [user_id(Q) total(I) session_start(I) last_study_at(I)
+#                                  session_origin(I) session_seconds(I) pending_leave_at(I)] * count
+#   progress      : count(I) + [page_id(str) seconds(I)] * count
+#   praised pages : count(I) + [page_id(str)] * count
+#   notion outbox : count(I) + [user_id(Q) start(I) end(I) notion_name(str)] * count
+# str 은 길이(H) + UTF-8 바이트입니다. 시각은 모두 epoch 초이고, 값이 없으면 0 입니다.
+SNAPSHOT_MAGIC = b"VTSS"
+SNAPSHOT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHH")
+_U32 = struct.Struct("<I")
+_U16 = struct.Struct("<H")
+_MEMBER = struct.Struct("<QIIIIII")
+_OUTBOX = struct.Struct("<QII")
+
+_NONE = 0
+
+log = logging.getLogger("state")
+
+
+def _opt(value: Optional[int]) -> int:
+    return _NONE if value is None else value
+
+
+def _unopt(value: int) -> Optional[int]:
+    return None if value == _NONE else value
+
+
+def _iso_to_epoch(value: Optional[str]) -> Optional[int]:
+    return to_epoch(parse_iso(value)) if value else None
+
+
+class MemberRecord:
+    """멤버 한 명의 상태.
+
+    잠깐 나갔다 들어오는 경우를 하나의 공부 세션으로 묶기 위해, 채널에 머문 구간(stint)과
+    논리적인 세션을 구분합니다. 퇴장하면 세션은 pending_leave_at 과 함께 유예 상태가 되고,
+    유예 시간 안에 다시 들어오면 같은 세션으로 이어집니다.
+    """
+
+    __slots__ = (
+        "total_seconds",
+        "session_start",
+        "last_study_at",
+        "session_origin",
+        "session_seconds",
+        "pending_leave_at",
+    )
+
+    def __init__(
+        self,
+        total_seconds: int = 0,
+        session_start: Optional[int] = None,
+        last_study_at: Optional[int] = None,
+        session_origin: Optional[int] = None,
+        session_seconds: int = 0,
+        pending_leave_at: Optional[int] = None,
+    ):
+        self.total_seconds = total_seconds        # 누적 초 [주간 리포트용]
+        self.session_start = session_start        # 현재 채널에 들어온 시각(epoch), 채널 밖이면 None
+        self.last_study_at = last_study_at        # 마지막 30분 이상 공부 시각(epoch)
+        self.session_origin = session_origin      # 논리 세션의 첫 입장 시각(epoch)
+        self.session_seconds = session_seconds    # 논리 세션에서 지금까지 채널에 머문 초
+        self.pending_leave_at = pending_leave_at  # 퇴장 후 유예 중이면 퇴장 시각(epoch)
+
+    def is_empty(self) -> bool:
+        return (
+            not self.total_seconds
+            and self.session_start is None
+            and self.last_study_at is None
+            and self.session_origin is None
+        )
+
+
+class NotionRecord:
+    """아직 Notion에 쓰지 못한 공부 기록. 세션 종료와 같은 save()로 함께 저장됩니다."""
+
+    __slots__ = ("user_id", "notion_name", "start_at", "end_at")
+
+    def __init__(self, user_id: int, notion_name: str, start_at: int, end_at: int):
+        self.user_id = user_id
+        self.notion_name = notion_name
+        self.start_at = start_at
+        self.end_at = end_at
 
-from time_utils import now_kst, parse_iso, iso
 
 class StateStore:
     def __init__(self, data_file: str):
+        # data_file 은 예전 JSON 경로입니다. 실제 저장은 같은 이름의 .bin 스냅샷에 합니다.
         self.data_file = data_file
-        self.state: Dict[str, Any] = {
-            "totals": {},           # user_id(str) -> 누적 초(int) [주간 리포트용]
-            "sessions": {},         # user_id(str) -> 시작시각(ISO str)
-            "last_study_at": {},    # user_id(str) -> 마지막 30분 이상 공부 시각(ISO str)
-            "study_tracking_started_at": None,
-            "schedule_progress": {}, # [추가] page_id(str) -> 누적 초(int) [일정별 칭찬용]
-            "praised_pages": []      # [추가] page_id(str) 목록 [중복 칭찬 방지용]
-        }
+        self.snapshot_file = os.path.splitext(data_file)[0] + ".bin"
+
+        self.members: Dict[int, MemberRecord] = {}          # user_id -> MemberRecord
+        self.study_tracking_started_at: Optional[int] = None
+        self.schedule_progress: Dict[str, int] = {}         # page_id -> 누적 초 [일정별 칭찬용]
+        self.praised_pages: Set[str] = set()                # 이미 칭찬한 page_id (중복 칭찬 방지용)
+        self.checkpoint_at: Optional[int] = None            # 봇이 마지막으로 살아 있던 것이 확인된 시각(epoch)
+        self.notion_outbox: List[NotionRecord] = []         # 전송 대기 중인 Notion 공부 기록
+
+    # ------------------------------------------------------------------
+    # 조회 / 변경
+    # ------------------------------------------------------------------
+    def record(self, user_id: int) -> MemberRecord:
+        rec = self.members.get(user_id)
+        if rec is None:
+            rec = self.members[user_id] = MemberRecord()
+        return rec
+
+    def _prune(self, user_id: int):
+        rec = self.members.get(user_id)
+        if rec is not None and rec.is_empty():
+            del self.members[user_id]
+
+    def start_session(self, user_id: int, at: Optional[int] = None):
+        """채널 입장. 유예 중인 세션이 있으면 그 세션에 이어 붙입니다 (유예 만료 판단은 호출한 쪽에서)."""
+        rec = self.record(user_id)
+        rec.session_start = now_epoch() if at is None else at
+        if rec.session_origin is None:
+            rec.session_origin = rec.session_start
+        rec.pending_leave_at = None
+
+    def session_start(self, user_id: int) -> Optional[int]:
+        rec = self.members.get(user_id)
+        return rec.session_start if rec else None
+
+    def open_sessions(self) -> Dict[int, int]:
+        return {uid: rec.session_start for uid, rec in self.members.items() if rec.session_start is not None}
+
+    def add_session_time(self, user_id: int, until: Optional[int] = None) -> int:
+        rec = self.members.get(user_id)
+        if rec is None or rec.session_start is None:
+            return 0 # 경과 시간 반환하도록 수정
+        end = now_epoch() if until is None else until
+        elapsed = end - rec.session_start
+        if elapsed > 0:
+            rec.total_seconds += elapsed
+            rec.session_seconds += elapsed
+        return elapsed
+
+    def end_session(self, user_id: int, until: Optional[int] = None) -> Tuple[Optional[int], int]:
+        """채널 퇴장. 머문 시간을 누적하고 세션을 유예 상태로 둡니다. (이번 입장 시각, 경과 초)를 반환합니다."""
+        start = self.session_start(user_id)
+        elapsed = self.add_session_time(user_id, until)
+        if start is not None:
+            rec = self.members[user_id]
+            rec.session_start = None
+            rec.pending_leave_at = now_epoch() if until is None else until
+        return start, elapsed
+
+    def pending_sessions(self) -> Dict[int, int]:
+        """퇴장 후 유예 중인 세션: user_id -> 퇴장 시각."""
+        return {uid: rec.pending_leave_at for uid, rec in self.members.items() if rec.pending_leave_at is not None}
+
+    def pending_leave_at(self, user_id: int) -> Optional[int]:
+        rec = self.members.get(user_id)
+        return rec.pending_leave_at if rec else None
+
+    def finalize_session(self, user_id: int) -> Optional[Tuple[int, int, int]]:
+        """유예 중인 세션을 확정합니다. (첫 입장 시각, 마지막 퇴장 시각, 머문 초)를 반환합니다."""
+        rec = self.members.get(user_id)
+        if rec is None or rec.pending_leave_at is None:
+            return None
+        origin = rec.session_origin if rec.session_origin is not None else rec.pending_leave_at
+        result = (origin, rec.pending_leave_at, rec.session_seconds)
+        rec.session_origin = None
+        rec.session_seconds = 0
+        rec.pending_leave_at = None
+        self._prune(user_id)
+        return result
+
+    def mark_studied(self, user_id: int, at: int):
+        self.record(user_id).last_study_at = at
+
+    def last_study_at(self, user_id: int) -> Optional[int]:
+        rec = self.members.get(user_id)
+        return rec.last_study_at if rec else None
 
+    def totals(self) -> List[Tuple[int, int]]:
+        items = [(uid, rec.total_seconds) for uid, rec in self.members.items() if rec.total_seconds]
+        items.sort(key=lambda kv: kv[1], reverse=True)
+        return items
+
+    def reset_totals(self):
+        for uid in list(self.members):
+            self.members[uid].total_seconds = 0
+            self._prune(uid)
+
+    def credit_schedule(self, page_id: str, seconds: int) -> int:
+        """일정 page에 공부 시간을 더하고 누적 초를 반환합니다."""
+        total = self.schedule_progress.get(page_id, 0) + seconds
+        self.schedule_progress[page_id] = total
+        return total
+
+    def mark_praised(self, page_id: str) -> bool:
+        """처음 칭찬하는 page면 기록하고 True, 이미 칭찬했으면 False를 반환합니다."""
+        if page_id in self.praised_pages:
+            return False
+        self.praised_pages.add(page_id)
+        return True
+
+    def unmark_praised(self, page_id: str):
+        """칭찬 전송에 실패했을 때 다음 적립에서 다시 칭찬하도록 기록을 지웁니다."""
+        self.praised_pages.discard(page_id)
+
+    def retain_schedule_pages(self, page_ids: Iterable[str]):
+        """더 이상 추적하지 않는 일정의 진행도와 칭찬 기록을 정리합니다."""
+        keep = set(page_ids)
+        self.schedule_progress = {k: v for k, v in self.schedule_progress.items() if k in keep}
+        self.praised_pages &= keep
+
+    def enqueue_notion_record(self, user_id: int, notion_name: str, start_at: int, end_at: int) -> NotionRecord:
+        record = NotionRecord(user_id, notion_name, start_at, end_at)
+        self.notion_outbox.append(record)
+        return record
+
+    def complete_notion_record(self, record: NotionRecord):
+        try:
+            self.notion_outbox.remove(record)
+        except ValueError:
+            pass
+
+    # ------------------------------------------------------------------
+    # 저장 / 로드
+    # ------------------------------------------------------------------
     def load(self):
-        if os.path.exists(self.data_file):
-            try:
+        try:
+            if os.path.exists(self.snapshot_file):
+                with open(self.snapshot_file, "rb") as f:
+                    self._decode(f.read())
+            elif os.path.exists(self.data_file):
+                # 예전 JSON 형식이면 읽어서 다음 save() 때 바이너리로 옮깁니다.
                 with open(self.data_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    self.state["totals"] = data.get("totals", {})
-                    self.state["sessions"] = data.get("sessions", {})
-                    self.state["last_study_at"] = data.get("last_study_at", {})
-                    self.state["study_tracking_started_at"] = data.get("study_tracking_started_at")
-                    self.state["schedule_progress"] = data.get("schedule_progress", {})
-                    self.state["praised_pages"] = data.get("praised_pages", [])
-            except Exception:
-                pass
+                    self.import_dict(json.load(f))
+                log.info("JSON 상태 파일을 읽었습니다. 다음 저장부터 %s 사용", self.snapshot_file)
+        except Exception:
+            log.exception("상태 로드 실패")
 
     def save(self):
-        directory = os.path.dirname(self.data_file) or "."
+        directory = os.path.dirname(self.snapshot_file) or "."
         os.makedirs(directory, exist_ok=True)
-        fd, temp_path = tempfile.mkstemp(prefix="state_", suffix=".json", dir=directory)
+        fd, temp_path = tempfile.mkstemp(prefix="state_", suffix=".bin", dir=directory)
         try:
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                json.dump(self.state, f, ensure_ascii=False)
-            os.replace(temp_path, self.data_file)
+            with os.fdopen(fd, "wb") as f:
+                f.write(self._encode())
+            os.replace(temp_path, self.snapshot_file)
         except Exception:
             try:
                 os.unlink(temp_path)
@@ -48,14 +265,170 @@ class StateStore:
                 pass
             raise
 
-    def add_session_time(self, user_id: int, until: dt.datetime | None = None):
-        uid = str(user_id)
-        start_iso = self.state["sessions"].get(uid)
-        if not start_iso:
-            return 0 # 경과 시간 반환하도록 수정
-        start = parse_iso(start_iso)
-        end = until or now_kst()
-        elapsed = int((end - start).total_seconds())
-        if elapsed > 0:
-            self.state["totals"][uid] = self.state["totals"].get(uid, 0) + elapsed
-        return elapsed
+    def _encode(self) -> bytes:
+        parts = [
+            _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0),
+            _U32.pack(_opt(self.study_tracking_started_at)),
+            _U32.pack(_opt(self.checkpoint_at)),
+            _U32.pack(len(self.members)),
+        ]
+        pack_member = _MEMBER.pack
+        for uid, rec in self.members.items():
+            parts.append(
+                pack_member(
+                    uid,
+                    rec.total_seconds,
+                    _opt(rec.session_start),
+                    _opt(rec.last_study_at),
+                    _opt(rec.session_origin),
+                    rec.session_seconds,
+                    _opt(rec.pending_leave_at),
+                )
+            )
+
+        parts.append(_U32.pack(len(self.schedule_progress)))
+        for page_id, seconds in self.schedule_progress.items():
+            raw = page_id.encode("utf-8")
+            parts.append(_U16.pack(len(raw)) + raw + _U32.pack(seconds))
+
+        parts.append(_U32.pack(len(self.praised_pages)))
+        for page_id in sorted(self.praised_pages):
+            raw = page_id.encode("utf-8")
+            parts.append(_U16.pack(len(raw)) + raw)
+
+        parts.append(_U32.pack(len(self.notion_outbox)))
+        for record in self.notion_outbox:
+            raw = record.notion_name.encode("utf-8")
+            parts.append(_OUTBOX.pack(record.user_id, record.start_at, record.end_at) + _U16.pack(len(raw)) + raw)
+        return b"".join(parts)
+
+    def _decode(self, data: bytes):
+        view = memoryview(data)
+        magic, version, _ = _HEADER.unpack_from(view, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("상태 스냅샷 형식이 아닙니다.")
+        if version != SNAPSHOT_VERSION:
+            raise ValueError(f"지원하지 않는 스냅샷 버전입니다: {version}")
+        offset = _HEADER.size
+
+        def read_str() -> str:
+            nonlocal offset
+            (length,) = _U16.unpack_from(view, offset)
+            offset += _U16.size
+            value = bytes(view[offset : offset + length]).decode("utf-8")
+            offset += length
+            return value
+
+        tracking, checkpoint = struct.unpack_from("<II", view, offset)
+        offset += 2 * _U32.size
+
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        members: Dict[int, MemberRecord] = {}
+        chunk = view[offset : offset + count * _MEMBER.size]
+        for uid, total, session_start, last_study, origin, seconds, pending in _MEMBER.iter_unpack(chunk):
+            members[uid] = MemberRecord(
+                total, _unopt(session_start), _unopt(last_study), _unopt(origin), seconds, _unopt(pending)
+            )
+        offset += count * _MEMBER.size
+
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        progress: Dict[str, int] = {}
+        for _ in range(count):
+            page_id = read_str()
+            (progress[page_id],) = _U32.unpack_from(view, offset)
+            offset += _U32.size
+
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        praised = {read_str() for _ in range(count)}
+
+        (count,) = _U32.unpack_from(view, offset)
+        offset += _U32.size
+        outbox: List[NotionRecord] = []
+        for _ in range(count):
+            uid, start_at, end_at = _OUTBOX.unpack_from(view, offset)
+            offset += _OUTBOX.size
+            outbox.append(NotionRecord(uid, read_str(), start_at, end_at))
+
+        self.study_tracking_started_at = _unopt(tracking)
+        self.checkpoint_at = _unopt(checkpoint)
+        self.notion_outbox = outbox
+        self.members = members
+        self.schedule_progress = progress
+        self.praised_pages = praised
+
+    # ------------------------------------------------------------------
+    # JSON 변환 (예전 형식 호환 / 디버깅용)
+    # ------------------------------------------------------------------
+    def import_dict(self, data: dict):
+        members: Dict[int, MemberRecord] = {}
+
+        def rec(uid: str) -> MemberRecord:
+            return members.setdefault(int(uid), MemberRecord())
+
+        for uid, seconds in data.get("totals", {}).items():
+            rec(uid).total_seconds = int(seconds)
+        for uid, start_iso in data.get("sessions", {}).items():
+            rec(uid).session_start = rec(uid).session_origin = _iso_to_epoch(start_iso)
+        for uid, origin_iso in data.get("session_origins", {}).items():
+            rec(uid).session_origin = _iso_to_epoch(origin_iso)
+        for uid, seconds in data.get("session_seconds", {}).items():
+            rec(uid).session_seconds = int(seconds)
+        for uid, leave_iso in data.get("pending_leaves", {}).items():
+            rec(uid).pending_leave_at = _iso_to_epoch(leave_iso)
+        for uid, study_iso in data.get("last_study_at", {}).items():
+            rec(uid).last_study_at = _iso_to_epoch(study_iso)
+
+        self.members = members
+        self.study_tracking_started_at = _iso_to_epoch(data.get("study_tracking_started_at"))
+        self.schedule_progress = {k: int(v) for k, v in data.get("schedule_progress", {}).items()}
+        self.praised_pages = set(data.get("praised_pages", []))
+        self.checkpoint_at = _iso_to_epoch(data.get("checkpoint_at"))
+        self.notion_outbox = [
+            NotionRecord(int(r["user_id"]), r["notion_name"], _iso_to_epoch(r["start_at"]), _iso_to_epoch(r["end_at"]))
+            for r in data.get("notion_outbox", [])
+        ]
+
+    def export_dict(self) -> dict:
+        def iso_or_none(value: Optional[int]) -> Optional[str]:
+            return from_epoch(value).isoformat() if value is not None else None
+
+        return {
+            "totals": {str(uid): rec.total_seconds for uid, rec in self.members.items() if rec.total_seconds},
+            "sessions": {str(uid): iso_or_none(rec.session_start) for uid, rec in self.members.items() if rec.session_start is not None},
+            "last_study_at": {str(uid): iso_or_none(rec.last_study_at) for uid, rec in self.members.items() if rec.last_study_at is not None},
+            "session_origins": {str(uid): iso_or_none(rec.session_origin) for uid, rec in self.members.items() if rec.session_origin is not None},
+            "session_seconds": {str(uid): rec.session_seconds for uid, rec in self.members.items() if rec.session_seconds},
+            "pending_leaves": {str(uid): iso_or_none(rec.pending_leave_at) for uid, rec in self.members.items() if rec.pending_leave_at is not None},
+            "study_tracking_started_at": iso_or_none(self.study_tracking_started_at),
+            "schedule_progress": dict(self.schedule_progress),
+            "praised_pages": sorted(self.praised_pages),
+            "checkpoint_at": iso_or_none(self.checkpoint_at),
+            "notion_outbox": [
+                {
+                    "user_id": str(r.user_id),
+                    "notion_name": r.notion_name,
+                    "start_at": iso_or_none(r.start_at),
+                    "end_at": iso_or_none(r.end_at),
+                }
+                for r in self.notion_outbox
+            ],
+        }
+
+    def export_json(self, path: str):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.export_dict(), f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    # 사용법: python state_store.py <DATA_FILE> [출력.json]
+    #   바이너리 스냅샷을 사람이 읽을 수 있는 JSON으로 내보냅니다.
+    if len(sys.argv) < 2:
+        raise SystemExit("사용법: python state_store.py <DATA_FILE> [출력.json]")
+    store = StateStore(sys.argv[1])
+    store.load()
+    out = sys.argv[2] if len(sys.argv) > 2 else os.path.splitext(sys.argv[1])[0] + ".export.json"
+    store.export_json(out)
+    print(f"{out} 로 내보냈습니다 (members={len(store.members)})")
@@ -0,0 +1,11 @@
+# tests/conftest.py
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# config.py 는 import 시점에 환경 변수를 읽으므로 테스트용 값을 먼저 채웁니다.
+os.environ.setdefault("DISCORD_TOKEN", "test-token")
+os.environ.setdefault("VOICE_CHANNEL_ID", "1")
+os.environ.setdefault("REPORT_CHANNEL_ID_ENTER", "2")
@@ -0,0 +1,95 @@
+# tests/test_log_setup.py
+import json
+import logging
+
+import pytest
+
+import log_setup
+from log_setup import RateLimitFilter, setup_logging, stop_logging
+
+
+@pytest.fixture
+def root_logging():
+    root = logging.getLogger()
+    saved = root.handlers[:], root.level
+    touched = ["voice", "notion"]
+    saved_levels = {name: logging.getLogger(name).level for name in touched}
+    yield
+    stop_logging()
+    root.handlers[:], level = saved
+    root.setLevel(level)
+    for name, sub_level in saved_levels.items():
+        logging.getLogger(name).setLevel(sub_level)
+
+
+def _lines(capsys):
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines() if line.strip()]
+
+
+def test_invalid_levels_fall_back_to_info_with_warning(root_logging, capsys):
+    setup_logging("FOO", {"voice": "debug", "notion": "LOUD"}, "json")
+
+    assert logging.getLogger().level == logging.INFO
+    assert logging.getLogger("voice").level == logging.DEBUG
+    assert logging.getLogger("notion").level == logging.NOTSET
+    stop_logging()
+
+    warnings = [line for line in _lines(capsys) if line["status"] == "warning"]
+    assert len(warnings) == 1
+    assert warnings[0]["logger"]["name"] == "startup"
+    assert "LOG_LEVEL=FOO" in warnings[0]["message"] and "notion=LOUD" in warnings[0]["message"]
+
+
+def test_valid_levels_are_applied(root_logging, capsys):
+    setup_logging("warning", {"voice": "10"}, "json")
+    assert logging.getLogger().level == logging.WARNING
+    assert logging.getLogger("voice").level == logging.DEBUG
+    stop_logging()
+    assert _lines(capsys) == []
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _record(msg="poll", name="notion", **extra):
+    record = logging.LogRecord(name, logging.INFO, __file__, 1, msg, (), None)
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_rate_limit_filter_passes_once_per_interval(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(log_setup.time, "monotonic", clock)
+    limiter = RateLimitFilter()
+
+    assert limiter.filter(_record(rate_limit=60))
+    assert not limiter.filter(_record(rate_limit=60))
+    clock.now += 30
+    assert not limiter.filter(_record(rate_limit=60))
+
+    clock.now += 31
+    passed = _record(rate_limit=60)
+    assert limiter.filter(passed)
+    assert passed.suppressed == 2
+
+    # rate_limit 이 없거나 0 이면 항상 통과합니다.
+    assert limiter.filter(_record())
+    assert limiter.filter(_record(rate_limit=0))
+
+
+def test_rate_limit_filter_counts_keys_and_loggers_separately(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(log_setup.time, "monotonic", clock)
+    limiter = RateLimitFilter()
+
+    assert limiter.filter(_record(rate_limit=60, rate_key="poll:feature"))
+    assert limiter.filter(_record(rate_limit=60, rate_key="poll:board"))
+    assert not limiter.filter(_record(rate_limit=60, rate_key="poll:feature"))
+    assert limiter.filter(_record(name="voice", rate_limit=60, rate_key="poll:feature"))
+    assert limiter.filter(_record(msg="other %s", rate_limit=60))
@@ -0,0 +1,111 @@
+# tests/test_member_directory.py
+import asyncio
+from types import SimpleNamespace
+
+from benchmarks.fakes import FakeBot, FakeGuild, FakeMember
+from cogs.member_directory import MemberDirectory, MemberDirectoryCog
+
+
+class _Role:
+    def __init__(self, role_id: int):
+        self.id = role_id
+
+    def __eq__(self, other):
+        return isinstance(other, _Role) and other.id == self.id
+
+    def __hash__(self):
+        return hash(self.id)
+
+
+def _guild(*names):
+    guild = FakeGuild(1)
+    for i, name in enumerate(names, start=100):
+        guild.add_member(FakeMember(i, name.lower(), name))
+    return guild
+
+
+def test_partial_matches_are_sorted_by_display_name_then_id():
+    guild = _guild("민지c", "민지a", "민지b", "다른사람")
+    guild.add_member(FakeMember(1, "dup", "민지a"))
+    directory = MemberDirectory()
+
+    found = [(m.display_name, m.id) for m in directory.find_partial(guild, "민지")]
+    assert found == [("민지a", 1), ("민지a", 101), ("민지b", 102), ("민지c", 100)]
+
+
+def test_exact_matches_are_sorted():
+    guild = FakeGuild(1)
+    guild.add_member(FakeMember(30, "z", "같은이름"))
+    guild.add_member(FakeMember(10, "a", "같은이름"))
+    found = [m.id for m in MemberDirectory().find_exact(guild, "같은 이름")]
+    assert found == [10, 30]
+
+
+def _cog_with_index(guild):
+    bot = FakeBot()
+    bot.add_guild(guild)
+    cog = MemberDirectoryCog(bot)
+    asyncio.run(cog.on_ready())
+    return cog, cog.directory
+
+
+def test_member_join_and_leave_update_built_index():
+    guild = _guild("임아리")
+    cog, directory = _cog_with_index(guild)
+
+    newcomer = guild.add_member(FakeMember(200, "sa", "김성아"))
+    asyncio.run(cog.on_member_join(newcomer))
+    assert directory.find_exact(guild, "김성아") == [newcomer]
+    assert directory.human_count(guild) == 2
+
+    bot_member = FakeMember(201, "helper", "도우미", bot=True, guild=guild)
+    asyncio.run(cog.on_member_join(bot_member))
+    assert directory.find_exact(guild, "도우미") == []
+
+    payload = SimpleNamespace(guild_id=guild.id, user=SimpleNamespace(id=200))
+    asyncio.run(cog.on_raw_member_remove(payload))
+    assert directory.find_exact(guild, "김성아") == []
+    assert "김성아" not in directory.guilds[guild.id].by_name
+    assert directory.human_count(guild) == 1
+
+
+def test_nickname_change_reindexes_names():
+    guild = FakeGuild(1)
+    before = guild.add_member(FakeMember(100, "ari", "임아리"))
+    cog, directory = _cog_with_index(guild)
+    after = FakeMember(100, before.name, "이유", guild=guild)
+    after.nick = "이유"
+
+    asyncio.run(cog.on_member_update(before, after))
+    assert directory.find_exact(guild, "이유") == [after]
+    assert directory.find_exact(guild, "임아리") == []
+    assert directory.find_exact(guild, before.name) == [after]
+
+
+def test_role_change_reindexes_roles():
+    guild = _guild("임아리")
+    cog, directory = _cog_with_index(guild)
+    before = guild.get_member(100)
+    before.roles = [_Role(1)]
+    asyncio.run(cog.on_member_update(FakeMember(100, before.name, before.display_name, guild=guild), before))
+    assert directory.members_with_role(guild, 1) == [before]
+
+    after = FakeMember(100, before.name, before.display_name, guild=guild)
+    after.roles = [_Role(2)]
+    asyncio.run(cog.on_member_update(before, after))
+    assert directory.members_with_role(guild, 1) == []
+    assert directory.members_with_role(guild, 2) == [after]
+    assert 1 not in directory.guilds[guild.id].by_role
+
+
+def test_unrelated_update_keeps_index_and_unbuilt_guild_is_not_indexed():
+    guild = _guild("임아리")
+    cog, directory = _cog_with_index(guild)
+    member = guild.get_member(100)
+    index = directory.guilds[guild.id]
+    asyncio.run(cog.on_member_update(member, member))
+    assert directory.guilds[guild.id] is index
+
+    other = FakeGuild(2)
+    asyncio.run(cog.on_member_join(FakeMember(300, "x", "새멤버", guild=other)))
+    assert other.id not in directory.guilds
@@ -0,0 +1,127 @@
+# tests/test_notion_rows.py
+import json
+
+import pytest
+
+from benchmarks.fake_notion import FakeNotionServer
+from benchmarks.fakes import FakeBot
+from cogs.notion_watcher import MAX_FEATURE_FINGERPRINTS, NotionWatcherCog
+from notion_rows import (
+    COMPLETED,
+    CREATED,
+    DESCRIBED,
+    REASSIGNED,
+    RENAMED,
+    STATUS_CHANGED,
+    diff_rows,
+    prune_fingerprints,
+)
+
+_props = FakeNotionServer().feature_properties
+
+
+def _row(row_id: str, title="출석 통계", description="설명", status="요청", assignee="임아리"):
+    return {"id": row_id, "properties": _props(title, description, status, assignee)}
+
+
+def _kinds(rows, fingerprints):
+    events, changed = diff_rows(rows, fingerprints)
+    return [(e.kind, e.row.id) for e in events], changed
+
+
+def test_new_row_is_created_and_unchanged_row_is_quiet():
+    fingerprints = {}
+    assert _kinds([_row("a")], fingerprints) == ([(CREATED, "a")], True)
+    assert _kinds([_row("a")], fingerprints) == ([], False)
+
+
+@pytest.mark.parametrize(
+    "before, after, kind",
+    [
+        ({"status": "요청"}, {"status": "진행 중"}, STATUS_CHANGED),
+        ({"status": "진행 중"}, {"status": "완료"}, COMPLETED),
+        ({"status": "완료"}, {"status": "진행 중"}, STATUS_CHANGED),
+        ({"title": "출석 통계"}, {"title": "출석 통계 v2"}, RENAMED),
+        ({"description": "설명"}, {"description": "새 설명"}, DESCRIBED),
+        ({"assignee": "임아리"}, {"assignee": "김성아"}, REASSIGNED),
+    ],
+)
+def test_each_field_change_emits_its_event(before, after, kind):
+    fingerprints = {}
+    diff_rows([_row("a", **before)], fingerprints)
+    assert _kinds([_row("a", **after)], fingerprints) == ([(kind, "a")], True)
+    assert _kinds([_row("a", **after)], fingerprints) == ([], False)
+
+
+def test_several_field_changes_emit_one_event_each():
+    fingerprints = {}
+    diff_rows([_row("a")], fingerprints)
+    kinds, _ = _kinds([_row("a", title="새 제목", status="완료", assignee="Alex")], fingerprints)
+    assert sorted(kind for kind, _ in kinds) == sorted([COMPLETED, RENAMED, REASSIGNED])
+
+
+def _cog_with_file(tmp_path, data) -> NotionWatcherCog:
+    cog = NotionWatcherCog(FakeBot())
+    cog.db_file = str(tmp_path / "notion_db.json")
+    with open(cog.db_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    cog.load_state()
+    return cog
+
+
+def test_legacy_seen_ids_file_is_migrated(tmp_path):
+    cog = _cog_with_file(
+        tmp_path,
+        {
+            "features": ["done", "open", "reopened", "seen-only"],
+            "feature_statuses": {"done": "완료", "open": "요청", "reopened": "완료"},
+            "boards": ["board-1"],
+        },
+    )
+    assert set(cog.feature_rows) == {"done", "open", "reopened", "seen-only"}
+    assert cog.last_board_row_ids == {"board-1"}
+
+    rows = [
+        _row("done", status="완료", title="바뀐 제목"),  # 예전 파일은 제목을 모르므로 알리지 않습니다.
+        _row("open", status="완료"),
+        _row("reopened", status="진행 중"),
+        _row("seen-only", status="요청"),
+    ]
+    kinds, changed = _kinds(rows, cog.feature_rows)
+    assert changed
+    assert sorted(kinds) == sorted([(COMPLETED, "open"), (STATUS_CHANGED, "reopened")])
+
+    # 옮긴 뒤에는 모든 필드 해시를 알게 되어 이후 변경은 정상적으로 감지합니다.
+    assert _kinds([_row("done", status="완료", title="또 바뀐 제목")], cog.feature_rows)[0] == [(RENAMED, "done")]
+
+
+def test_fingerprints_round_trip_through_state_file(tmp_path):
+    cog = _cog_with_file(tmp_path, {})
+    diff_rows([_row("a"), _row("b", status="완료")], cog.feature_rows)
+    cog.last_board_row_ids = {"board-1"}
+    cog.save_state()
+
+    reloaded = NotionWatcherCog(FakeBot())
+    reloaded.db_file = cog.db_file
+    reloaded.load_state()
+    assert reloaded.last_board_row_ids == {"board-1"}
+    assert {k: v.to_list() for k, v in reloaded.feature_rows.items()} == {
+        k: v.to_list() for k, v in cog.feature_rows.items()
+    }
+    assert _kinds([_row("a"), _row("b", status="완료")], reloaded.feature_rows) == ([], False)
+
+
+def test_prune_drops_least_recently_seen_rows():
+    assert MAX_FEATURE_FINGERPRINTS == 500
+    fingerprints = {}
+    diff_rows([_row(f"r{i}") for i in range(MAX_FEATURE_FINGERPRINTS)], fingerprints)
+    assert not prune_fingerprints(fingerprints, MAX_FEATURE_FINGERPRINTS)
+
+    # 가장 오래된 r0 을 다시 보면 최근 것으로 옮겨져 지워지지 않습니다.
+    diff_rows([_row("r0")] + [_row(f"new{i}") for i in range(10)], fingerprints)
+    assert prune_fingerprints(fingerprints, MAX_FEATURE_FINGERPRINTS)
+
+    assert len(fingerprints) == MAX_FEATURE_FINGERPRINTS
+    assert "r0" in fingerprints
+    assert not any(f"r{i}" in fingerprints for i in range(1, 11))
+    assert "r11" in fingerprints and "new9" in fingerprints
@@ -0,0 +1,120 @@
+# tests/test_schedule_praise.py
+import asyncio
+import datetime as dt
+
+from benchmarks.fake_notion import FakeNotionServer
+from benchmarks.fakes import FakeBot, FakeMember
+from cogs import schedule_praise
+from cogs.schedule_praise import SchedulePraiseCog
+from schedule_index import ScheduleIndex, SchedulePage
+from state_store import StateStore
+from time_utils import KST
+
+T0 = 1_736_000_000
+HOUR = 60 * 60
+
+
+class _VoiceCog:
+    def __init__(self, store: StateStore):
+        self.store = store
+
+
+def _cog(tmp_path):
+    bot = FakeBot()
+    store = StateStore(str(tmp_path / "voice_time.json"))
+    bot._cogs["VoiceTimeCog"] = _VoiceCog(store)
+    cog = SchedulePraiseCog(bot)
+    cog.loaded = True
+    return cog, store
+
+
+def test_failed_praise_is_retried_on_next_credit(tmp_path):
+    cog, store = _cog(tmp_path)
+    cog.index.rebuild([SchedulePage("page-a", "알고리즘", ("임아리",), T0, T0 + 2 * HOUR, HOUR)])
+    member = FakeMember(10, "ari", "임아리")
+    sent = []
+
+    async def send_praise(member, title, goal_seconds, done_seconds):
+        if not sent:
+            sent.append(None)
+            raise RuntimeError("discord 전송 실패")
+        sent.append((title, done_seconds))
+
+    cog._send_praise = send_praise
+
+    asyncio.run(cog._credit(member, "임아리", T0, T0 + HOUR))
+    assert store.schedule_progress == {"page-a": HOUR}
+    assert store.praised_pages == set()
+
+    asyncio.run(cog._credit(member, "임아리", T0 + HOUR, T0 + HOUR + 60))
+    assert sent[1:] == [("알고리즘", HOUR + 60)]
+    assert store.praised_pages == {"page-a"}
+
+    asyncio.run(cog._credit(member, "임아리", T0 + HOUR + 60, T0 + HOUR + 120))
+    assert len(sent) == 2
+
+
+def _page(page_id: str, start: int, end: int, tags=("임아리",)) -> SchedulePage:
+    return SchedulePage(page_id, page_id, tags, start, end, end - start)
+
+
+def test_overlapping_returns_overlap_seconds_per_page():
+    index = ScheduleIndex()
+    index.rebuild(
+        [
+            _page("long", T0, T0 + 10 * HOUR),  # 가장 긴 일정: max_span 범위 확인
+            _page("morning", T0 + HOUR, T0 + 2 * HOUR),
+            _page("later", T0 + 5 * HOUR, T0 + 6 * HOUR),
+            _page("other", T0, T0 + 10 * HOUR, tags=("김성아",)),
+        ]
+    )
+
+    found = {page.page_id: seconds for page, seconds in index.overlapping("임아리", T0 + 90 * 60, T0 + 3 * HOUR)}
+    assert found == {"long": 90 * 60, "morning": 30 * 60}
+
+    # 앞서 시작한 긴 일정은 구간 시작보다 한참 전에 시작했어도 찾습니다.
+    found = {page.page_id for page, _ in index.overlapping("임아리", T0 + 9 * HOUR, T0 + 11 * HOUR)}
+    assert found == {"long"}
+
+    # 경계가 맞닿기만 하면 겹치지 않습니다.
+    assert [p.page_id for p, _ in index.overlapping("임아리", T0 + 6 * HOUR, T0 + 6 * HOUR + 60)] == ["long"]
+    assert index.overlapping("임아리", T0 + 10 * HOUR, T0 + 11 * HOUR) == []
+    assert index.overlapping("없는사람", T0, T0 + HOUR) == []
+    assert index.overlapping("임아리", T0 + HOUR, T0 + HOUR) == []
+
+
+def test_refresh_keeps_running_multi_week_schedules_and_prunes_ended(tmp_path, monkeypatch):
+    now = dt.datetime(2025, 3, 1, 12, 0, tzinfo=KST)
+    server = FakeNotionServer()
+    db_id = "schedule-db"
+
+    def day(month, day_of_month):
+        return dt.datetime(2025, month, day_of_month, 9, 0, tzinfo=KST)
+
+    running = server.add_schedule_row(db_id, "임아리", day(1, 20), day(3, 10))  # 40일 전에 시작, 진행 중
+    recent = server.add_schedule_row(db_id, "임아리", day(2, 25), day(2, 26))
+    ended = server.add_schedule_row(db_id, "임아리", day(1, 1), day(1, 2))  # 끝난 지 14일 초과
+    ended_recently = server.add_schedule_row(db_id, "임아리", day(1, 10), day(2, 20))  # 끝난 지 14일 이내
+
+    cog, store = _cog(tmp_path)
+    cog.loaded = False
+    for page in (running, ended, ended_recently):
+        store.credit_schedule(page["id"], HOUR)
+    store.mark_praised(ended["id"])
+
+    async def scenario():
+        base_url = await server.start()
+        monkeypatch.setattr(schedule_praise, "NOTION_API_BASE_URL", base_url)
+        monkeypatch.setattr(schedule_praise, "NOTION_DATABASE_SCHEDULE_ID", db_id)
+        monkeypatch.setattr(schedule_praise, "now_kst", lambda: now)
+        try:
+            await cog.schedule_refresher.coro(cog)
+        finally:
+            await server.stop()
+
+    asyncio.run(scenario())
+
+    assert cog.loaded
+    assert set(cog.index.pages) == {running["id"], recent["id"], ended_recently["id"]}
+    assert store.schedule_progress == {running["id"]: HOUR, ended_recently["id"]: HOUR}
+    assert store.praised_pages == set()
@@ -0,0 +1,183 @@
+# tests/test_scheduler.py
+import asyncio
+import datetime as dt
+import json
+
+import scheduler
+from scheduler import CronSpec, JobScheduler
+from time_utils import KST, to_epoch
+
+UTC = dt.timezone.utc
+WEEKLY = "0 23 * * 0"  # 매주 일요일 23:00 (KST), 주간 리포트와 같은 식
+
+
+def kst(*args) -> dt.datetime:
+    return dt.datetime(*args, tzinfo=KST)
+
+
+def utc(*args) -> dt.datetime:
+    return dt.datetime(*args, tzinfo=UTC)
+
+
+# ----------------------------------------------------------------------
+# CronSpec
+# ----------------------------------------------------------------------
+def test_daily_slot_uses_kst_date_not_utc_date():
+    spec = CronSpec("0 12 * * *")
+    # UTC로는 1/5 16:00 이지만 KST로는 이미 1/6 01:00 입니다.
+    moment = utc(2025, 1, 5, 16, 0)
+    assert spec.next_after(moment) == kst(2025, 1, 6, 12, 0)
+    assert spec.prev_at_or_before(moment) == kst(2025, 1, 5, 12, 0)
+
+
+def test_late_night_slot_rolls_over_to_next_kst_day():
+    spec = CronSpec("30 23 * * *")
+    moment = kst(2025, 1, 5, 23, 45)
+    assert spec.next_after(moment) == kst(2025, 1, 6, 23, 30)
+    assert spec.prev_at_or_before(moment) == kst(2025, 1, 5, 23, 30)
+
+
+def test_exact_slot_is_prev_but_not_next():
+    spec = CronSpec(WEEKLY)
+    slot = kst(2025, 1, 5, 23, 0)
+    assert spec.prev_at_or_before(slot) == slot
+    assert spec.next_after(slot) == kst(2025, 1, 12, 23, 0)
+
+
+def test_weekly_slot_across_week_boundary():
+    spec = CronSpec(WEEKLY)
+    # 일요일 22:59:59 KST (UTC 13:59:59): 이번 주 슬롯은 아직 오지 않았습니다.
+    before = utc(2025, 1, 5, 13, 59, 59)
+    assert spec.next_after(before) == kst(2025, 1, 5, 23, 0)
+    assert spec.prev_at_or_before(before) == kst(2024, 12, 29, 23, 0)
+
+    # 월요일 00:00 KST 는 UTC로 아직 일요일 15:00 입니다.
+    monday = utc(2025, 1, 5, 15, 0)
+    assert monday.astimezone(KST).weekday() == 0
+    assert spec.next_after(monday) == kst(2025, 1, 12, 23, 0)
+    assert spec.prev_at_or_before(monday) == kst(2025, 1, 5, 23, 0)
+
+
+def test_weekday_seven_is_sunday():
+    assert CronSpec("0 23 * * 7").weekdays == CronSpec(WEEKLY).weekdays == {0}
+
+
+# ----------------------------------------------------------------------
+# JobScheduler 따라잡기
+# ----------------------------------------------------------------------
+def _scheduler(tmp_path, ledger=None) -> JobScheduler:
+    path = tmp_path / "scheduler.json"
+    if ledger is not None:
+        path.write_text(json.dumps(ledger), encoding="utf-8")
+    return JobScheduler(str(path))
+
+
+def _register(sched: JobScheduler, calls: list, catch_up=dt.timedelta(days=3)):
+    async def callback():
+        calls.append(1)
+
+    sched.register("weekly", WEEKLY, callback, catch_up=catch_up)
+    return sched.jobs["weekly"]
+
+
+def test_first_registration_does_not_catch_up(tmp_path):
+    sched = _scheduler(tmp_path)
+    job = _register(sched, [])
+    now = kst(2025, 1, 7, 10, 0)
+
+    sched._prepare(job, now)
+
+    assert sched.ledger["weekly"] == to_epoch(kst(2025, 1, 5, 23, 0))
+    assert job.next_run_at == kst(2025, 1, 12, 23, 0)
+
+
+def test_missed_slot_within_catch_up_runs_once(tmp_path):
+    missed = kst(2025, 1, 5, 23, 0)
+    sched = _scheduler(tmp_path, {"weekly": to_epoch(kst(2024, 12, 29, 23, 0))})
+    calls = []
+    job = _register(sched, calls)
+    now = kst(2025, 1, 7, 10, 0)  # 일요일 슬롯 이후 1일 11시간 동안 꺼져 있었음
+
+    sched._prepare(job, now)
+    assert job.next_slot == missed
+    assert job.next_run_at == now
+
+    asyncio.run(sched._run_job(job, now))
+    assert calls == [1]
+    assert sched.ledger["weekly"] == to_epoch(missed)
+    assert job.next_run_at == kst(2025, 1, 12, 23, 0)
+
+    # 재시작해도 같은 슬롯을 다시 따라잡지 않습니다.
+    restarted = _scheduler(tmp_path)
+    again = _register(restarted, calls)
+    restarted._prepare(again, now)
+    assert again.next_run_at == kst(2025, 1, 12, 23, 0)
+
+
+def test_missed_slot_beyond_catch_up_is_skipped(tmp_path):
+    sched = _scheduler(tmp_path, {"weekly": to_epoch(kst(2024, 12, 29, 23, 0))})
+    calls = []
+    job = _register(sched, calls)
+    now = kst(2025, 1, 9, 10, 0)  # 3일 11시간 경과
+
+    sched._prepare(job, now)
+
+    assert calls == []
+    assert sched.ledger["weekly"] == to_epoch(kst(2025, 1, 5, 23, 0))
+    assert job.next_run_at == kst(2025, 1, 12, 23, 0)
+    assert json.loads((tmp_path / "scheduler.json").read_text(encoding="utf-8")) == sched.ledger
+
+
+def test_run_loop_catches_up_after_downtime(tmp_path, monkeypatch):
+    now = kst(2025, 1, 6, 9, 0)
+    monkeypatch.setattr(scheduler, "now_kst", lambda: now)
+    sched = _scheduler(tmp_path, {"weekly": to_epoch(kst(2024, 12, 29, 23, 0))})
+
+    async def scenario():
+        ran = asyncio.Event()
+
+        async def callback():
+            ran.set()
+
+        sched.register("weekly", WEEKLY, callback, catch_up=dt.timedelta(days=3))
+        sched.start()
+        try:
+            await asyncio.wait_for(ran.wait(), timeout=1)
+        finally:
+            sched.stop()
+
+    asyncio.run(scenario())
+    assert sched.ledger["weekly"] == to_epoch(kst(2025, 1, 5, 23, 0))
+    assert sched.jobs["weekly"].next_run_at == kst(2025, 1, 12, 23, 0)
+
+
+def test_cancelled_run_is_caught_up_on_next_start(tmp_path, monkeypatch):
+    missed = kst(2025, 1, 5, 23, 0)
+    before = to_epoch(kst(2024, 12, 29, 23, 0))
+    now = kst(2025, 1, 6, 9, 0)
+    monkeypatch.setattr(scheduler, "now_kst", lambda: now)
+    sched = _scheduler(tmp_path, {"weekly": before})
+
+    async def scenario():
+        started = asyncio.Event()
+
+        async def callback():
+            started.set()
+            await asyncio.Event().wait()  # 종료 신호가 올 때까지 끝나지 않는 작업
+
+        sched.register("weekly", WEEKLY, callback, catch_up=dt.timedelta(days=3))
+        sched.start()
+        task = sched._task
+        await asyncio.wait_for(started.wait(), timeout=1)
+        sched.stop()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert sched.ledger["weekly"] == before
+    assert json.loads((tmp_path / "scheduler.json").read_text(encoding="utf-8")) == {"weekly": before}
+
+    restarted = _scheduler(tmp_path)
+    job = _register(restarted, [])
+    restarted._prepare(job, now)
+    assert job.next_slot == missed
+    assert job.next_run_at == now
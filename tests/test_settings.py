@@ -0,0 +1,136 @@
+# tests/test_settings.py
+import asyncio
+import json
+import os
+
+import pytest
+
+import config
+from benchmarks.fakes import FakeBot
+from cogs.config_watcher import ConfigCog
+from settings import FIELDS, SettingsService, build_settings
+
+
+def test_defaults_come_from_env():
+    settings = build_settings({})
+    assert settings.report_channel_id_enter == config.REPORT_CHANNEL_ID_ENTER
+    assert settings.session_grace_seconds == config.SESSION_GRACE_SECONDS
+    assert all(source == "env/default" for source in settings.sources.values())
+
+
+def test_values_are_coerced():
+    settings = build_settings(
+        {
+            "session_grace_seconds": " 300 ",
+            "report_channel_id_alarm": "123",
+            "notion_feature_notify_events": "completed, renamed,completed",
+            "discord_to_notion_name": {" 이유 ": " 임아리 "},
+        }
+    )
+    assert settings.session_grace_seconds == 300
+    assert settings.report_channel_id_alarm == 123
+    assert settings.notion_feature_notify_events == ("completed", "renamed")
+    assert settings.discord_to_notion_name == {"이유": "임아리"}
+    assert settings.sources["session_grace_seconds"] == "file"
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {"session_grace_seconds": -1},
+        {"session_grace_seconds": True},
+        {"session_grace_seconds": "1.5"},
+        {"report_channel_id_enter": 0},
+        {"inactive_study_days": 0},
+        {"notion_feature_notify_events": ["created", "deleted"]},
+        {"discord_to_notion_name": ["임아리"]},
+        {"no_such_key": 1},
+    ],
+)
+def test_bad_values_are_rejected(overrides):
+    with pytest.raises(ValueError) as e:
+        build_settings(overrides)
+    assert next(iter(overrides)) in str(e.value)
+
+
+def test_all_errors_are_reported_together():
+    with pytest.raises(ValueError) as e:
+        build_settings({"session_grace_seconds": -1, "inactive_study_days": 0})
+    assert "session_grace_seconds" in str(e.value) and "inactive_study_days" in str(e.value)
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _touch_later(path):
+    # 같은 크기로 다시 쓰면 mtime 만으로 바뀐 것을 알아채야 합니다.
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_reload_when_mtime_changes(tmp_path):
+    path = tmp_path / "settings.json"
+    _write(path, {"session_grace_seconds": 100})
+    service = SettingsService(str(path))
+    assert service.current.session_grace_seconds == 100
+    assert service.reload_if_changed() == []
+
+    _write(path, {"session_grace_seconds": 200})
+    _touch_later(path)
+    assert service.reload_if_changed() == ["session_grace_seconds"]
+    assert service.current.session_grace_seconds == 200
+    assert service.reload_if_changed() == []
+
+
+def test_bad_file_keeps_previous_settings(tmp_path):
+    path = tmp_path / "settings.json"
+    _write(path, {"session_grace_seconds": 100})
+    service = SettingsService(str(path))
+    previous = service.current
+
+    _write(path, {"session_grace_seconds": -100})
+    _touch_later(path)
+    assert service.reload_if_changed() == []
+    assert service.current is previous
+    assert "session_grace_seconds" in service.last_error
+
+    path.write_text("{not json", encoding="utf-8")
+    _touch_later(path)
+    assert service.reload_if_changed() == []
+    assert service.current is previous
+
+    _write(path, {"session_grace_seconds": 150})
+    _touch_later(path)
+    assert service.reload_if_changed() == ["session_grace_seconds"]
+    assert service.last_error is None
+
+
+def test_removed_file_falls_back_to_defaults(tmp_path):
+    path = tmp_path / "settings.json"
+    _write(path, {"inactive_study_days": 7})
+    service = SettingsService(str(path))
+    path.unlink()
+    assert service.reload_if_changed() == ["inactive_study_days"]
+    assert service.current.inactive_study_days == FIELDS["inactive_study_days"][1]
+
+
+def test_config_cog_dispatches_config_update_only_on_change(tmp_path):
+    path = tmp_path / "settings.json"
+    _write(path, {"session_grace_seconds": 100})
+    bot = FakeBot()
+    bot.settings = SettingsService(str(path))
+    cog = ConfigCog(bot)
+
+    assert asyncio.run(cog._apply()) == []
+    assert bot.dispatched["config_update"] == 0
+
+    _write(path, {"session_grace_seconds": 200, "inactive_study_days": 5})
+    _touch_later(path)
+    assert asyncio.run(cog._apply()) == ["session_grace_seconds", "inactive_study_days"]
+    assert bot.dispatched["config_update"] == 1
+
+    _write(path, {"session_grace_seconds": "bad"})
+    _touch_later(path)
+    assert asyncio.run(cog._apply()) == []
+    assert bot.dispatched["config_update"] == 1
@@ -0,0 +1,130 @@
+# tests/test_state_store.py
+import json
+
+import pytest
+
+from state_store import (
+    SNAPSHOT_MAGIC,
+    SNAPSHOT_VERSION,
+    StateStore,
+    _HEADER,
+)
+from time_utils import from_epoch
+
+T0 = 1_736_000_000
+
+
+def _populated(path) -> StateStore:
+    store = StateStore(str(path))
+    store.study_tracking_started_at = T0
+    store.checkpoint_at = T0 + 500
+    store.start_session(1, at=T0)
+    store.add_session_time(1, until=T0 + 60)
+    store.start_session(2, at=T0 + 10)
+    store.end_session(2, until=T0 + 70)
+    store.mark_studied(3, T0 + 20)
+    store.credit_schedule("페이지-a", 1800)
+    store.mark_praised("페이지-a")
+    store.enqueue_notion_record(2, "임아리", T0 + 10, T0 + 70)
+    return store
+
+
+def _snapshot(store: StateStore):
+    members = {
+        uid: (
+            rec.total_seconds,
+            rec.session_start,
+            rec.last_study_at,
+            rec.session_origin,
+            rec.session_seconds,
+            rec.pending_leave_at,
+        )
+        for uid, rec in store.members.items()
+    }
+    outbox = [(r.user_id, r.notion_name, r.start_at, r.end_at) for r in store.notion_outbox]
+    return (
+        members,
+        store.study_tracking_started_at,
+        store.checkpoint_at,
+        store.schedule_progress,
+        store.praised_pages,
+        outbox,
+    )
+
+
+def test_snapshot_round_trip(tmp_path):
+    store = _populated(tmp_path / "voice_time.json")
+    store.save()
+
+    loaded = StateStore(str(tmp_path / "voice_time.json"))
+    loaded.load()
+
+    assert (tmp_path / "voice_time.bin").exists()
+    assert _snapshot(loaded) == _snapshot(store)
+    assert loaded.pending_leave_at(2) == T0 + 70
+    assert loaded.members[2].session_origin == T0 + 10
+
+
+def test_empty_store_round_trip(tmp_path):
+    store = StateStore(str(tmp_path / "voice_time.json"))
+    loaded = StateStore(store.data_file)
+    loaded._decode(store._encode())
+    assert _snapshot(loaded) == ({}, None, None, {}, set(), [])
+
+
+def test_decode_rejects_bad_magic_and_other_versions(tmp_path):
+    store = StateStore(str(tmp_path / "voice_time.json"))
+    with pytest.raises(ValueError):
+        store._decode(_HEADER.pack(b"NOPE", SNAPSHOT_VERSION, 0))
+    for version in (0, SNAPSHOT_VERSION + 1):
+        with pytest.raises(ValueError):
+            store._decode(_HEADER.pack(SNAPSHOT_MAGIC, version, 0))
+
+
+def test_legacy_json_import_then_binary_save(tmp_path):
+    data_file = tmp_path / "voice_time.json"
+    legacy = {
+        "totals": {"1": 300, "2": 45},
+        "sessions": {"1": from_epoch(T0).isoformat()},
+        "last_study_at": {"2": from_epoch(T0 + 20).isoformat()},
+        "study_tracking_started_at": from_epoch(T0 - 100).isoformat(),
+        "schedule_progress": {"페이지-a": 600},
+        "praised_pages": ["페이지-b"],
+        "checkpoint_at": from_epoch(T0 + 500).isoformat(),
+        "notion_outbox": [
+            {
+                "user_id": "2",
+                "notion_name": "김성아",
+                "start_at": from_epoch(T0).isoformat(),
+                "end_at": from_epoch(T0 + 60).isoformat(),
+            }
+        ],
+    }
+    data_file.write_text(json.dumps(legacy, ensure_ascii=False), encoding="utf-8")
+
+    store = StateStore(str(data_file))
+    store.load()
+
+    assert store.members[1].total_seconds == 300
+    assert store.session_start(1) == T0
+    assert store.members[1].session_origin == T0
+    assert store.last_study_at(2) == T0 + 20
+    assert store.study_tracking_started_at == T0 - 100
+    assert store.schedule_progress == {"페이지-a": 600}
+    assert store.praised_pages == {"페이지-b"}
+    assert store.checkpoint_at == T0 + 500
+    assert [(r.user_id, r.notion_name, r.start_at, r.end_at) for r in store.notion_outbox] == [(2, "김성아", T0, T0 + 60)]
+
+    # 다음 저장부터는 바이너리 스냅샷을 쓰고, 다시 읽을 때 JSON 보다 우선합니다.
+    store.save()
+    data_file.write_text("{}", encoding="utf-8")
+    reloaded = StateStore(str(data_file))
+    reloaded.load()
+    assert _snapshot(reloaded) == _snapshot(store)
+
+
+def test_export_dict_round_trips_through_import(tmp_path):
+    store = _populated(tmp_path / "voice_time.json")
+    copy = StateStore(store.data_file)
+    copy.import_dict(json.loads(json.dumps(store.export_dict())))
+    assert _snapshot(copy) == _snapshot(store)
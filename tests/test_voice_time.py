@@ -0,0 +1,312 @@
+# tests/test_voice_time.py
+import asyncio
+import datetime as dt
+
+import pytest
+
+from benchmarks.fakes import FakeBot, FakeChannel, FakeGuild, FakeMember, FakeVoiceState
+from benchmarks.harness import VirtualClock
+from cogs import voice_time
+from settings import build_settings
+from state_store import StateStore
+from time_utils import KST, to_epoch
+
+GRACE_SECONDS = 120
+DEBOUNCE = voice_time.VOICE_EVENT_DEBOUNCE_SECONDS
+T0 = dt.datetime(2025, 1, 6, 9, 0, tzinfo=KST)
+
+
+class VoiceHarness:
+    """가짜 봇/서버/채널 위에 올린 VoiceTimeCog. Notion 기록은 (시작, 끝) 목록으로 모읍니다."""
+
+    def __init__(self, tmp_path, clock: VirtualClock):
+        self.clock = clock
+        self.bot = FakeBot()
+        self.set_settings(session_grace_seconds=GRACE_SECONDS)
+        self.guild = FakeGuild(1, "study")
+        self.channel = self.guild.add_channel(FakeChannel(voice_time.VOICE_CHANNEL_ID, "공부방"))
+        self.report = self.bot.add_channel(FakeChannel(self.bot.settings.current.report_channel_id_enter, "알림"))
+        self.bot.add_guild(self.guild)
+        self.member = self.guild.add_member(FakeMember(10, "ari", "임아리"))
+
+        self.cog = voice_time.VoiceTimeCog(self.bot)
+        self.cog.store = StateStore(str(tmp_path / "voice_time.json"))
+        self.records: list = []
+        self.cog._create_notion_voice_record = self._record
+
+    async def _record(self, record):
+        self.records.append((record.start_at, record.end_at))
+        return True
+
+    def set_settings(self, **overrides):
+        values = {"minimum_notion_record_seconds": 60, "session_grace_seconds": GRACE_SECONDS}
+        values.update(overrides)
+        self.bot.settings.current = build_settings(values)
+
+    def state(self, inside: bool) -> FakeVoiceState:
+        return FakeVoiceState(self.channel if inside else None)
+
+    async def update(self, before: FakeVoiceState, after: FakeVoiceState, member=None):
+        member = member or self.member
+        # 실제 채널 멤버 목록도 함께 맞춥니다 (입장 알림과 퇴장 처리에서 읽습니다).
+        if after.channel is self.channel and member not in self.channel.members:
+            self.channel.members.append(member)
+        if after.channel is not self.channel and member in self.channel.members:
+            self.channel.members.remove(member)
+        await self.cog.on_voice_state_update(member, before, after)
+        await self.clock.advance(0)  # 멤버별 작업이 debounce 대기를 시작하게 합니다.
+
+    async def move(self, inside: bool, then_wait: float):
+        """입장(inside=True)/퇴장 이벤트 하나를 보내고 debounce 뒤 then_wait 초를 흘려보냅니다."""
+        await self.update(self.state(not inside), self.state(inside))
+        await self.clock.advance(DEBOUNCE)
+        await self.clock.advance(then_wait)
+
+    async def settle(self):
+        await asyncio.gather(*self.cog._deliveries)
+
+
+@pytest.fixture
+def voice(tmp_path, monkeypatch):
+    clock = VirtualClock(T0)
+    monkeypatch.setattr(voice_time, "now_kst", clock.now)
+    monkeypatch.setattr(voice_time, "asyncio", clock)
+    return VoiceHarness(tmp_path, clock)
+
+
+def _ts(seconds_after_t0: float) -> int:
+    return to_epoch(T0) + int(seconds_after_t0)
+
+
+# ----------------------------------------------------------------------
+# 유예 시간 안의 재입장 묶기
+# ----------------------------------------------------------------------
+def _study_twice(voice: VoiceHarness, rejoin_after: int):
+    """40분 공부 → 퇴장 → rejoin_after 초 뒤 재입장 → 20분 공부 → 퇴장."""
+
+    async def scenario():
+        await voice.move(True, 40 * 60)
+        await voice.move(False, rejoin_after)
+        await voice.move(True, 20 * 60)
+        await voice.move(False, GRACE_SECONDS * 2)
+        await voice.settle()
+        assert not voice.cog._finalizers
+
+    asyncio.run(scenario())
+    return voice.records
+
+
+def test_rejoin_inside_grace_window_writes_one_record(voice):
+    records = _study_twice(voice, rejoin_after=GRACE_SECONDS // 2)
+
+    second_leave = DEBOUNCE + 40 * 60 + DEBOUNCE + GRACE_SECONDS // 2 + DEBOUNCE + 20 * 60
+    assert records == [(_ts(0), _ts(second_leave))]
+
+
+def test_rejoin_outside_grace_window_writes_two_records(voice):
+    rejoin_after = GRACE_SECONDS * 2
+    records = _study_twice(voice, rejoin_after=rejoin_after)
+
+    first_leave = DEBOUNCE + 40 * 60
+    rejoin = first_leave + DEBOUNCE + rejoin_after
+    assert records == [
+        (_ts(0), _ts(first_leave)),
+        (_ts(rejoin), _ts(rejoin + DEBOUNCE + 20 * 60)),
+    ]
+
+
+def test_shorter_grace_applies_to_waiting_finalizers(voice):
+    async def scenario():
+        await voice.move(True, 40 * 60)
+        await voice.move(False, 10)
+        assert voice.records == [] and voice.cog._finalizers
+
+        # 퇴장 12초 뒤 유예 시간을 5초로 줄이면 이미 지났으므로 바로 확정합니다.
+        voice.set_settings(session_grace_seconds=5)
+        await voice.cog.on_config_update(["session_grace_seconds"])
+        await voice.clock.advance(0)
+        await voice.settle()
+
+    asyncio.run(scenario())
+    assert voice.records == [(_ts(0), _ts(DEBOUNCE + 40 * 60))]
+    assert not voice.cog._finalizers
+
+
+def test_longer_grace_applies_to_waiting_finalizers(voice):
+    async def scenario():
+        await voice.move(True, 40 * 60)
+        await voice.move(False, 10)
+        voice.set_settings(session_grace_seconds=GRACE_SECONDS * 5)
+        await voice.cog.on_config_update(["session_grace_seconds"])
+        # 예전 유예 시간(120초)은 지났지만 새 유예 시간(600초) 안에 돌아왔으므로 한 세션입니다.
+        await voice.clock.advance(GRACE_SECONDS * 2)
+        await voice.move(True, 10 * 60)
+        await voice.move(False, GRACE_SECONDS * 6)
+        await voice.settle()
+
+    asyncio.run(scenario())
+    assert len(voice.records) == 1
+    assert voice.records[0][0] == _ts(0)
+
+
+# ----------------------------------------------------------------------
+# 재시작 후 세션 보정과 outbox 재전송
+# ----------------------------------------------------------------------
+def test_reconcile_sessions_branches(voice):
+    now = to_epoch(T0)
+    store = voice.cog.store
+    members = {uid: voice.guild.add_member(FakeMember(uid, f"m{uid}")) for uid in (11, 12, 13, 14)}
+    voice.channel.members.extend([members[12], members[13]])
+
+    store.start_session(11, at=now - 3600)  # 열린 세션, 채널에 없음 → 체크포인트 시각에 퇴장
+    store.start_session(12, at=now - 1800)  # 열린 세션, 채널에 있음 → 유지
+    # 13: 세션 없이 채널에 있음 → 지금 입장
+    store.start_session(14, at=now - 4000)  # 유예가 이미 끝난 세션 → 바로 확정
+    store.end_session(14, until=now - 1000)
+    store.checkpoint_at = now - 60
+
+    async def scenario():
+        voice.cog.reconcile_sessions()
+        await voice.clock.advance(0)
+        await voice.settle()
+        assert voice.records == [(now - 4000, now - 1000)]
+
+        # 11 은 체크포인트 시각에 나간 것으로 보고 유예가 끝나면 확정합니다.
+        assert store.pending_leave_at(11) == now - 60
+        assert 11 in voice.cog._finalizers
+        await voice.clock.advance(GRACE_SECONDS)
+        await voice.settle()
+
+    asyncio.run(scenario())
+    assert voice.records == [(now - 4000, now - 1000), (now - 3600, now - 60)]
+    assert store.session_start(12) == now - 1800
+    assert store.session_start(13) == now
+    assert store.members[13].session_origin == now
+    assert store.session_start(11) is None and store.session_start(14) is None
+    assert store.checkpoint_at == now
+    assert voice.cog.channel_active
+    assert voice.bot.dispatched["voice_session_closed"] == 1
+
+
+def test_reconcile_continues_grace_session_for_member_back_in_channel(voice):
+    now = to_epoch(T0)
+    store = voice.cog.store
+    store.start_session(voice.member.id, at=now - 600)
+    store.end_session(voice.member.id, until=now - 30)
+    voice.channel.members.append(voice.member)
+
+    async def scenario():
+        voice.cog.reconcile_sessions()
+        await voice.clock.advance(GRACE_SECONDS * 2)
+        await voice.settle()
+
+    asyncio.run(scenario())
+    assert voice.records == []
+    assert store.session_start(voice.member.id) == now
+    assert store.members[voice.member.id].session_origin == now - 600
+
+
+def test_checkpoint_job_retries_failed_outbox_records(voice):
+    store = voice.cog.store
+    record = store.enqueue_notion_record(voice.member.id, "임아리", to_epoch(T0) - 3600, to_epoch(T0))
+    attempts = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def flaky(record):
+            attempts.append(record)
+            await release.wait()
+            return len(attempts) > 1
+
+        voice.cog._create_notion_voice_record = flaky
+        voice.cog.retry_outbox()
+        voice.cog.retry_outbox()  # 전송 중인 기록은 다시 보내지 않습니다.
+        await voice.clock.advance(0)
+        release.set()
+        await voice.settle()
+        assert len(attempts) == 1
+        assert store.notion_outbox == [record]
+
+        await voice.cog.checkpoint_job()
+        await voice.settle()
+
+    asyncio.run(scenario())
+    assert len(attempts) == 2
+    assert store.notion_outbox == []
+    assert store.checkpoint_at == to_epoch(T0)
+
+
+# ----------------------------------------------------------------------
+# 멤버별 debounce
+# ----------------------------------------------------------------------
+def _count_handlers(voice):
+    calls = []
+    for name in ("_handle_join", "_handle_leave"):
+        original = getattr(voice.cog, name)
+
+        def spy(*args, _original=original, _name=name):
+            calls.append(_name)
+            return _original(*args)
+
+        setattr(voice.cog, name, spy)
+    return calls
+
+
+def test_flapping_within_debounce_collapses_to_one_transition(voice):
+    calls = _count_handlers(voice)
+    outside, inside = voice.state(False), voice.state(True)
+
+    async def scenario():
+        await voice.update(outside, inside)
+        await voice.clock.advance(0.5)
+        await voice.update(inside, outside)
+        await voice.clock.advance(0.5)
+        await voice.update(outside, inside)
+        await voice.clock.advance(DEBOUNCE)
+        assert calls == ["_handle_join"]
+        assert voice.cog.store.session_start(voice.member.id) == to_epoch(T0)  # 첫 이벤트 시각
+
+        # 나갔다 바로 들어오면 처음과 마지막 상태가 같아 아무것도 하지 않습니다.
+        await voice.update(inside, outside)
+        await voice.clock.advance(0.5)
+        await voice.update(outside, inside)
+        await voice.clock.advance(DEBOUNCE)
+        await voice.cog.drain()
+
+    asyncio.run(scenario())
+    assert calls == ["_handle_join"]
+    assert voice.cog.store.pending_leave_at(voice.member.id) is None
+    assert voice.bot.dispatched["voice_session_closed"] == 0
+
+
+def test_mute_only_updates_are_ignored(voice):
+    calls = _count_handlers(voice)
+
+    async def scenario():
+        await voice.update(FakeVoiceState(voice.channel, self_mute=False), FakeVoiceState(voice.channel, self_mute=True))
+        await voice.update(FakeVoiceState(None), FakeVoiceState(None, self_mute=True))
+        assert not voice.cog._pending and not voice.cog._workers
+        await voice.clock.advance(DEBOUNCE)
+
+    asyncio.run(scenario())
+    assert calls == []
+    assert voice.cog.store.members == {}
+
+
+def test_drain_waits_for_enter_alert(voice):
+    voice.guild.add_member(FakeMember(20, "minji", "장민지"))
+
+    async def scenario():
+        await voice.update(voice.state(False), voice.state(True))
+        drained = asyncio.ensure_future(voice.cog.drain())
+        await voice.clock.advance(DEBOUNCE)
+        assert not drained.done()  # 입장 알림이 ENTER_ALERT_DELAY_SECONDS 뒤에 판단됩니다.
+        assert voice.report.sent_messages == 0
+
+        await voice.clock.advance(voice_time.ENTER_ALERT_DELAY_SECONDS)
+        await asyncio.wait_for(drained, timeout=1)
+
+    asyncio.run(scenario())
+    assert voice.report.sent_messages == 1
+    assert voice.cog.channel_active
@@ -1,5 +1,6 @@
 # time_utils.py
 import datetime as dt
+import time
 
 KST = dt.timezone(dt.timedelta(hours=9))
 
@@ -11,3 +12,15 @@ def iso(dtobj: dt.datetime) -> str:
 
 def parse_iso(s: str) -> dt.datetime:
     return dt.datetime.fromisoformat(s)
+
+def now_epoch() -> int:
+    return int(time.time())
+
+def to_epoch(dtobj: dt.datetime) -> int:
+    # tzinfo가 없는 값은 예전 기록과 마찬가지로 KST로 간주합니다.
+    if dtobj.tzinfo is None:
+        dtobj = dtobj.replace(tzinfo=KST)
+    return int(dtobj.timestamp())
+
+def from_epoch(seconds: int) -> dt.datetime:
+    return dt.datetime.fromtimestamp(seconds, tz=KST)